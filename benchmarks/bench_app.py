@@ -0,0 +1,277 @@
+"""대시보드 성능 벤치마크
+
+Streamlit AppTest로 stock_analysis.py를 실행하면서 재생(replay) 데이터 공급자에 합성 픽스처를 연결해
+네트워크 없이 앱 자체의 처리 시간을 측정합니다.
+
+측정 항목 (초, 반복 측정의 중앙값)
+- cold_start: 모든 캐시/저장소가 빈 상태의 첫 실행
+- tab.<메뉴>.switch / tab.<메뉴>.rerun: 메뉴 전환 직후 실행 / 같은 메뉴 재실행
+- portfolio.<포지션 수>.load / rerun / add / refresh: 포지션을 채운 첫 실행 / 재실행 / ➕ 추가 버튼 / 🔄 지금 갱신 버튼
+- chart.<기간>.first / rerun: 주가 차트 기간 변경 직후 / 재실행
+
+사용 예
+    python benchmarks/bench_app.py --output results.json
+    python benchmarks/bench_app.py --save-baseline           # 현재 결과를 기준값으로 저장
+    python benchmarks/bench_app.py --tolerance 0.2           # 기준값보다 20% 넘게 느린 항목이 있으면 종료 코드 1
+
+기준값은 실행 환경(CPU, 라이브러리 버전)마다 다르므로 비교할 머신에서 직접 생성합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BENCH_DIR, os.pardir, 'stock_analysis.py')
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, 'baseline.json')
+
+TAB_SLUGS = ['home', 'chart', 'dividends', 'company', 'statements', 'portfolio', 'screener']  # 메뉴 순서와 동일
+PORTFOLIO_SIZES = [10, 1_000, 10_000]
+CHART_PERIODS = {'1mo': '1개월', '10y': '10년'}
+DEFAULT_SYMBOLS = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'JPM', 'KO', 'PG']  # 앱 기본 종목/스크리너 목록
+UNIVERSE_SIZE = 50            # 포트폴리오에 사용할 합성 종목 수
+HISTORY_YEARS = 11            # 합성 일봉 기간 (10년 차트 + 배당 수익률 계산 여유)
+STATEMENT_TYPES = [
+    'income_stmt', 'quarterly_income_stmt', 'balance_sheet',
+    'quarterly_balance_sheet', 'cashflow', 'quarterly_cashflow',
+]
+
+
+# 합성 픽스처: ReplayProvider가 읽는 파일 구조 그대로 생성
+def universe():
+    return DEFAULT_SYMBOLS + [f'SYM{i:03d}' for i in range(UNIVERSE_SIZE - len(DEFAULT_SYMBOLS))]
+
+def write_fixtures(root, seed=0):
+    """종목별 일봉/메타데이터/배당/재무제표 픽스처 작성 (같은 seed면 같은 데이터)"""
+    rng = np.random.default_rng(seed)
+    today = pd.Timestamp.now().normalize()
+    index = pd.bdate_range(today - pd.DateOffset(years=HISTORY_YEARS), today, name='Date')
+    for name in ['history/1d', 'info', 'dividends']:
+        os.makedirs(os.path.join(root, name), exist_ok=True)
+
+    for symbol in universe():
+        close = 50 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, len(index))))
+        spread = close * rng.uniform(0.002, 0.02, len(index))
+        pd.DataFrame({
+            'Open': close + rng.uniform(-1, 1, len(index)) * spread,
+            'High': close + spread,
+            'Low': close - spread,
+            'Close': close,
+            'Volume': rng.integers(1e5, 1e7, len(index)).astype(float),
+            'Adj Close': close * 0.98,
+        }, index=index).to_pickle(os.path.join(root, 'history', '1d', f'{symbol}.pkl'))
+
+        with open(os.path.join(root, 'info', f'{symbol}.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'symbol': symbol, 'quoteType': 'EQUITY', 'longName': f'{symbol} Inc.', 'shortName': symbol,
+                'sector': ['Technology', 'Energy', 'Healthcare'][len(symbol) % 3],
+                'currentPrice': float(close[-1]), 'regularMarketPrice': float(close[-1]),
+                'marketCap': float(rng.uniform(1e9, 3e12)), 'trailingPE': float(rng.uniform(5, 60)),
+                'dividendYield': float(rng.uniform(0, 5)), 'returnOnEquity': float(rng.uniform(-0.1, 0.5)),
+                'fiftyTwoWeekHigh': float(close[-252:].max()), 'fiftyTwoWeekLow': float(close[-252:].min()),
+                'mostRecentQuarter': 1719705600, 'lastFiscalYearEnd': 1727654400,
+                'longBusinessSummary': f'{symbol} 벤치마크용 합성 종목',
+            }, f)
+
+        dividend_dates = pd.date_range(index[0], today, freq='QS-FEB') + pd.Timedelta(days=9)
+        pd.Series(
+            np.round(np.linspace(0.2, 0.6, len(dividend_dates)), 4), index=dividend_dates, name='Dividends'
+        ).to_pickle(os.path.join(root, 'dividends', f'{symbol}.pkl'))
+
+        statement_dir = os.path.join(root, 'statements', symbol)
+        os.makedirs(statement_dir, exist_ok=True)
+        for name in STATEMENT_TYPES:
+            freq = 'QE' if name.startswith('quarterly') else 'YE'
+            columns = pd.date_range(end=today, periods=4, freq=freq)[::-1]
+            items = ['Total Revenue', 'Gross Profit', 'Operating Income', 'Net Income', 'Total Assets', 'Free Cash Flow']
+            pd.DataFrame(
+                rng.uniform(1e8, 1e11, (len(items), len(columns))), index=items, columns=columns
+            ).to_pickle(os.path.join(statement_dir, f'{name}.pkl'))
+
+
+# 측정 도우미
+def timed_run(at):
+    """AppTest 1회 실행 시간 (예외/오류 메시지가 있으면 실패로 처리)"""
+    start = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - start
+    failures = [element.value for element in list(at.exception) + list(at.error)]
+    if failures:
+        raise RuntimeError(f"앱 실행 실패: {failures[0]}")
+    return elapsed
+
+def median_of(repeat, func):
+    return statistics.median(func() for _ in range(repeat))
+
+def new_app(timeout):
+    return AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+def reset_process_caches(cache_dir):
+    """프로세스 공유 캐시(st.cache_*)와 로컬 저장소를 비워 첫 실행 상태로 되돌림"""
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    os.environ['STOCK_CACHE_DIR'] = cache_dir
+
+def random_positions(count, seed=1):
+    rng = np.random.default_rng(seed)
+    today = pd.Timestamp.now().normalize()
+    dates = pd.bdate_range(today - pd.DateOffset(years=10), today - pd.Timedelta(days=7))
+    symbols = universe()
+    return (
+        [symbols[i] for i in rng.integers(0, len(symbols), count)],
+        pd.DatetimeIndex(dates[rng.integers(0, len(dates), count)]),
+        np.round(rng.uniform(10, 500, count), 2),
+        rng.integers(1, 100, count),
+    )
+
+
+# 시나리오
+def bench_cold_start(workdir, args, results):
+    def once():
+        reset_process_caches(tempfile.mkdtemp(prefix='cache-', dir=workdir))
+        return timed_run(new_app(args.timeout))
+    results['cold_start'] = median_of(args.repeat, once)
+
+def bench_tabs(args, results):
+    at = new_app(args.timeout)
+    timed_run(at)
+    sections = at.radio(key='section').options
+    for slug, section in zip(TAB_SLUGS, sections):
+        at.radio(key='section').set_value(section)
+        results[f'tab.{slug}.switch'] = timed_run(at)
+        results[f'tab.{slug}.rerun'] = median_of(args.repeat, lambda: timed_run(at))
+
+def bench_portfolio(args, results):
+    for size in args.portfolio_sizes:
+        at = new_app(args.timeout)
+        timed_run(at)
+        at.radio(key='section').set_value(at.radio(key='section').options[TAB_SLUGS.index('portfolio')])
+        timed_run(at)
+        at.session_state.portfolio.extend(*random_positions(size))
+        results[f'portfolio.{size}.load'] = timed_run(at)
+        results[f'portfolio.{size}.rerun'] = median_of(args.repeat, lambda: timed_run(at))
+
+        def add():
+            count = len(at.session_state.portfolio)
+            at.text_input(key='buy_ticker_input').set_value(universe()[1])
+            at.number_input(key='buy_price_input').set_value(123.45)
+            at.button(key='add_portfolio_btn').click()
+            elapsed = timed_run(at)
+            if len(at.session_state.portfolio) != count + 1:
+                raise RuntimeError("➕ 추가 버튼으로 포지션이 추가되지 않았습니다")
+            return elapsed
+        results[f'portfolio.{size}.add'] = median_of(args.repeat, add)
+
+        def refresh():
+            at.button(key='price_refresh_btn').click()
+            return timed_run(at)
+        results[f'portfolio.{size}.refresh'] = median_of(args.repeat, refresh)
+
+def bench_chart(args, results):
+    at = new_app(args.timeout)
+    timed_run(at)
+    at.radio(key='section').set_value(at.radio(key='section').options[TAB_SLUGS.index('chart')])
+    timed_run(at)
+    for slug, label in CHART_PERIODS.items():
+        at.selectbox(key='period').set_value(label)
+        results[f'chart.{slug}.first'] = timed_run(at)
+        results[f'chart.{slug}.rerun'] = median_of(args.repeat, lambda: timed_run(at))
+
+
+# 기준값 비교
+def compare(metrics, baseline, tolerance, min_delta):
+    """기준값 대비 비율 표 출력 후 허용 범위를 넘은 항목 목록 반환 (min_delta초 미만 차이는 측정 오차로 무시)"""
+    regressions = []
+    print(f"\n{'항목':<32}{'기준(s)':>10}{'현재(s)':>10}{'비율':>8}")
+    for name, value in metrics.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<32}{'-':>10}{value:>10.3f}{'신규':>8}")
+            continue
+        ratio = value / base if base > 0 else float('inf')
+        flag = ' ⚠️' if ratio > 1 + tolerance and value - base > min_delta else ''
+        print(f"{name:<32}{base:>10.3f}{value:>10.3f}{ratio:>8.2f}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='주식 분석 대시보드 성능 벤치마크 (재생 데이터 공급자 사용)')
+    parser.add_argument('--repeat', type=int, default=3, help='항목별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='재생 공급자 요청당 합성 지연 (ms)')
+    parser.add_argument('--timeout', type=float, default=300.0, help='AppTest 1회 실행 제한 시간 (초)')
+    parser.add_argument('--portfolio-sizes', type=int, nargs='+', default=PORTFOLIO_SIZES)
+    parser.add_argument('--output', help='결과 JSON 저장 경로 (생략 시 표준 출력)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='비교할 기준값 JSON')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준값으로 저장')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용 지연 비율 (0.2 = 기준값 대비 20%%)')
+    parser.add_argument('--min-delta', type=float, default=0.05, help='느려진 것으로 판단할 최소 차이 (초)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='stock-bench-') as workdir:
+        fixture_dir = os.path.join(workdir, 'fixtures')
+        write_fixtures(fixture_dir)
+        os.environ.update(
+            STOCK_DATA_PROVIDER='replay',
+            STOCK_FIXTURE_DIR=fixture_dir,
+            STOCK_REPLAY_LATENCY_MS=str(args.latency_ms),
+        )
+
+        results = {}
+        bench_cold_start(workdir, args, results)
+        # 이후 시나리오는 마지막 첫 실행의 캐시/저장소를 이어서 사용
+        bench_tabs(args, results)
+        bench_chart(args, results)
+        bench_portfolio(args, results)
+
+    report = {
+        'metadata': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'streamlit': st.__version__,
+            'pandas': pd.__version__,
+            'repeat': args.repeat,
+            'latency_ms': args.latency_ms,
+        },
+        'metrics': {name: round(value, 4) for name, value in results.items()},
+    }
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n기준값 파일이 없어 비교를 건너뜁니다: {args.baseline} (--save-baseline으로 생성)")
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(report['metrics'], baseline['metrics'], args.tolerance, args.min_delta)
+    if regressions:
+        print(f"\n⚠️ 기준값보다 {args.tolerance:.0%} 넘게 느려진 항목 {len(regressions)}개: {', '.join(regressions)}")
+        return 1
+    print("\n✅ 모든 항목이 기준값 허용 범위 안에 있습니다.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
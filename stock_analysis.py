@@ -1,10 +1,36 @@
 import streamlit as st
-import yfinance as yf
 import plotly.graph_objects as go
 import pandas as pd
 from datetime import datetime, timedelta, date
 import numpy as np
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import os
+import time
 import warnings
+from stock_core import tracing
+from stock_core.cache import SharedCache
+from stock_core.dividends import compute_dividend_stats, dividend_ttm
+from stock_core.downsample import lttb_indices, resample_ohlc
+from stock_core.fetch import RangeDownloader
+from stock_core.indicators import (
+    StreamingATR, StreamingEMA, StreamingMACD, StreamingRSI, StreamingSMA, compute_indicators, price_arrays,
+)
+from stock_core.intraday_store import IntradayStore
+from stock_core.portfolio import (
+    PortfolioStore, closes_as_of, portfolio_timeseries, read_trade_file, timeseries_summary,
+)
+from stock_core.price_store import PriceStore
+from stock_core.providers import (
+    FixtureStore, RecordingProvider, ReplayProvider, TracedProvider, YFinanceProvider, normalize_dataframe,
+)
+from stock_core.scheduler import PRIORITY_BULK, PRIORITY_PREFETCH, RequestScheduler, submit_in_context
+from stock_core.screener import (
+    SCREENER_METRICS, metrics_table, parse_universe, read_universe_file, screen_universe,
+)
+from stock_core.statement_store import STATEMENT_TYPES, StatementStore, fiscal_marker
+from stock_core.tracing import Tracer, estimate_size, traced
 warnings.filterwarnings('ignore')
 
 # 페이지 설정
@@ -16,16 +42,139 @@ st.set_page_config(
 
 st.title("📊 통합 주식 데이터 분석 대시보드")
 
-# 세션 상태 초기화 (최상단에서 수행)
-if 'portfolio_data' not in st.session_state:
-    st.session_state.portfolio_data = []
+# 로컬 캐시 설정
+CACHE_DIR = os.environ.get(
+    'STOCK_CACHE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.stock_cache')
+)
+DATA_PROVIDER = os.environ.get('STOCK_DATA_PROVIDER', 'yfinance')  # 데이터 공급자 (yfinance / record / replay)
+FIXTURE_DIR = os.environ.get('STOCK_FIXTURE_DIR', os.path.join(CACHE_DIR, 'fixtures'))  # 기록/재생 픽스처 위치
+REPLAY_LATENCY_SECONDS = float(os.environ.get('STOCK_REPLAY_LATENCY_MS', 0)) / 1000  # 재생 시 요청마다 추가할 지연
+PRICE_CACHE_MAX_ROWS = 2_000_000        # 저장소 전체 최대 봉 개수 (초과 시 오래 안 쓴 종목부터 제거)
+INTRADAY_TTL = timedelta(minutes=15)    # 당일 봉의 유효 시간 (과거 봉은 영구 보관)
+EMPTY_GAP_MAX_DAYS = 7                  # 빈 응답을 '거래 없음'으로 기록할 최대 구간 길이 (주말/휴장일)
+INTRADAY_CACHE_MAX_BYTES = 500 * 1024 * 1024  # 분/시간봉 저장소 최대 용량
+INTRADAY_LOOKBACK_DAYS = {'1m': 29, '5m': 59, '15m': 59, '30m': 59, '1h': 729}  # 야후가 제공하는 최대 과거 기간
+INTRADAY_REQUEST_DAYS = {'1m': 7, '5m': 59, '15m': 59, '30m': 59, '1h': 729}    # 요청 1회당 최대 기간
+INFO_TTL = timedelta(minutes=10)        # 종목 메타데이터(info) 캐시 유효 시간
+PRICE_REFRESH_OPTIONS = {'1분': 60, '5분': 300, '15분': 900, '1시간': 3600}  # 포트폴리오 현재가 갱신 주기
+LIVE_REFRESH_SECONDS = 60               # 실시간 지표 패널 갱신 주기
+LIVE_MAX_POINTS = 250                   # 실시간 지표 패널에 유지할 최근 봉 수
+CHART_TARGET_WIDTH = 1200               # 차트 가로 픽셀 (wide 레이아웃 기준 근사값)
+CHART_PIXELS_PER_CANDLE = 3             # 캔들 하나에 필요한 최소 픽셀
+CHART_MAX_LINE_POINTS = 1000            # 선 그래프 하나에 보낼 최대 점 개수
+FETCH_TIMEOUT_SECONDS = 10              # 야후 요청 1회당 최대 대기 시간
+FETCH_MAX_ATTEMPTS = 3                  # 일시적 오류(네트워크/시간 초과) 시 최대 시도 횟수
+FETCH_BACKOFF_SECONDS = 0.5             # 재시도 전 대기 시간 (시도마다 2배)
+FETCH_WORKERS = 8                       # 동시 요청용 스레드 수
+UNKNOWN_SYMBOL_TTL = timedelta(hours=1) # 존재하지 않는 종목 결과를 기억하는 시간
+STATEMENT_FALLBACK_TTL = timedelta(days=7)  # 결산일 정보가 없는 종목의 재무제표 유효 기간
+DIVIDEND_TTL = timedelta(hours=6)       # 배당 이력 캐시 유효 시간
+DIVIDEND_YIELD_YEARS = 10               # 배당 수익률 추이를 계산할 최근 기간 (년)
+SCREENER_MAX_SYMBOLS = 1000             # 스크리너 한 번에 조회할 최대 종목 수
+PREFETCH_WORKERS = 16                   # 종목 변경 시 메뉴별 데이터를 미리 요청하는 스레드 수
+SCREENER_WORKERS = 8                    # 스크리너 일괄 조회 전용 스레드 수 (미리 요청 풀을 점유하지 않도록 분리)
+PREFETCH_PRICE_PERIOD = '1y'            # 미리 받아 둘 일봉 기간 (차트 기본 기간을 포함)
+SHARED_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 세션 간 공유 캐시 최대 메모리
+PRICE_SHARE_TTL = timedelta(minutes=1)  # 주가 조회 결과를 세션 간 공유하는 시간 (동시 요청 병합용, 이후는 저장소에서 읽음)
+YAHOO_MAX_RATE = 10.0                   # 야후 요청 최대 속도 (초당 요청 수, 모든 세션 합계)
+YAHOO_MIN_RATE = 0.5                    # 429 응답이 반복될 때 낮출 수 있는 최저 속도
+YAHOO_BURST = 20                        # 대기 없이 연속으로 보낼 수 있는 최대 요청 수
+YAHOO_RATE_STEP = 0.1                   # 요청 성공 시마다 회복하는 속도
+RATE_LIMIT_BACKOFF_SECONDS = 2.0        # 429 응답 직후 모든 요청을 멈추는 시간 (연속 시 2배)
+RATE_LIMIT_MAX_BACKOFF_SECONDS = 60.0   # 429 응답 후 최대 정지 시간
+TRACE_MAX_SPANS = 20_000                # 메모리에 보관할 최근 계측 구간 수 (모든 세션 합계)
+TRACE_LOG_PATH = os.environ.get('STOCK_TRACE_LOG')  # 지정하면 모든 계측 구간을 JSON Lines 파일로 기록
 
+# 세션 상태 초기화 (최상단에서 수행)
 if 'closing_price' not in st.session_state:
     st.session_state.closing_price = 0.0
 
 if 'closing_price_found' not in st.session_state:
     st.session_state.closing_price_found = False
 
+# 공유 캐시: 모든 세션이 같은 조회 결과를 사용하고 동시 요청은 한 번만 실행
+@st.cache_resource
+def get_shared_cache():
+    """프로세스 전체에서 공유하는 데이터 캐시"""
+    return SharedCache(SHARED_CACHE_MAX_BYTES)
+
+def shared_cached(dataset, ttl, cacheable=None):
+    """공유 캐시 데코레이터 - (데이터 종류, 인자)를 키로 세션 간 결과 공유 및 동시 요청 병합 (인자는 해시 가능해야 함)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (dataset, args, tuple(sorted(kwargs.items())))
+            return get_shared_cache().get(key, lambda: func(*args, **kwargs), ttl, cacheable)
+        return wrapper
+    return decorator
+
+# 성능 계측: 조회/변환/렌더링 구간의 소요 시간, 페이로드 크기, 캐시 적중 횟수를 모든 세션에서 수집
+@st.cache_resource
+def get_tracer():
+    """프로세스 전체에서 공유하는 성능 계측기 (stock_core 모듈의 계측 구간도 같은 계측기에 기록)"""
+    return tracing.install(Tracer(TRACE_MAX_SPANS, TRACE_LOG_PATH))
+
+def show_chart(fig, **kwargs):
+    """st.plotly_chart 렌더링 구간 기록 (트레이스 수, 전체 점 개수 포함)"""
+    points = sum(len(trace.x) for trace in fig.data if getattr(trace, 'x', None) is not None)
+    with get_tracer().span('render.plotly_chart', 'render', traces=len(fig.data), points=points):
+        return st.plotly_chart(fig, **kwargs)
+
+def tracing_detail_enabled():
+    """디버그 패널을 켰거나 구조화 로그를 남길 때만 크기 측정처럼 비용이 큰 계측을 수행"""
+    return bool(TRACE_LOG_PATH) or st.session_state.get('debug_panel', False)
+
+def show_dataframe(data, **kwargs):
+    """st.dataframe 렌더링 구간 기록 (행 수, 디버그 패널/로그 사용 시 크기 포함)"""
+    # memory_usage(deep=True)는 문자열 컬럼이 많으면 렌더링만큼 오래 걸리므로 필요할 때만 측정
+    attrs = {'bytes': estimate_size(data)} if tracing_detail_enabled() else {}
+    with get_tracer().span('render.dataframe', 'render', rows=len(data), **attrs):
+        return st.dataframe(data, **kwargs)
+
+# 이번 스크립트 실행의 계측 시작 (작업 스레드 구간도 같은 실행 번호로 묶임)
+trace_run = get_tracer().begin_run()
+script_started = time.perf_counter()
+
+# 요청 스케줄러: 모든 야후 요청이 하나의 속도 제한과 우선순위 대기열을 거침
+@st.cache_resource
+def get_request_scheduler():
+    """프로세스 전체에서 공유하는 야후 요청 스케줄러"""
+    return RequestScheduler(
+        YAHOO_MAX_RATE, YAHOO_MIN_RATE, YAHOO_BURST, YAHOO_RATE_STEP,
+        RATE_LIMIT_BACKOFF_SECONDS, RATE_LIMIT_MAX_BACKOFF_SECONDS
+    )
+
+def yahoo_call(key, func, *args, cost=1, **kwargs):
+    """야후 요청의 단일 통로 - 스케줄러 차례를 받아 func(*args, **kwargs) 실행 (key가 같은 동시 요청은 한 번만 실행)"""
+    return get_request_scheduler().call(key, lambda: func(*args, **kwargs), cost=cost)
+
+# 데이터 공급자: 주가/메타데이터/배당/재무제표 조회를 한 인터페이스로 통일 (STOCK_DATA_PROVIDER로 선택)
+@st.cache_resource
+def get_data_provider():
+    """환경 변수 STOCK_DATA_PROVIDER(yfinance/record/replay)로 선택한 프로세스 공유 데이터 공급자 (계측 포함)"""
+    if DATA_PROVIDER == 'yfinance':
+        return TracedProvider(YFinanceProvider(yahoo_call, FETCH_TIMEOUT_SECONDS))
+    if DATA_PROVIDER == 'record':
+        return TracedProvider(RecordingProvider(YFinanceProvider(yahoo_call, FETCH_TIMEOUT_SECONDS), FixtureStore(FIXTURE_DIR)))
+    if DATA_PROVIDER == 'replay':
+        return TracedProvider(ReplayProvider(FixtureStore(FIXTURE_DIR), REPLAY_LATENCY_SECONDS))
+    raise ValueError(f"알 수 없는 데이터 공급자: {DATA_PROVIDER} (yfinance, record, replay 중 선택)")
+
+# 종목 메타데이터 서비스: 모든 화면이 같은 캐시를 사용
+@traced('load.info', 'load')
+@shared_cached('info', INFO_TTL)
+def get_ticker_info(symbol):
+    """종목 메타데이터(info) 조회 - 종목별 TTL 공유 캐시 (예외는 캐시하지 않음)"""
+    return get_data_provider().info(symbol)
+
+def is_valid_info(company_info):
+    """야후 파이낸스가 실제 종목 정보를 돌려줬는지 확인"""
+    if not company_info:
+        return False
+    keys = ['quoteType', 'regularMarketPrice', 'currentPrice', 'longName', 'shortName']
+    return any(company_info.get(key) is not None for key in keys)
+
 # 사이드바 - 종목 선택
 with st.sidebar:
     st.title("⚙️ 설정")
@@ -34,103 +183,157 @@ with st.sidebar:
         value='AAPL',
         placeholder='예: AAPL, 005930.KS (삼성전자)'
     )
-    
-    if ticker:
-        try:
-            info = yf.Ticker(ticker)
-            st.sidebar.success(f"✅ {ticker} 로드 완료")
-        except Exception as e:
-            st.sidebar.error(f"❌ 종목을 찾을 수 없습니다")
 
-# 헬퍼 함수: 안전한 데이터 다운로드
-def safe_download(ticker, start_date=None, end_date=None, period=None):
-    """안전하게 주가 데이터 다운로드 - 데이터 프레임 정규화"""
+# 가격 저장소: 종목별 일봉을 SQLite에 보관
+@st.cache_resource
+def get_price_store():
+    """프로세스 전체에서 공유하는 가격 저장소"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return PriceStore(os.path.join(CACHE_DIR, 'prices.sqlite3'), PRICE_CACHE_MAX_ROWS, INTRADAY_TTL)
+
+# 분/시간봉 저장소: (종목, 간격, 날짜)별 파일로 분할 보관
+@st.cache_resource
+def get_intraday_store():
+    """프로세스 전체에서 공유하는 분/시간봉 저장소"""
+    root = os.path.join(CACHE_DIR, 'intraday')
+    os.makedirs(root, exist_ok=True)
+    return IntradayStore(root, INTRADAY_CACHE_MAX_BYTES, INTRADAY_TTL)
+
+# 헬퍼 함수: 날짜 값 정규화
+def to_date(value):
+    """str/datetime/Timestamp 값을 date 객체로 변환"""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return pd.Timestamp(value).date()
+
+# 헬퍼 함수: period 문자열을 날짜 범위로 변환
+PERIOD_OFFSETS = {
+    '1mo': pd.DateOffset(months=1),
+    '3mo': pd.DateOffset(months=3),
+    '6mo': pd.DateOffset(months=6),
+    '1y': pd.DateOffset(years=1),
+    '5y': pd.DateOffset(years=5),
+    '10y': pd.DateOffset(years=10),
+}
+
+def period_to_range(period):
+    """yfinance period 값을 [start, end) 날짜 범위로 변환 (지원하지 않으면 None)"""
+    if period not in PERIOD_OFFSETS:
+        return None, None
+    today = datetime.now().date()
+    start = (pd.Timestamp(today) - PERIOD_OFFSETS[period]).date()
+    return start, today + timedelta(days=1)
+
+@st.cache_resource
+def get_fetch_executor():
+    """대체 요청을 동시에 보내기 위한 프로세스 공유 스레드 풀"""
+    return ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix='fetch')
+
+def fetch_history(ticker, interval, **window):
+    """데이터 공급자 요청 1회 - 원본/수정 종가를 함께 받고 실패 원인은 예외로 구분"""
+    history = get_data_provider().history(ticker, interval, **window)
+    return normalize_dataframe(history, ticker)
+
+# 헬퍼 함수: 안전한 데이터 다운로드 (존재하지 않는 종목 기록은 프로세스 전체 공유)
+@st.cache_resource
+def get_range_downloader():
+    """프로세스 전체에서 공유하는 구간 다운로더"""
+    return RangeDownloader(
+        fetch_history, lambda func: submit_in_context(get_fetch_executor(), func),
+        FETCH_MAX_ATTEMPTS, FETCH_BACKOFF_SECONDS, UNKNOWN_SYMBOL_TTL
+    )
+
+def download_range(ticker, start_date, end_date, errors, label, interval='1d', period=None):
+    """날짜 범위 [start_date, end_date) 다운로드 - 실패 원인은 errors에 추가하고 None 반환"""
+    return get_range_downloader().download(ticker, start_date, end_date, errors, label, interval, period)
+
+@traced('load.prices', 'load')
+@shared_cached('prices', PRICE_SHARE_TTL, cacheable=lambda result: result[0] is not None)
+def safe_download(ticker, start_date=None, end_date=None, period=None, interval='1d'):
+    """안전하게 주가 데이터 다운로드 - 로컬 저장소에 없는 구간만 받아 병합 후 반환"""
+    if interval != '1d':
+        return download_intraday(ticker, start_date, end_date, period, interval)
+    
     errors = []
     
-    # 방법 1: 날짜 범위 지정
+    # 조회 범위 계산 (저장소 키)
     if start_date and end_date:
-        try:
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False, auto_adjust=False)
-            data = normalize_dataframe(data, ticker)
-            if data is not None and not data.empty:
-                return data, None
-        except Exception as e:
-            errors.append(f"방법1 실패: {str(e)}")
-        
-        try:
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-            data = normalize_dataframe(data, ticker)
-            if data is not None and not data.empty:
-                return data, None
-        except Exception as e:
-            errors.append(f"방법1-2 실패: {str(e)}")
+        range_start, range_end = to_date(start_date), to_date(end_date)
+    else:
+        range_start, range_end = period_to_range(period)
     
-    # 방법 2: period 지정
-    if period:
-        try:
-            data = yf.download(ticker, period=period, progress=False, auto_adjust=False)
-            data = normalize_dataframe(data, ticker)
-            if data is not None and not data.empty:
-                return data, None
-        except Exception as e:
-            errors.append(f"방법2 실패: {str(e)}")
+    if range_start and range_end:
+        # 로컬 저장소 + 빠진 구간만 다운로드
+        store = get_price_store()
+        gaps = store.missing_intervals(ticker, range_start, range_end)
+        get_tracer().count('price_store', hit=not gaps)
+        known_ticker = bool(gaps) and store.has_data(ticker)
         
-        try:
-            data = yf.download(ticker, period=period, progress=False)
-            data = normalize_dataframe(data, ticker)
-            if data is not None and not data.empty:
-                return data, None
-        except Exception as e:
-            errors.append(f"방법2-2 실패: {str(e)}")
+        for gap_start, gap_end in gaps:
+            # 전체 기간을 처음 받을 때만 period 요청을 대체 경로로 함께 보냄
+            race_period = period if (gap_start, gap_end) == (range_start, range_end) else None
+            error_count = len(errors)
+            data = download_range(ticker, gap_start, gap_end, errors, f"{gap_start} ~ {gap_end}", period=race_period)
+            try:
+                if data is not None:
+                    store.save(ticker, data, gap_start, gap_end)
+                elif len(errors) == error_count and known_ticker and (gap_end - gap_start).days <= EMPTY_GAP_MAX_DAYS:
+                    # 이미 받은 종목의 짧은 빈 구간은 휴장일로 보고 다시 요청하지 않음
+                    # (네트워크 오류/시간 초과 등 실패가 하나라도 있었으면 기록하지 않고 다음에 다시 요청)
+                    store.save(ticker, pd.DataFrame(columns=PriceStore.COLUMNS), gap_start, gap_end)
+            except Exception as e:
+                errors.append(f"저장소 기록 실패: {str(e)}")
+        
+        data = store.load(ticker, range_start, range_end)
+        if data is not None and not data.empty:
+            return data, None
+    elif period:
+        # 날짜로 바꿀 수 없는 기간은 저장소 없이 바로 요청
+        data = download_range(ticker, None, None, errors, f"period={period}", period=period)
+        if data is not None:
+            return data, None
     
     # 모든 방법 실패
     error_msg = "\n".join(errors) if errors else "알 수 없는 오류"
     return None, error_msg
 
-# 헬퍼 함수: 데이터프레임 정규화
-def normalize_dataframe(data, ticker):
-    """데이터프레임을 정규 형식으로 변환"""
-    try:
-        # 데이터가 비어있는지 확인
-        if data is None or data.empty:
-            return None
-        
-        # 멀티 인덱스인 경우 싱글 종목만 추출
-        if isinstance(data.columns, pd.MultiIndex):
-            # 멀티 레벨 컬럼 구조
-            if ticker in data.columns.get_level_values(1):
-                data = data.xs(ticker, level=1, axis=1)
-            elif ticker in data.columns.get_level_values(0):
-                data = data[ticker]
-        
-        # 필수 컬럼 확인
-        required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
-        
-        # 컬럼 정리 (대소문자 통일)
-        data.columns = [col if col in required_cols else col for col in data.columns]
-        
-        # 필수 컬럼이 모두 있는지 확인
-        if not all(col in data.columns for col in required_cols):
-            return None
-        
-        # 필요한 컬럼만 선택
-        data = data[required_cols].copy()
-        
-        # 데이터 타입 변환
-        for col in required_cols:
-            data[col] = pd.to_numeric(data[col], errors='coerce')
-        
-        # NaN이 모두인 경우 제외
-        if data.isna().all().all():
-            return None
-        
-        # 인덱스 이름 설정
-        data.index.name = 'Date'
-        
-        return data
+# 헬퍼 함수: 분/시간봉 다운로드
+def download_intraday(ticker, start_date, end_date, period, interval):
+    """분/시간봉 다운로드 - 날짜 파티션 저장소에 없는 날짜만 받아 병합"""
+    errors = []
     
-    except Exception as e:
-        return None
+    if start_date and end_date:
+        range_start, range_end = to_date(start_date), to_date(end_date)
+    else:
+        range_start, range_end = period_to_range(period)
+    if not range_start or not range_end:
+        return None, f"지원하지 않는 기간: {period}"
+    
+    # 야후 파이낸스가 제공하는 최근 기간으로 제한
+    range_start = max(range_start, datetime.now().date() - timedelta(days=INTRADAY_LOOKBACK_DAYS[interval]))
+    if range_start >= range_end:
+        return None, f"{interval} 봉은 최근 {INTRADAY_LOOKBACK_DAYS[interval]}일만 조회할 수 있습니다."
+    
+    store = get_intraday_store()
+    gaps = store.missing_ranges(ticker, interval, range_start, range_end, INTRADAY_REQUEST_DAYS[interval])
+    get_tracer().count('intraday_store', hit=not gaps)
+    for gap_start, gap_end in gaps:
+        data = download_range(ticker, gap_start, gap_end, errors, f"{interval} ({gap_start} ~ {gap_end})", interval=interval)
+        if data is None:
+            continue
+        try:
+            store.save(ticker, interval, data, gap_start, gap_end)
+        except Exception as e:
+            errors.append(f"저장소 기록 실패: {str(e)}")
+    
+    data = store.load(ticker, interval, range_start, range_end)
+    if data is not None and not data.empty:
+        return data, None
+    
+    error_msg = "\n".join(errors) if errors else "알 수 없는 오류"
+    return None, error_msg
 
 # 헬퍼 함수: 숫자 포맷팅
 def format_number(value):
@@ -154,75 +357,550 @@ def format_number(value):
     except:
         return str(value)
 
+def format_percent(value):
+    """백분율 값을 안전하게 포맷팅"""
+    if value is None or pd.isna(value):
+        return 'N/A'
+    return f"{value:.2f}%"
+
+# 헬퍼 함수: (종목, 날짜) 배열의 종가 일괄 조회
+ASOF_WINDOW_DAYS = 7  # 요청 날짜 앞뒤로 함께 조회할 기간 (휴장일 대비)
+
+@traced('transform.prices_as_of', 'transform')
+def get_prices_as_of(tickers, dates, fallback='previous'):
+    """(종목, 날짜) 쌍 배열의 종가를 NumPy 배열로 반환 - 종목별 종가 시계열에 as-of 방식으로 매칭 (실패 시 NaN)"""
+    if fallback not in ('previous', 'next'):
+        raise ValueError(f"지원하지 않는 fallback: {fallback}")
+    
+    tickers = pd.Series(tickers, dtype=object).fillna('').astype(str).to_numpy()
+    dates = pd.to_datetime(pd.Series(dates), errors='coerce').dt.normalize().to_numpy(dtype='datetime64[ns]')
+    result = np.full(len(tickers), np.nan)
+    
+    valid = ~np.isnat(dates) & (tickers != '')
+    requests = pd.DataFrame({'ticker': tickers[valid], 'date': dates[valid], 'row': np.flatnonzero(valid)})
+    
+    for symbol, group in requests.groupby('ticker'):
+        # 종목별로 필요한 전체 구간을 한 번만 조회 (로컬 저장소 우선)
+        data, _ = safe_download(
+            symbol,
+            start_date=group['date'].min() - timedelta(days=ASOF_WINDOW_DAYS),
+            end_date=group['date'].max() + timedelta(days=ASOF_WINDOW_DAYS)
+        )
+        if data is None or data.empty:
+            continue
+        
+        result[group['row'].to_numpy()] = closes_as_of(data['Close'], group['date'].to_numpy(), fallback)
+    
+    return result
+
 # 헬퍼 함수: 특정 날짜의 종가 가져오기
 def get_closing_price_on_date(ticker, target_date):
-    """특정 날짜의 종가 가져오기"""
+    """특정 날짜의 종가 가져오기 (없으면 가장 가까운 이전/다음 거래일)"""
     try:
-        # date 객체를 datetime으로 변환
-        if isinstance(target_date, date) and not isinstance(target_date, datetime):
-            target_date = datetime.combine(target_date, datetime.min.time())
-        
-        # Timestamp로 변환
-        target_timestamp = pd.Timestamp(target_date)
-        
-        # 해당 날짜 전후 데이터 조회
-        start_date = target_timestamp - timedelta(days=5)
-        end_date = target_timestamp + timedelta(days=5)
-        
-        data = yf.download(ticker, start=start_date, end=end_date, progress=False, auto_adjust=False)
-        
-        if data is None or data.empty:
-            data = yf.download(ticker, start=start_date, end=end_date, progress=False)
-        
-        if data is None or data.empty:
-            return None
-        
-        # 멀티 인덱스인 경우 처리
-        if isinstance(data.columns, pd.MultiIndex):
-            if ticker in data.columns.get_level_values(1):
-                data = data.xs(ticker, level=1, axis=1)
-            elif ticker in data.columns.get_level_values(0):
-                data = data[ticker]
-        
-        # 인덱스를 Timestamp로 정규화
-        data.index = pd.to_datetime(data.index)
-        
-        # 정확한 날짜의 데이터 찾기
-        if target_timestamp in data.index:
-            return float(data.loc[target_timestamp, 'Close'])
-        
-        # 없으면 가장 가까운 거래일 찾기
-        data_sorted = data.sort_index()
-        idx = data_sorted.index.searchsorted(target_timestamp)
-        
-        if idx > 0:
-            # 이전 거래일
-            closest_date = data_sorted.index[idx - 1]
-            return float(data_sorted.loc[closest_date, 'Close'])
-        elif idx < len(data_sorted):
-            # 다음 거래일
-            closest_date = data_sorted.index[idx]
-            return float(data_sorted.loc[closest_date, 'Close'])
-        
+        close = get_prices_as_of([ticker], [target_date])[0]
+        return None if np.isnan(close) else float(close)
+    except Exception as e:
         return None
+
+# 헬퍼 함수: 여러 종목의 최신 종가 일괄 조회
+@shared_cached('latest_prices', timedelta(seconds=max(PRICE_REFRESH_OPTIONS.values())))
+def _download_latest_closes(symbols, refresh_bucket):
+    """정렬된 종목 튜플의 최근 종가를 한 번의 다중 종목 요청으로 조회 (refresh_bucket이 바뀌면 재조회)"""
+    data = get_data_provider().download(symbols, period='5d')
+    if data is None or data.empty:
+        return pd.Series(np.nan, index=list(symbols), dtype=float)
     
-    except Exception as e:
+    if isinstance(data.columns, pd.MultiIndex):
+        close = data['Close']
+    else:
+        close = data[['Close']]
+        close.columns = list(symbols)
+    
+    # 종목별 마지막 유효 종가
+    close = close.apply(pd.to_numeric, errors='coerce').ffill()
+    return close.iloc[-1].reindex(list(symbols)).astype(float)
+
+@traced('load.latest_prices', 'load')
+def fetch_latest_prices(symbols, refresh_seconds=None):
+    """종목 목록의 최신 종가 Series (조회 실패 종목은 NaN, refresh_seconds마다 갱신)"""
+    symbols = tuple(sorted({str(symbol) for symbol in symbols if symbol}))
+    if not symbols:
+        return pd.Series(dtype=float)
+    if refresh_seconds is None:
+        refresh_seconds = INTRADAY_TTL.total_seconds()
+    refresh_bucket = (int(time.time() // refresh_seconds), st.session_state.get('price_refresh_nonce', 0))
+    return _download_latest_closes(symbols, refresh_bucket)
+
+# 헬퍼 함수: 포트폴리오 평가
+@traced('transform.revalue', 'transform')
+def revalue_portfolio(portfolio_df, prices):
+    """포지션(종목, 매수날짜, 매수가, 수량)과 최신 종가로 평가액/손익/수익률을 한 번에 계산"""
+    portfolio_df = portfolio_df[['종목', '매수날짜', '매수가', '수량']].copy()
+    
+    current = portfolio_df['종목'].map(prices).to_numpy(dtype=float)
+    quantity = portfolio_df['수량'].to_numpy(dtype=float)
+    buy_price = portfolio_df['매수가'].to_numpy(dtype=float)
+    cost = buy_price * quantity
+    
+    portfolio_df['현재가'] = current
+    portfolio_df['매수액'] = cost
+    portfolio_df['현재가치'] = current * quantity
+    portfolio_df['수익/손실'] = (current - buy_price) * quantity
+    portfolio_df['수익률(%)'] = (current - buy_price) / buy_price * 100
+    return portfolio_df[['종목', '매수날짜', '매수가', '현재가', '수량', '매수액', '현재가치', '수익/손실', '수익률(%)']]
+
+# 포트폴리오 시계열: 보유 종목의 (날짜 × 종목) 종가 행렬 조회 (평가액 계산은 stock_core.portfolio)
+@traced('load.close_matrix', 'load')
+@shared_cached('close_matrix', INTRADAY_TTL, cacheable=lambda closes: not closes.empty)
+def load_close_matrix(symbols, start, end):
+    """종목별 일봉 종가를 (날짜 × 종목) 행렬로 반환 - 저장소에 없는 구간이 있는 종목만 한 번의 다중 종목 요청으로 받아 저장"""
+    store = get_price_store()
+    gaps = {symbol: store.missing_intervals(symbol, start, end) for symbol in symbols}
+    missing = [symbol for symbol in symbols if gaps[symbol]]
+    if missing:
+        batch_start = min(gaps[symbol][0][0] for symbol in missing)
+        data = get_data_provider().download(missing, start=batch_start, end=end)
+        for symbol in missing:
+            frame = normalize_dataframe(data, symbol)
+            if frame is not None and not frame.empty:
+                store.save(symbol, frame, batch_start, end)
+    
+    closes = {}
+    for symbol in symbols:
+        data = store.load(symbol, start, end)
+        if data is not None and not data.empty:
+            closes[symbol] = data['Close']
+    if not closes:
+        return pd.DataFrame()
+    # 거래소별 휴장일이 달라 빈 날짜는 직전 종가로 채움 (첫 거래일 이전은 첫 종가)
+    return pd.DataFrame(closes).sort_index().ffill().bfill()
+
+# 헬퍼 함수: 매수가가 없는 거래의 종가 일괄 조회
+def fill_closing_prices(trades):
+    """매수가가 비어 있는 거래를 get_prices_as_of로 한 번에 채움 (종목별 1회 조회)"""
+    trades = trades.reset_index(drop=True)
+    prices = trades['매수가'].to_numpy(dtype=float).copy()
+    needs_price = (
+        (np.isnan(prices) | (prices <= 0))
+        & trades['매수날짜'].notna().to_numpy()
+        & (trades['종목'] != '').to_numpy()
+    )
+    
+    prices[needs_price] = get_prices_as_of(
+        trades['종목'].to_numpy()[needs_price], trades['매수날짜'].to_numpy()[needs_price]
+    )
+    
+    trades['매수가'] = prices
+    return trades
+
+# 배당 분석 엔진: 배당 이벤트와 저장된 일봉을 as-of 병합해 한 번에 계산
+@traced('load.dividends', 'load')
+@shared_cached('dividends', DIVIDEND_TTL, cacheable=lambda dividends: len(dividends) > 0)
+def get_dividends(symbol):
+    """종목 배당 이력 (지급일 → 주당 배당금) - 시간대 제거, 날짜순 정렬"""
+    dividends = get_data_provider().dividends(symbol)
+    if dividends is None or len(dividends) == 0:
+        return pd.Series(dtype=float, name='Dividends')
+    
+    index = pd.DatetimeIndex(dividends.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    dividends = pd.Series(
+        pd.to_numeric(dividends.to_numpy(), errors='coerce'),
+        index=index.normalize().astype('datetime64[ns]'),
+        name='Dividends'
+    )
+    return dividends.dropna().sort_index()
+
+@traced('transform.dividends', 'transform')
+def analyze_dividends(ticker, last_dividend, dividends):
+    """배당 이벤트별 TTM 배당금/수익률, 연간 합계, CAGR, 연속 배당·증가 연수 (마지막 배당 행과 연도가 같으면 캐시 재사용)"""
+    # 최근 배당일의 종가를 저장소 일봉에서 as-of 병합 (배당일이 휴장일이면 직전 거래일)
+    today = datetime.now().date()
+    start = max(dividends.index[0].date(), today - timedelta(days=365 * DIVIDEND_YIELD_YEARS))
+    prices, _ = safe_download(ticker, start_date=start - timedelta(days=ASOF_WINDOW_DAYS), end_date=today + timedelta(days=1))
+    if prices is None:
+        # 가격 조회 실패 시 빈 수익률이 캐시에 남지 않도록 캐시 없이 계산
+        return compute_dividend_stats(dividends, None, today.year)
+    return cached_dividend_stats(ticker, last_dividend, today.year, dividends, prices)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_dividend_stats(ticker, last_dividend, year, _dividends, _prices):
+    """종목·마지막 배당 행·기준 연도가 같으면 배당 분석 결과 재사용 (해가 바뀌면 연간 합계를 다시 계산)"""
+    return compute_dividend_stats(_dividends, _prices, year)
+
+def _ttm_dividend_or_nan(symbol):
+    """포트폴리오용 TTM 배당금 - 조회 실패 시 NaN"""
+    try:
+        return dividend_ttm(get_dividends(symbol))
+    except Exception:
+        return np.nan
+
+@traced('transform.dividend_income', 'transform')
+def project_dividend_income(positions_df, prices):
+    """보유 종목별 TTM 주당 배당금으로 예상 연 배당 수익, 매수가 대비 배당률(yield on cost), 현재 배당률 계산"""
+    symbols = positions_df['종목'].unique().tolist()
+    futures = [submit_in_context(get_fetch_executor(), _ttm_dividend_or_nan, symbol) for symbol in symbols]
+    ttm = pd.Series([future.result() for future in futures], index=symbols, dtype=float)
+    
+    quantity = positions_df['수량'].to_numpy(dtype=float)
+    holdings = pd.DataFrame({
+        '종목': positions_df['종목'],
+        '수량': quantity,
+        '매수액': positions_df['매수가'].to_numpy(dtype=float) * quantity,
+    }).groupby('종목', sort=False).sum()
+    
+    per_share = ttm.reindex(holdings.index).to_numpy()
+    current = pd.Series(prices, dtype=float).reindex(holdings.index).to_numpy()
+    holdings['주당 배당금(TTM)'] = per_share
+    holdings['예상 연 배당금'] = per_share * holdings['수량'].to_numpy()
+    holdings['매수가 대비 배당률(%)'] = holdings['예상 연 배당금'] / holdings['매수액'] * 100
+    holdings['현재 배당률(%)'] = per_share / current * 100
+    return holdings.reset_index()
+
+# 스크리너: 종목 목록 전체의 info 지표를 열 단위 표로 구성
+@st.cache_resource
+def get_screener_executor():
+    """스크리너 일괄 조회 전용 프로세스 공유 스레드 풀 (수백 개 작업이 미리 요청 풀 앞을 막지 않도록 분리)"""
+    return ThreadPoolExecutor(max_workers=SCREENER_WORKERS, thread_name_prefix='screener')
+
+def _universe_info(symbol):
+    """스크리너용 info 조회 - 실패한 종목은 None"""
+    try:
+        company_info = get_ticker_info(symbol)
+    except Exception:
         return None
+    return company_info if is_valid_info(company_info) else None
+
+@traced('load.universe', 'load')
+@st.cache_data(ttl=INFO_TTL, max_entries=16, show_spinner="종목 정보 조회 중...")
+def get_universe_metrics(symbols):
+    """종목 목록의 info를 동시에 조회해 (종목 × 지표) 표로 변환 - 찾을 수 없는 종목은 제외"""
+    # 화면/미리 요청이 밀리지 않도록 전용 풀에서 일괄 우선순위로 조회
+    futures = [
+        submit_in_context(get_screener_executor(), _universe_info, symbol, priority=PRIORITY_BULK)
+        for symbol in symbols
+    ]
+    return metrics_table([
+        (symbol, company_info)
+        for symbol, company_info in zip(symbols, (future.result() for future in futures))
+        if company_info is not None
+    ])
+
+# 차트에서 선택 가능한 보조 지표 (라벨 -> 지표 스펙)
+INDICATOR_OPTIONS = {
+    'EMA (20)': ('ema', 20),
+    '볼린저 밴드 (20, 2)': ('bollinger', 20, 2.0),
+    'VWAP': ('vwap',),
+    'RSI (14)': ('rsi', 14),
+    'MACD (12, 26, 9)': ('macd', 12, 26, 9),
+    'ATR (14)': ('atr', 14),
+    '스토캐스틱 (14, 3)': ('stochastic', 14, 3),
+    'OBV': ('obv',),
+}
+INDICATOR_CACHE_SIZE = 64
+
+@traced('transform.indicators', 'transform')
+def get_indicators(ticker, data, specs):
+    """(종목, 구간, 파라미터)별로 캐시된 지표 반환 - 캐시에 없는 지표만 계산"""
+    cache = st.session_state.setdefault('indicator_cache', OrderedDict())
+    data_key = (ticker, data.index[0], data.index[-1], len(data), float(data['Close'].iloc[-1]))
+    
+    results = {}
+    missing = []
+    for spec in dict.fromkeys(specs):
+        key = (data_key, spec)
+        if key in cache:
+            cache.move_to_end(key)
+            results[spec] = cache[key]
+        else:
+            missing.append(spec)
+    
+    if missing:
+        for spec, values in compute_indicators(price_arrays(data), missing).items():
+            cache[(data_key, spec)] = values
+            results[spec] = values
+        while len(cache) > INDICATOR_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    return results
+
+# 차트 다운샘플링: 화면 너비에 맞춰 전송할 점 개수 제한
+CHART_RESOLUTIONS = {
+    # 라벨: (resample 규칙, 봉 하나의 길이(분))
+    '5분봉': ('5min', 5),
+    '15분봉': ('15min', 15),
+    '1시간봉': ('1h', 60),
+    '일봉': ('1D', 1440),
+    '주봉': ('W-FRI', 10080),
+    '월봉': ('ME', 43200),
+}
+INTERVAL_MINUTES = {'1m': 1, '5m': 5, '15m': 15, '30m': 30, '1h': 60, '1d': 1440}
+
+def chart_resolutions_for(interval):
+    """원본 간격보다 굵은 해상도 목록 (원본 포함)"""
+    return ['원본'] + [
+        label for label, (_, minutes) in CHART_RESOLUTIONS.items()
+        if minutes > INTERVAL_MINUTES[interval]
+    ]
+
+def choose_chart_resolution(data, interval, target_width=CHART_TARGET_WIDTH):
+    """차트 픽셀 너비 안에 캔들이 들어가는 가장 세밀한 해상도 선택"""
+    max_candles = target_width // CHART_PIXELS_PER_CANDLE
+    if len(data) <= max_candles:
+        return '원본'
+    resolutions = chart_resolutions_for(interval)[1:]
+    for label in resolutions:
+        rule = CHART_RESOLUTIONS[label][0]
+        if data['Close'].resample(rule).count().gt(0).sum() <= max_candles:
+            return label
+    return resolutions[-1] if resolutions else '원본'
+
+def line_points(index, values, threshold=CHART_MAX_LINE_POINTS):
+    """선 그래프용 x/y - NaN 구간을 제외하고 threshold개 이하로 LTTB 다운샘플링"""
+    values = np.asarray(values, dtype=float)
+    valid = np.flatnonzero(~np.isnan(values))
+    x = np.asarray(index)[valid]
+    y = values[valid]
+    if len(y) > threshold:
+        keep = lttb_indices(x.astype('datetime64[ns]').astype(np.int64).astype(float), y, threshold)
+        x, y = x[keep], y[keep]
+    return {'x': x, 'y': y}
+
+# 실시간 지표 묶음: 증분 지표(stock_core.indicators)로 새 봉만 반영
+class LiveIndicators:
+    """캐시된 과거 봉으로 초기화한 뒤 새 봉만 반영하는 증분 지표 묶음"""
+
+    def __init__(self, max_points=LIVE_MAX_POINTS):
+        self.indicators = {
+            'SMA 20': StreamingSMA(20),
+            'SMA 50': StreamingSMA(50),
+            'EMA 20': StreamingEMA.span(20),
+            'RSI 14': StreamingRSI(14),
+            'ATR 14': StreamingATR(14),
+            'MACD 히스토그램': StreamingMACD(12, 26, 9),
+        }
+        self.times = deque(maxlen=max_points)
+        self.closes = deque(maxlen=max_points)
+        self.series = {name: deque(maxlen=max_points) for name in self.indicators}
+
+    @property
+    def last_time(self):
+        return self.times[-1] if self.times else None
+
+    def update(self, data):
+        """last_time 이후(같은 시각 포함)의 봉만 반영 - 추가/교체된 봉 수 반환"""
+        if self.last_time is not None:
+            data = data.loc[data.index >= self.last_time]
+        
+        for timestamp, row in zip(data.index, data[['Open', 'High', 'Low', 'Close', 'Volume']].to_dict('records')):
+            row['time'] = timestamp
+            revise = self.last_time is not None and timestamp == self.last_time
+            if revise:
+                self.times.pop()
+                self.closes.pop()
+            self.times.append(timestamp)
+            self.closes.append(row['Close'])
+            for name, indicator in self.indicators.items():
+                value = indicator.update(row)
+                if revise:
+                    self.series[name].pop()
+                self.series[name].append(value)
+        return len(data)
+
+# 헬퍼 함수: 실시간 지표 패널
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def render_live_indicators(ticker, history):
+    """마지막 봉 이후만 받아 증분 지표를 갱신하는 실시간 패널 (이 부분만 주기적으로 재실행)"""
+    live_states = st.session_state.setdefault('live_indicators', {})
+    live = live_states.get(ticker)
+    if live is None:
+        # 최초 1회만 캐시된 과거 봉으로 초기화
+        live = LiveIndicators()
+        live.update(history)
+        live_states[ticker] = live
+    
+    added = 0
+    errors = []
+    start = to_date(live.last_time)
+    end = datetime.now().date() + timedelta(days=1)
+    recent = download_range(ticker, start, end, errors, "실시간 조회")
+    if recent is not None:
+        try:
+            get_price_store().save(ticker, recent, start, end)
+        except Exception:
+            pass
+        added = live.update(recent)
+    
+    times = list(live.times)
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=times, y=list(live.closes), mode='lines', name='종가', line=dict(color='black', width=1.5)))
+    for name, color in [('SMA 20', 'orange'), ('SMA 50', 'blue'), ('EMA 20', 'purple')]:
+        fig.add_trace(go.Scatter(x=times, y=list(live.series[name]), mode='lines', name=name, line=dict(color=color, width=1)))
+    fig.update_layout(
+        title=f'{ticker} 실시간 지표',
+        template='plotly_white',
+        height=350,
+        hovermode='x unified',
+        margin=dict(t=40, b=20)
+    )
+    show_chart(fig, use_container_width=True)
+    
+    col1, col2, col3 = st.columns(3)
+    for column, name, fmt in [(col1, 'RSI 14', "{:.1f}"), (col2, 'ATR 14', "${:.2f}"), (col3, 'MACD 히스토그램', "{:.2f}")]:
+        with column:
+            value = live.indicators[name].value
+            st.metric(name, fmt.format(value) if not np.isnan(value) else "N/A")
+    
+    st.caption(f"마지막 갱신: {datetime.now():%H:%M:%S} · 반영된 봉 {added}개 · {LIVE_REFRESH_SECONDS}초마다 갱신")
+    if errors:
+        st.caption(f"⚠️ {errors[-1]}")
+
+# 재무제표 저장소: 6종 재무제표를 (종목, 재무제표, 항목, 기간, 값) 형태로 SQLite에 보관
+@st.cache_resource
+def get_statement_store():
+    """프로세스 전체에서 공유하는 재무제표 저장소"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return StatementStore(os.path.join(CACHE_DIR, 'statements.sqlite3'), STATEMENT_FALLBACK_TTL)
+
+@traced('load.statements', 'load')
+@shared_cached('statements', INFO_TTL)
+def load_statements(ticker):
+    """6종 재무제표 조회 - 새 결산기가 나타났을 때만 한꺼번에 다시 받고 그 외에는 저장소에서 읽음"""
+    store = get_statement_store()
+    try:
+        marker = fiscal_marker(get_ticker_info(ticker))
+    except Exception:
+        marker = None
+
+    is_current = store.is_current(ticker, marker)
+    get_tracer().count('statement_store', hit=is_current)
+    if not is_current:
+        # 6종을 동시에 받아 모두 예외 없이 끝났을 때만 저장 (빈 표로 온 재무제표는 저장소가 이전 값을 유지)
+        provider = get_data_provider()
+        futures = {
+            name: submit_in_context(get_fetch_executor(), provider.statement, ticker, name)
+            for name in STATEMENT_TYPES
+        }
+        store.save(ticker, {name: future.result() for name, future in futures.items()}, marker)
+
+    return {name: store.load(ticker, name) for name in STATEMENT_TYPES}
+
+# 프리페치: 종목이 바뀌면 모든 메뉴의 데이터를 동시에 요청
+@st.cache_resource
+def get_prefetch_executor():
+    """미리 요청용 프로세스 공유 스레드 풀 (가격 조회 풀과 분리하여 중첩 대기로 인한 교착 방지)"""
+    return ThreadPoolExecutor(max_workers=PREFETCH_WORKERS, thread_name_prefix='prefetch')
+
+PREFETCH_JOBS = {
+    'info': get_ticker_info,
+    'prices': lambda symbol: safe_download(symbol, period=PREFETCH_PRICE_PERIOD),
+    'dividends': get_dividends,
+    'statements': load_statements,
+}
+
+def start_prefetch(ticker):
+    """선택 종목이 바뀌었을 때만 모든 요청을 동시에 시작하고 future를 세션에 보관"""
+    prefetch = st.session_state.get('prefetch')
+    if prefetch is not None:
+        if prefetch[0] == ticker:
+            return
+        # 이전 종목의 아직 시작하지 않은 요청은 취소
+        for future in prefetch[1].values():
+            future.cancel()
+    
+    # 미리 요청은 가장 낮은 우선순위로 보내 화면에 보이는 요청을 먼저 처리
+    executor = get_prefetch_executor()
+    st.session_state.prefetch = (ticker, {
+        name: submit_in_context(executor, job, ticker, priority=PRIORITY_PREFETCH)
+        for name, job in PREFETCH_JOBS.items()
+    })
+
+def prefetched(ticker, name, loader):
+    """미리 시작한 요청의 결과만 기다려 반환 (없거나, 실패했거나, 풀이 밀려 아직 시작하지 않았으면 loader로 직접 조회)"""
+    prefetch = st.session_state.get('prefetch')
+    if prefetch is not None and prefetch[0] == ticker and name in prefetch[1]:
+        future = prefetch[1][name]
+        # 대기열에 남아 있는 요청은 취소하고 직접 조회 (다른 세션 작업 뒤에서 기다리지 않음)
+        if not future.running() and future.cancel():
+            return loader()
+        try:
+            return future.result()
+        except Exception:
+            pass
+    return loader()
+
+# 헬퍼 함수: 세션 단위 데이터 메모이제이션
+def session_cached(ticker, name, loader):
+    """세션 동안 종목별 데이터를 한 번만 조회 (미리 시작한 요청이 있으면 그 결과를 사용)"""
+    cache = st.session_state.setdefault('data_cache', {})
+    key = (ticker, name)
+    get_tracer().count('session', hit=key in cache)
+    if key not in cache:
+        cache[key] = prefetched(ticker, name, loader)
+    return cache[key]
+
+# 헬퍼 함수: 세션에 로드된 가장 긴 주가 이력에서 구간 잘라내기
+@traced('load.price_history', 'load')
+def load_price_history(ticker, start_date, end_date, interval='1d'):
+    """[start_date, end_date) 주가 조회 - 이미 로드된 더 긴 이력이 있으면 새 요청 없이 슬라이스"""
+    start_date, end_date = to_date(start_date), to_date(end_date)
+    histories = st.session_state.setdefault('price_history', {})
+    loaded = histories.get((ticker, interval))
+    
+    if loaded is not None:
+        loaded_start, loaded_end, loaded_data, loaded_at = loaded
+        is_fresh = time.time() - loaded_at <= INTRADAY_TTL.total_seconds()
+        if loaded_start <= start_date and end_date <= loaded_end and is_fresh:
+            data = loaded_data.loc[
+                (loaded_data.index >= pd.Timestamp(start_date)) & (loaded_data.index < pd.Timestamp(end_date))
+            ]
+            if not data.empty:
+                get_tracer().count('price_history', hit=True)
+                return data, None
+    
+    get_tracer().count('price_history', hit=False)
+    data, error_msg = safe_download(ticker, start_date=start_date, end_date=end_date, interval=interval)
+    
+    # 더 긴 구간을 받은 경우에만 교체
+    if data is not None and (
+        loaded is None
+        or (end_date - start_date) >= (loaded[1] - loaded[0])
+        or time.time() - loaded[3] > INTRADAY_TTL.total_seconds()
+    ):
+        histories[(ticker, interval)] = (start_date, end_date, data, time.time())
+    
+    return data, error_msg
+
+# 세션 상태 초기화: 포트폴리오 저장소
+if 'portfolio' not in st.session_state:
+    st.session_state.portfolio = PortfolioStore()
 
-# 탭 생성
+# 종목 선택 시 모든 메뉴의 데이터를 미리 요청하고, 사이드바는 info 요청만 대기
+if ticker:
+    start_prefetch(ticker)
+    with st.sidebar:
+        try:
+            prefetched(ticker, 'info', lambda: None)
+            if is_valid_info(get_ticker_info(ticker)):
+                st.sidebar.success(f"✅ {ticker} 로드 완료")
+            else:
+                st.sidebar.error(f"❌ 종목을 찾을 수 없습니다")
+        except Exception as e:
+            st.sidebar.error(f"❌ 종목을 찾을 수 없습니다")
+
+# 메뉴 생성
 if ticker:
     try:
-        info = yf.Ticker(ticker)
-        
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
-            ["📈 홈", "📊 주가차트", "💰 배당분석", "🏢 회사정보", "📑 재무제표", "💼 포트폴리오"]
-        )
+        # 선택된 메뉴만 실행 (st.tabs는 모든 탭 본문을 매번 실행하므로 사용하지 않음)
+        SECTIONS = ["📈 홈", "📊 주가차트", "💰 배당분석", "🏢 회사정보", "📑 재무제표", "💼 포트폴리오", "🔎 스크리너"]
+        section = st.radio("메뉴", SECTIONS, horizontal=True, key="section", label_visibility="collapsed")
         
         # ============ TAB 1: 홈 ============
-        with tab1:
+        if section == SECTIONS[0]:
             st.subheader(f"{ticker} - 기본 정보")
             
-            company_info = info.info
+            company_info = get_ticker_info(ticker)
             
             # 메트릭 카드
             col1, col2, col3, col4 = st.columns(4)
@@ -287,74 +965,86 @@ if ticker:
                 st.info("회사 소개 정보가 없습니다.")
         
         # ============ TAB 2: 주가 차트 ============
-        with tab2:
+        if section == SECTIONS[1]:
             st.subheader("📈 주가 차트 분석")
             
-            # 설정 - 탭 방식으로 기간 선택
-            tab_preset, tab_custom = st.tabs(["⏱️ 기간 선택", "📅 날짜 직접 선택"])
+            # 설정 - 기간 선택 방식 (선택된 방식 하나만 조회)
+            range_mode = st.radio("기간 선택 방식", ["⏱️ 기간 선택", "📅 날짜 직접 선택"], horizontal=True, key='range_mode')
+            use_custom = range_mode == "📅 날짜 직접 선택"
             
-            with tab_preset:
-                st.write("**기본 기간 선택:**")
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    period = st.selectbox('기간', ['1개월', '3개월', '6개월', '1년', '5년', '10년'], key='period')
-                
-                with col2:
-                    ma_20 = st.checkbox('20일 이동평균선', value=True)
-                
-                with col3:
-                    ma_50 = st.checkbox('50일 이동평균선', value=True)
-                
-                period_map = {
-                    '1개월': '1mo',
-                    '3개월': '3mo',
-                    '6개월': '6mo',
-                    '1년': '1y',
-                    '5년': '5y',
-                    '10년': '10y'
-                }
-                
-                # 데이터 수집
-                st.info(f"📊 {ticker} 데이터 로딩 중...")
-                data, error_msg = safe_download(ticker, period=period_map[period])
-                
-                use_custom = False
+            interval_map = {
+                '1일': '1d',
+                '1시간': '1h',
+                '30분': '30m',
+                '15분': '15m',
+                '5분': '5m',
+                '1분': '1m'
+            }
+            interval_label = st.selectbox('봉 간격', list(interval_map.keys()), key='interval')
+            interval = interval_map[interval_label]
             
-            with tab_custom:
+            period_map = {
+                '1개월': '1mo',
+                '3개월': '3mo',
+                '6개월': '6mo',
+                '1년': '1y',
+                '5년': '5y',
+                '10년': '10y'
+            }
+            
+            if not use_custom:
+                st.write("**기본 기간 선택:**")
+                period = st.selectbox('기간', ['1개월', '3개월', '6개월', '1년', '5년', '10년'], key='period')
+                start_date, end_date = period_to_range(period_map[period])
+            else:
                 st.write("**날짜 범위 직접 선택:**")
                 col1, col2 = st.columns(2)
                 
-                # 기본값: 1년 전부터 오늘까지
-                end_date = datetime.now().date()
-                start_date = (datetime.now() - timedelta(days=365)).date()
-                
                 with col1:
                     start_date = st.date_input(
                         '시작 날짜',
-                        value=start_date,
+                        value=(datetime.now() - timedelta(days=365)).date(),  # 기본값: 1년 전부터 오늘까지
                         key='start_date'
                     )
                 
                 with col2:
                     end_date = st.date_input(
                         '종료 날짜',
-                        value=end_date,
+                        value=datetime.now().date(),
                         key='end_date'
                     )
-                
-                # 이동평균선 옵션
-                col1, col2 = st.columns(2)
-                with col1:
-                    ma_20 = st.checkbox('20일 이동평균선', value=True, key='ma20_custom')
-                with col2:
-                    ma_50 = st.checkbox('50일 이동평균선', value=True, key='ma50_custom')
-                
-                # 데이터 수집
-                st.info(f"📊 {ticker} 데이터 로딩 중 ({start_date} ~ {end_date})...")
-                data, error_msg = safe_download(ticker, start_date=start_date, end_date=end_date)
-                
-                use_custom = True
+            
+            # 분/시간봉은 야후 파이낸스가 제공하는 최근 기간으로 제한
+            if interval != '1d':
+                earliest = datetime.now().date() - timedelta(days=INTRADAY_LOOKBACK_DAYS[interval])
+                if to_date(start_date) < earliest:
+                    st.info(f"ℹ️ {interval_label} 봉은 최근 {INTRADAY_LOOKBACK_DAYS[interval]}일만 제공되어 {earliest}부터 조회합니다.")
+                    start_date = earliest
+            
+            # 이동평균선 옵션
+            col1, col2 = st.columns(2)
+            with col1:
+                ma_20 = st.checkbox('20일 이동평균선', value=True, key='ma20')
+            with col2:
+                ma_50 = st.checkbox('50일 이동평균선', value=True, key='ma50')
+            
+            # 보조 지표 옵션
+            indicator_labels = st.multiselect('보조 지표', list(INDICATOR_OPTIONS.keys()), key='indicators')
+            chart_resolution = st.selectbox(
+                '차트 해상도', ['자동'] + chart_resolutions_for(interval), key=f'chart_resolution_{interval}',
+                help='자동: 기간이 길면 주봉/월봉으로 집계하여 차트 전송량을 일정하게 유지합니다'
+            )
+            live_update = st.checkbox(
+                '⚡ 실시간 지표 갱신', key='live_chart',
+                help=f'{LIVE_REFRESH_SECONDS}초마다 새 봉만 받아 지표를 증분 갱신합니다 (오늘까지 포함된 기간에서만 동작)'
+            )
+            
+            # 데이터 수집 (하나의 (시작, 종료) 조회)
+            st.info(f"📊 {ticker} 데이터 로딩 중 ({start_date} ~ {end_date})...")
+            # 미리 시작한 일봉 요청이 저장소에 기록될 때까지만 대기 (같은 구간 중복 요청 방지)
+            if interval == '1d':
+                prefetched(ticker, 'prices', lambda: None)
+            data, error_msg = load_price_history(ticker, start_date, end_date, interval)
             
             # 데이터 표시
             if error_msg or data is None:
@@ -417,33 +1107,70 @@ if ticker:
                         data_clean = data_clean.dropna(subset=['Open', 'High', 'Low', 'Close'])
                         
                         if len(data_clean) > 0:
-                            # Plotly 캔들스틱 차트
+                            # 표시 해상도 결정 (긴 기간은 주봉/월봉으로 집계)
+                            if chart_resolution == '자동':
+                                resolution = choose_chart_resolution(data_clean, interval)
+                            else:
+                                resolution = chart_resolution
+                            candles = data_clean if resolution == '원본' else resample_ohlc(data_clean, CHART_RESOLUTIONS[resolution][0])
+                            if len(candles) < len(data_clean):
+                                st.caption(f"📉 {len(data_clean):,}개 봉을 {len(candles):,}개 {resolution}으로 집계하여 표시합니다. (지표는 원본 봉 기준 계산)")
+                            
+                            # Plotly 캔들스틱 차트 (지표 계산을 포함한 figure 구성 시간 계측)
+                            figure_started = time.perf_counter()
                             fig = go.Figure(data=[go.Candlestick(
-                                x=data_clean.index,
-                                open=data_clean['Open'].values,
-                                high=data_clean['High'].values,
-                                low=data_clean['Low'].values,
-                                close=data_clean['Close'].values,
+                                x=candles.index,
+                                open=candles['Open'].values,
+                                high=candles['High'].values,
+                                low=candles['Low'].values,
+                                close=candles['Close'].values,
                                 name='주가'
                             )])
                             
+                            # 차트/지표 표시에 필요한 모든 지표를 한 번에 계산 (캐시된 지표는 재사용)
+                            metric_specs = [('rsi', 14), ('macd', 12, 26, 9), ('atr', 14), ('bollinger', 20, 2.0)]
+                            chart_specs = [('sma', 20), ('sma', 50)] + [INDICATOR_OPTIONS[label] for label in indicator_labels]
+                            indicators = get_indicators(ticker, data_clean, chart_specs + metric_specs)
+                            
                             # 이동평균선 추가
                             if ma_20 and len(data_clean) >= 20:
-                                ma20 = data_clean['Close'].rolling(window=20).mean()
                                 fig.add_trace(go.Scatter(
-                                    x=data_clean.index, y=ma20,
+                                    **line_points(data_clean.index, indicators[('sma', 20)]['sma']),
                                     mode='lines', name='20일 MA',
                                     line=dict(color='orange', width=2)
                                 ))
                             
                             if ma_50 and len(data_clean) >= 50:
-                                ma50 = data_clean['Close'].rolling(window=50).mean()
                                 fig.add_trace(go.Scatter(
-                                    x=data_clean.index, y=ma50,
+                                    **line_points(data_clean.index, indicators[('sma', 50)]['sma']),
                                     mode='lines', name='50일 MA',
                                     line=dict(color='blue', width=2)
                                 ))
                             
+                            # 가격 위에 겹쳐 그리는 보조 지표
+                            if 'EMA (20)' in indicator_labels:
+                                fig.add_trace(go.Scatter(
+                                    **line_points(data_clean.index, indicators[('ema', 20)]['ema']),
+                                    mode='lines', name='20일 EMA',
+                                    line=dict(color='purple', width=1.5)
+                                ))
+                            
+                            if '볼린저 밴드 (20, 2)' in indicator_labels:
+                                bands = indicators[('bollinger', 20, 2.0)]
+                                for band_name, band_label in [('upper', '볼린저 상단'), ('lower', '볼린저 하단')]:
+                                    fig.add_trace(go.Scatter(
+                                        **line_points(data_clean.index, bands[band_name]),
+                                        mode='lines', name=band_label,
+                                        line=dict(color='gray', width=1, dash='dot')
+                                    ))
+                            
+                            if 'VWAP' in indicator_labels:
+                                fig.add_trace(go.Scatter(
+                                    **line_points(data_clean.index, indicators[('vwap',)]['vwap']),
+                                    mode='lines', name='VWAP',
+                                    line=dict(color='teal', width=1.5)
+                                ))
+                            
                             fig.update_layout(
                                 title=f'{ticker} 주가 차트',
                                 yaxis_title='가격 ($)',
@@ -453,8 +1180,36 @@ if ticker:
                                 hovermode='x unified',
                                 xaxis_rangeslider_visible=False
                             )
+                            get_tracer().record('render.price_figure', 'render', figure_started, candles=len(candles))
                             
-                            st.plotly_chart(fig, use_container_width=True)
+                            show_chart(fig, use_container_width=True)
+                            
+                            # 별도 패널에 그리는 보조 지표
+                            oscillator_panels = {
+                                'RSI (14)': [('rsi', 'RSI')],
+                                'MACD (12, 26, 9)': [('macd', 'MACD'), ('signal', '시그널'), ('hist', '히스토그램')],
+                                'ATR (14)': [('atr', 'ATR')],
+                                '스토캐스틱 (14, 3)': [('k', '%K'), ('d', '%D')],
+                                'OBV': [('obv', 'OBV')],
+                            }
+                            for label in indicator_labels:
+                                if label not in oscillator_panels:
+                                    continue
+                                values = indicators[INDICATOR_OPTIONS[label]]
+                                fig_indicator = go.Figure()
+                                for name, trace_label in oscillator_panels[label]:
+                                    if name == 'hist':
+                                        fig_indicator.add_trace(go.Bar(**line_points(data_clean.index, values[name]), name=trace_label, marker_color='lightgray'))
+                                    else:
+                                        fig_indicator.add_trace(go.Scatter(**line_points(data_clean.index, values[name]), mode='lines', name=trace_label))
+                                fig_indicator.update_layout(
+                                    title=label,
+                                    template='plotly_white',
+                                    height=250,
+                                    hovermode='x unified',
+                                    margin=dict(t=40, b=20)
+                                )
+                                show_chart(fig_indicator, use_container_width=True)
                             
                             # 기술 지표
                             st.subheader("📊 기술 지표")
@@ -490,13 +1245,38 @@ if ticker:
                                 except:
                                     st.metric("평균 가격", "N/A")
                             
+                            def last_value(values):
+                                value = values[-1] if len(values) else np.nan
+                                return None if np.isnan(value) else float(value)
+                            
+                            col1, col2, col3, col4 = st.columns(4)
+                            indicator_metrics = [
+                                (col1, "RSI (14)", last_value(indicators[('rsi', 14)]['rsi']), "{:.1f}"),
+                                (col2, "MACD 히스토그램", last_value(indicators[('macd', 12, 26, 9)]['hist']), "{:.2f}"),
+                                (col3, "ATR (14)", last_value(indicators[('atr', 14)]['atr']), "${:.2f}"),
+                                (col4, "볼린저 %B", last_value(indicators[('bollinger', 20, 2.0)]['percent_b']), "{:.2f}"),
+                            ]
+                            for column, label, value, fmt in indicator_metrics:
+                                with column:
+                                    st.metric(label, fmt.format(value) if value is not None else "N/A")
+                            
+                            # 실시간 지표 (조회 구간이 오늘까지 포함할 때만)
+                            if live_update:
+                                if interval != '1d':
+                                    st.info("실시간 지표 갱신은 1일 봉에서만 사용할 수 있습니다.")
+                                elif to_date(end_date) >= datetime.now().date():
+                                    st.subheader("⚡ 실시간 지표")
+                                    render_live_indicators(ticker, data_clean)
+                                else:
+                                    st.info("실시간 갱신은 오늘 날짜까지 포함된 기간에서만 사용할 수 있습니다.")
+                            
                             # 최근 데이터 테이블
                             st.subheader("📋 최근 데이터 (최근 10거래일)")
                             display_data = data_clean.tail(10).iloc[::-1].copy()
                             for col in display_data.columns:
                                 if display_data[col].dtype in ['float64', 'float32']:
                                     display_data[col] = display_data[col].round(2)
-                            st.dataframe(display_data, use_container_width=True)
+                            show_dataframe(display_data, use_container_width=True)
                         else:
                             st.error("❌ 정제 후 데이터가 없습니다.")
                 
@@ -507,24 +1287,34 @@ if ticker:
                     st.info("다른 기간을 선택하거나 다시 시도해주세요.")
         
         # ============ TAB 3: 배당 분석 ============
-        with tab3:
+        if section == SECTIONS[2]:
             st.subheader("💰 배당금 분석")
             
-            dividends = info.dividends
+            # 세션에 고정하지 않고 공유 캐시에서 조회 (미리 요청이 진행 중이면 그 결과를 기다림)
+            # - 조회 실패로 받은 빈 이력은 캐시되지 않으므로 다음 실행에서 다시 요청하고, 새 배당은 캐시 만료 후 반영
+            dividends = get_dividends(ticker)
             
             if len(dividends) > 0:
+                # 마지막 배당 행이 같으면 캐시된 분석 결과 재사용
+                last_dividend = (len(dividends), dividends.index[-1], float(dividends.iloc[-1]))
+                stats = analyze_dividends(ticker, last_dividend, dividends)
+                events = stats['events']
+                
                 # 최근 배당금 테이블
                 st.subheader("📋 최근 배당 내역")
                 
-                div_df = pd.DataFrame({
-                    '날짜': dividends.index,
-                    '배당금 ($)': dividends.values
-                }).sort_index(ascending=False)
-                
-                # 배당금 반올림
-                div_df['배당금 ($)'] = pd.to_numeric(div_df['배당금 ($)'], errors='coerce').round(4)
-                
-                st.dataframe(div_df.head(20), use_container_width=True)
+                show_dataframe(
+                    events.iloc[::-1].head(20),
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        '날짜': st.column_config.DateColumn(format="YYYY-MM-DD"),
+                        '배당금': st.column_config.NumberColumn('배당금 ($)', format="%.4f"),
+                        'TTM 배당금': st.column_config.NumberColumn('TTM 배당금 ($)', format="%.4f"),
+                        '종가': st.column_config.NumberColumn('배당일 종가 ($)', format="%.2f"),
+                        'TTM 수익률(%)': st.column_config.NumberColumn(format="%.2f%%"),
+                    }
+                )
                 
                 # 배당금 시각화
                 st.subheader("📊 배당금 추이")
@@ -546,7 +1336,7 @@ if ticker:
                         height=400
                     )
                     
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_chart(fig, use_container_width=True)
                 except Exception as e:
                     st.error(f"배당금 차트 오류: {str(e)}")
                 
@@ -580,28 +1370,60 @@ if ticker:
                     div_count = len(dividends)
                     st.metric("배당 횟수", div_count)
                 
-                # 배당 성장률
-                if len(dividends) > 12:
-                    try:
-                        recent_12 = float(dividends.iloc[-12:].mean())
-                        if len(dividends) > 24:
-                            previous_12 = float(dividends.iloc[-24:-12].mean())
-                        else:
-                            previous_12 = recent_12
-                        
-                        growth = ((recent_12 - previous_12) / previous_12 * 100) if previous_12 > 0 else 0
-                        st.metric("연 배당 성장률 (YoY)", f"{growth:.2f}%")
-                    except:
-                        st.warning(f"배당 성장률 계산 불가")
+                # 수익률/성장률 (현재 배당률만 최신 종가로 매번 계산)
+                ttm_dividend = dividend_ttm(dividends)
+                try:
+                    latest_price = float(fetch_latest_prices([ticker]).get(ticker, np.nan))
+                except Exception:
+                    latest_price = np.nan
+                if np.isnan(latest_price):
+                    latest_price = float(events['종가'].iloc[-1])
+                
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("TTM 배당금", f"${ttm_dividend:.4f}")
+                with col2:
+                    st.metric("TTM 배당 수익률", format_percent(ttm_dividend / latest_price * 100 if latest_price > 0 else None))
+                with col3:
+                    st.metric("연 배당 성장률 (YoY)", format_percent(stats['growth_1y']))
+                with col4:
+                    st.metric("5년 배당 CAGR", format_percent(stats['cagr_5y']))
+                
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric("10년 배당 CAGR", format_percent(stats['cagr_10y']))
+                with col2:
+                    st.metric("연속 배당", f"{stats['paying_streak']}년")
+                with col3:
+                    st.metric("연속 배당 증가", f"{stats['growth_streak']}년")
+                with col4:
+                    st.metric("최근 1년 지급 횟수", int((dividends.index > pd.Timestamp.now() - pd.Timedelta(days=365)).sum()))
+                
+                # 배당 수익률 추이 (배당일 종가 기준)
+                yield_history = events.dropna(subset=['TTM 수익률(%)'])
+                if not yield_history.empty:
+                    st.subheader("📉 TTM 배당 수익률 추이")
+                    fig_yield = go.Figure()
+                    fig_yield.add_trace(go.Scatter(
+                        x=yield_history['날짜'],
+                        y=yield_history['TTM 수익률(%)'],
+                        mode='lines+markers',
+                        name='TTM 배당 수익률'
+                    ))
+                    fig_yield.update_layout(
+                        title=f'{ticker} TTM 배당 수익률 (배당일 종가 기준)',
+                        yaxis_title='수익률 (%)',
+                        xaxis_title='날짜',
+                        template='plotly_white',
+                        height=400
+                    )
+                    show_chart(fig_yield, use_container_width=True)
                 
                 # 연간 배당금 합계
                 st.subheader("💵 연간 배당금 합계")
                 
                 try:
-                    div_annual = pd.DataFrame({
-                        '년도': dividends.index.year,
-                        '배당금': dividends.values
-                    }).groupby('년도')['배당금'].sum()
+                    div_annual = stats['annual']
                     
                     fig_annual = go.Figure()
                     fig_annual.add_trace(go.Bar(
@@ -619,7 +1441,7 @@ if ticker:
                         height=400
                     )
                     
-                    st.plotly_chart(fig_annual, use_container_width=True)
+                    show_chart(fig_annual, use_container_width=True)
                 except Exception as e:
                     st.error(f"연간 배당금 시각화 오류: {str(e)}")
                 
@@ -627,10 +1449,10 @@ if ticker:
                 st.info("이 종목에 배당금 기록이 없습니다.")
         
         # ============ TAB 4: 회사 정보 ============
-        with tab4:
+        if section == SECTIONS[3]:
             st.subheader("🏢 회사 정보")
             
-            company_info = info.info
+            company_info = get_ticker_info(ticker)
             
             # 기본 정보
             st.subheader("📌 기본 정보")
@@ -688,7 +1510,7 @@ if ticker:
                     metric_display.append([key, 'Error'])
             
             metric_df = pd.DataFrame(metric_display, columns=['지표', '값'])
-            st.dataframe(metric_df, use_container_width=True)
+            show_dataframe(metric_df, use_container_width=True)
             
             # 회사 설명
             st.subheader("📝 회사 소개")
@@ -699,7 +1521,7 @@ if ticker:
                 st.info("회사 소개 정보가 없습니다.")
         
         # ============ TAB 5: 재무제표 ============
-        with tab5:
+        if section == SECTIONS[4]:
             st.subheader("📑 재무제표")
             
             statement_type = st.selectbox(
@@ -709,23 +1531,19 @@ if ticker:
             )
             
             period_type = st.radio('기간 선택', ['분기별', '연간'], horizontal=True)
+            prefix = 'quarterly_' if period_type == '분기별' else ''
             
             try:
+                # 6종 재무제표를 한 번에 로드 (숫자형으로 정규화된 상태)
+                statements = session_cached(ticker, 'statements', lambda: load_statements(ticker))
+                
                 if statement_type == '손익계산서':
                     st.subheader("📈 손익계산서 (Income Statement)")
                     
-                    if period_type == '분기별':
-                        income = info.quarterly_income_stmt
-                    else:
-                        income = info.income_stmt
+                    income = statements[prefix + 'income_stmt']
                     
                     if not income.empty:
-                        # 숫자 변환
-                        income_display = income.copy()
-                        for col in income_display.columns:
-                            income_display[col] = pd.to_numeric(income_display[col], errors='coerce')
-                        
-                        st.dataframe(income_display, use_container_width=True)
+                        show_dataframe(income, use_container_width=True)
                         
                         # 핵심 지표 시각화
                         if 'Total Revenue' in income.index:
@@ -734,7 +1552,7 @@ if ticker:
                             fig = go.Figure()
                             
                             try:
-                                revenue_values = pd.to_numeric(income.loc['Total Revenue'], errors='coerce')
+                                revenue_values = income.loc['Total Revenue']
                                 fig.add_trace(go.Scatter(
                                     x=range(len(income.columns)),
                                     y=revenue_values.values,
@@ -746,7 +1564,7 @@ if ticker:
                             
                             if 'Net Income' in income.index:
                                 try:
-                                    net_income_values = pd.to_numeric(income.loc['Net Income'], errors='coerce')
+                                    net_income_values = income.loc['Net Income']
                                     fig.add_trace(go.Scatter(
                                         x=range(len(income.columns)),
                                         y=net_income_values.values,
@@ -764,41 +1582,27 @@ if ticker:
                                 height=400
                             )
                             
-                            st.plotly_chart(fig, use_container_width=True)
+                            show_chart(fig, use_container_width=True)
                     else:
                         st.info("손익계산서 데이터를 찾을 수 없습니다.")
                 
                 elif statement_type == '대차대조표':
                     st.subheader("🏦 대차대조표 (Balance Sheet)")
                     
-                    if period_type == '분기별':
-                        balance = info.quarterly_balance_sheet
-                    else:
-                        balance = info.balance_sheet
+                    balance = statements[prefix + 'balance_sheet']
                     
                     if not balance.empty:
-                        balance_display = balance.copy()
-                        for col in balance_display.columns:
-                            balance_display[col] = pd.to_numeric(balance_display[col], errors='coerce')
-                        
-                        st.dataframe(balance_display, use_container_width=True)
+                        show_dataframe(balance, use_container_width=True)
                     else:
                         st.info("대차대조표 데이터를 찾을 수 없습니다.")
                 
                 elif statement_type == '현금흐름표':
                     st.subheader("💵 현금흐름표 (Cash Flow Statement)")
                     
-                    if period_type == '분기별':
-                        cashflow = info.quarterly_cashflow
-                    else:
-                        cashflow = info.cashflow
+                    cashflow = statements[prefix + 'cashflow']
                     
                     if not cashflow.empty:
-                        cashflow_display = cashflow.copy()
-                        for col in cashflow_display.columns:
-                            cashflow_display[col] = pd.to_numeric(cashflow_display[col], errors='coerce')
-                        
-                        st.dataframe(cashflow_display, use_container_width=True)
+                        show_dataframe(cashflow, use_container_width=True)
                     else:
                         st.info("현금흐름표 데이터를 찾을 수 없습니다.")
             
@@ -806,7 +1610,7 @@ if ticker:
                 st.error(f"재무제표 오류: {str(e)}")
         
         # ============ TAB 6: 포트폴리오 ============
-        with tab6:
+        if section == SECTIONS[5]:
             st.subheader("💼 포트폴리오 - 투자 수익률 계산")
             
             st.write("### 📝 매매 기록 입력")
@@ -817,7 +1621,7 @@ if ticker:
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                buy_ticker = st.text_input("종목 티커", placeholder="AAPL", key="buy_ticker_input")
+                buy_ticker = st.text_input("종목 티커", placeholder="AAPL", key="buy_ticker_input").strip().upper()
             
             with col2:
                 buy_date = st.date_input("매수 날짜", key="buy_date_input")
@@ -837,31 +1641,10 @@ if ticker:
                                 quantity = st.number_input("주식 수", min_value=1, step=1, key="quantity_input_1")
                             
                             if quantity > 0:
-                                try:
-                                    # 현재 가격 가져오기
-                                    current_ticker = yf.Ticker(buy_ticker)
-                                    current_price = current_ticker.info.get('currentPrice', None)
-                                    
-                                    if current_price and not pd.isna(current_price):
-                                        current_price = float(current_price)
-                                        entry = {
-                                            '종목': buy_ticker,
-                                            '매수날짜': buy_date,
-                                            '매수가': manual_price,
-                                            '현재가': current_price,
-                                            '수량': quantity,
-                                            '매수액': manual_price * quantity,
-                                            '현재가치': current_price * quantity,
-                                            '수익/손실': (current_price - manual_price) * quantity,
-                                            '수익률(%)': ((current_price - manual_price) / manual_price * 100)
-                                        }
-                                        st.session_state.portfolio_data.append(entry)
-                                        st.success(f"✅ {buy_ticker} 매매 기록이 추가되었습니다!")
-                                        st.rerun()
-                                    else:
-                                        st.error(f"❌ {buy_ticker}의 현재 가격을 가져올 수 없습니다.")
-                                except Exception as e:
-                                    st.error(f"❌ 오류: {str(e)}")
+                                # 포지션만 저장 (평가는 표시할 때 계산)
+                                st.session_state.portfolio.append(buy_ticker, buy_date, manual_price, quantity)
+                                st.success(f"✅ {buy_ticker} 매매 기록이 추가되었습니다!")
+                                st.rerun()
                             else:
                                 st.warning("⚠️ 주식 수를 입력해주세요.")
                         else:
@@ -896,60 +1679,111 @@ if ticker:
                     with col_btn:
                         if st.button("➕ 추가", use_container_width=True, key="add_portfolio_auto_btn"):
                             if buy_ticker and st.session_state.closing_price > 0 and quantity > 0:
-                                try:
-                                    # 현재 가격 가져오기
-                                    current_ticker = yf.Ticker(buy_ticker)
-                                    current_price = current_ticker.info.get('currentPrice', None)
-                                    
-                                    if current_price and not pd.isna(current_price):
-                                        current_price = float(current_price)
-                                        entry = {
-                                            '종목': buy_ticker,
-                                            '매수날짜': buy_date,
-                                            '매수가': st.session_state.closing_price,
-                                            '현재가': current_price,
-                                            '수량': quantity,
-                                            '매수액': st.session_state.closing_price * quantity,
-                                            '현재가치': current_price * quantity,
-                                            '수익/손실': (current_price - st.session_state.closing_price) * quantity,
-                                            '수익률(%)': ((current_price - st.session_state.closing_price) / st.session_state.closing_price * 100)
-                                        }
-                                        st.session_state.portfolio_data.append(entry)
-                                        st.success(f"✅ {buy_ticker} 매매 기록이 추가되었습니다!")
-                                        st.session_state.closing_price = 0.0
-                                        st.session_state.closing_price_found = False
-                                        st.rerun()
-                                    else:
-                                        st.error(f"❌ {buy_ticker}의 현재 가격을 가져올 수 없습니다.")
-                                except Exception as e:
-                                    st.error(f"❌ 오류: {str(e)}")
+                                # 포지션만 저장 (평가는 표시할 때 계산)
+                                st.session_state.portfolio.append(buy_ticker, buy_date, st.session_state.closing_price, quantity)
+                                st.success(f"✅ {buy_ticker} 매매 기록이 추가되었습니다!")
+                                st.session_state.closing_price = 0.0
+                                st.session_state.closing_price_found = False
+                                st.rerun()
                             else:
                                 st.warning("⚠️ 모든 필드를 올바르게 입력해주세요.")
             
+            # 매매 기록 일괄 가져오기
+            with st.expander("📂 매매 기록 일괄 가져오기 (CSV/Excel)"):
+                st.caption("필수 컬럼: 종목(ticker), 매수날짜(date), 수량(quantity) / 선택 컬럼: 매수가(price) - 비어 있으면 해당 날짜 종가로 자동 입력")
+                trade_file = st.file_uploader("매매 기록 파일", type=['csv', 'xlsx', 'xls'], key="trade_file")
+                
+                if trade_file is not None and st.button("📥 가져오기", use_container_width=True, key="import_trades_btn"):
+                    try:
+                        with st.spinner("종가 조회 중..."):
+                            trades = fill_closing_prices(read_trade_file(trade_file))
+                        
+                        valid = (
+                            trades['종목'].str.len().gt(0)
+                            & trades['매수날짜'].notna()
+                            & trades['매수가'].gt(0)
+                            & trades['수량'].gt(0)
+                        )
+                        imported = trades[valid]
+                        st.session_state.portfolio.extend(
+                            imported['종목'], imported['매수날짜'], imported['매수가'], imported['수량']
+                        )
+                        
+                        st.success(f"✅ {len(imported):,}개 매매 기록을 가져왔습니다.")
+                        if (~valid).any():
+                            st.warning(f"⚠️ {int((~valid).sum()):,}개 행은 종가를 찾지 못했거나 값이 올바르지 않아 제외했습니다.")
+                            show_dataframe(trades[~valid].head(20), use_container_width=True)
+                    except ImportError:
+                        # 이전 엑셀 형식(.xls)은 openpyxl이 아닌 xlrd로 읽음
+                        package = 'xlrd' if trade_file.name.lower().endswith('.xls') else 'openpyxl'
+                        st.error(f"❌ 엑셀 파일을 읽으려면 `pip install {package}`이 필요합니다.")
+                    except Exception as e:
+                        st.error(f"❌ 가져오기 오류: {str(e)}")
+            
             # 포트폴리오 데이터 표시
             st.write("---")
             
-            if len(st.session_state.portfolio_data) > 0:
+            if len(st.session_state.portfolio) > 0:
                 st.write("### 📊 포트폴리오 현황")
                 
-                # 데이터프레임 생성
-                portfolio_df = pd.DataFrame(st.session_state.portfolio_data)
+                # 현재가 갱신 주기
+                col_refresh, col_refresh_btn = st.columns([3, 1])
+                with col_refresh:
+                    refresh_label = st.selectbox(
+                        "현재가 갱신 주기", list(PRICE_REFRESH_OPTIONS.keys()), index=2, key="price_refresh_interval"
+                    )
+                with col_refresh_btn:
+                    st.write("")
+                    if st.button("🔄 지금 갱신", use_container_width=True, key="price_refresh_btn"):
+                        st.session_state.price_refresh_nonce = st.session_state.get('price_refresh_nonce', 0) + 1
+                
+                # 포지션 데이터프레임 생성 후 전 종목 일괄 평가
+                portfolio = st.session_state.portfolio
+                positions_df = portfolio.to_frame()
+                try:
+                    prices = fetch_latest_prices(
+                        portfolio.symbols(), refresh_seconds=PRICE_REFRESH_OPTIONS[refresh_label]
+                    )
+                except Exception as e:
+                    st.warning(f"⚠️ 현재가 조회 실패: {str(e)}")
+                    prices = pd.Series(dtype=float)
+                portfolio_df = revalue_portfolio(positions_df, prices)
+                
+                missing = portfolio_df.loc[portfolio_df['현재가'].isna(), '종목'].unique()
+                if len(missing) > 0:
+                    st.warning(f"⚠️ 현재가를 가져올 수 없는 종목: {', '.join(missing)}")
                 
-                # 포맷팅
-                display_df = portfolio_df.copy()
-                currency_cols = ['매수가', '현재가', '매수액', '현재가치', '수익/손실']
-                for col in currency_cols:
-                    display_df[col] = display_df[col].apply(lambda x: f"${x:,.2f}")
-                display_df['수익률(%)'] = display_df['수익률(%)'].apply(lambda x: f"{x:.2f}%")
+                # 포맷팅은 컬럼 설정으로 처리 (문자열 복사본을 만들지 않음)
+                currency_format = st.column_config.NumberColumn(format="$%.2f")
+                selection = show_dataframe(
+                    portfolio_df,
+                    use_container_width=True,
+                    column_config={
+                        '매수날짜': st.column_config.DateColumn(format="YYYY-MM-DD"),
+                        '매수가': currency_format,
+                        '현재가': currency_format,
+                        '수량': st.column_config.NumberColumn(format="%g"),
+                        '매수액': currency_format,
+                        '현재가치': currency_format,
+                        '수익/손실': currency_format,
+                        '수익률(%)': st.column_config.NumberColumn(format="%.2f%%"),
+                    },
+                    on_select="rerun",
+                    selection_mode="multi-row",
+                    key=f"portfolio_table_{st.session_state.get('portfolio_version', 0)}"
+                )
                 
-                st.dataframe(display_df, use_container_width=True)
+                selected_rows = selection.selection.rows
+                if selected_rows and st.button(f"🗑️ 선택한 {len(selected_rows)}개 기록 삭제", key="delete_rows_btn"):
+                    portfolio.delete_rows(selected_rows)
+                    # 행 번호가 바뀌므로 표 선택 상태 초기화
+                    st.session_state.portfolio_version = st.session_state.get('portfolio_version', 0) + 1
+                    st.rerun()
                 
-                # 포트폴리오 통계
+                # 포트폴리오 통계 (종목별 합계로 계산)
                 st.write("### 💰 포트폴리오 통계")
                 
-                total_investment = portfolio_df['매수액'].sum()
-                total_current_value = portfolio_df['현재가치'].sum()
-                total_profit_loss = portfolio_df['수익/손실'].sum()
+                total_investment, total_current_value, total_profit_loss = portfolio.totals(prices)
                 total_return_pct = (total_profit_loss / total_investment * 100) if total_investment > 0 else 0
                 
                 col1, col2, col3, col4 = st.columns(4)
@@ -966,14 +1800,70 @@ if ticker:
                 with col4:
                     st.metric("총 수익률", f"{total_return_pct:.2f}%")
                 
+                # 포트폴리오 추이 (첫 매수일부터 일별 평가액/수익률/낙폭)
+                st.write("### 📉 포트폴리오 추이")
+                
+                try:
+                    # 첫 매수일이 휴장일이어도 직전 종가가 있도록 앞쪽 여유 기간 포함
+                    first_date = to_date(positions_df['매수날짜'].min()) - timedelta(days=ASOF_WINDOW_DAYS)
+                    with st.spinner("종가 이력 조회 중..."):
+                        closes = load_close_matrix(
+                            tuple(sorted(portfolio.symbols())), first_date, datetime.now().date() + timedelta(days=1)
+                        )
+                    series = portfolio_timeseries(positions_df, closes) if not closes.empty else pd.DataFrame()
+                    
+                    missing = sorted(set(portfolio.symbols()) - set(closes.columns))
+                    if missing:
+                        st.warning(f"⚠️ 종가 이력을 가져올 수 없어 추이에서 제외된 종목: {', '.join(missing)}")
+                    
+                    if not series.empty:
+                        summary = timeseries_summary(series)
+                        col1, col2, col3, col4 = st.columns(4)
+                        with col1:
+                            st.metric("누적 수익률 (TWR)", format_percent(summary['twr']))
+                        with col2:
+                            st.metric("연환산 수익률", format_percent(summary['annualized']))
+                        with col3:
+                            st.metric("최대 낙폭 (MDD)", format_percent(summary['max_drawdown']))
+                        with col4:
+                            st.metric("연환산 변동성", format_percent(summary['volatility']))
+                        
+                        fig = go.Figure()
+                        fig.add_trace(go.Scatter(**line_points(series.index, series['평가액'].to_numpy()), mode='lines', name='평가액', line=dict(color='green', width=1.5)))
+                        fig.add_trace(go.Scatter(**line_points(series.index, series['투자원금'].to_numpy()), mode='lines', name='투자원금', line=dict(color='gray', width=1, dash='dash')))
+                        fig.update_layout(
+                            title='일별 평가액 vs 투자원금',
+                            yaxis_title='금액 ($)',
+                            xaxis_title='날짜',
+                            template='plotly_white',
+                            height=400,
+                            hovermode='x unified'
+                        )
+                        show_chart(fig, use_container_width=True)
+                        
+                        fig = go.Figure()
+                        fig.add_trace(go.Scatter(**line_points(series.index, series['누적 수익률(%)'].to_numpy()), mode='lines', name='누적 수익률 (TWR)', line=dict(color='blue', width=1.5)))
+                        fig.add_trace(go.Scatter(**line_points(series.index, series['낙폭(%)'].to_numpy()), mode='lines', name='낙폭', fill='tozeroy', line=dict(color='red', width=1)))
+                        fig.update_layout(
+                            title='누적 수익률과 낙폭',
+                            yaxis_title='%',
+                            xaxis_title='날짜',
+                            template='plotly_white',
+                            height=350,
+                            hovermode='x unified'
+                        )
+                        show_chart(fig, use_container_width=True)
+                except Exception as e:
+                    st.warning(f"⚠️ 포트폴리오 추이 계산 실패: {str(e)}")
+                
                 # 종목별 수익률 차트
                 st.write("### 📈 종목별 수익률")
                 
                 fig = go.Figure(data=[
                     go.Bar(
-                        x=display_df['종목'],
+                        x=portfolio_df['종목'],
                         y=portfolio_df['수익률(%)'],
-                        marker_color=['green' if x >= 0 else 'red' for x in portfolio_df['수익률(%)']]
+                        marker_color=np.where(portfolio_df['수익률(%)'] >= 0, 'green', 'red')
                     )
                 ])
                 
@@ -985,14 +1875,14 @@ if ticker:
                     height=400
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
                 
                 # 매수액 vs 현재가치 비교
                 st.write("### 💵 매수액 vs 현재 가치")
                 
                 fig = go.Figure(data=[
-                    go.Bar(name='매수액', x=display_df['종목'], y=portfolio_df['매수액'], marker_color='lightblue'),
-                    go.Bar(name='현재가치', x=display_df['종목'], y=portfolio_df['현재가치'], marker_color='lightgreen')
+                    go.Bar(name='매수액', x=portfolio_df['종목'], y=portfolio_df['매수액'], marker_color='lightblue'),
+                    go.Bar(name='현재가치', x=portfolio_df['종목'], y=portfolio_df['현재가치'], marker_color='lightgreen')
                 ])
                 
                 fig.update_layout(
@@ -1004,18 +1894,144 @@ if ticker:
                     barmode='group'
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
+                
+                # 예상 배당 수익 (종목별 최근 1년 주당 배당금 기준)
+                st.write("### 💵 예상 배당 수익")
+                
+                try:
+                    income_df = project_dividend_income(positions_df, prices)
+                    total_income = float(np.nansum(income_df['예상 연 배당금']))
+                    
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("예상 연 배당금", f"${total_income:,.2f}")
+                    with col2:
+                        yield_on_cost = total_income / total_investment * 100 if total_investment > 0 else 0
+                        st.metric("매수가 대비 배당률", f"{yield_on_cost:.2f}%")
+                    with col3:
+                        current_yield = total_income / total_current_value * 100 if total_current_value > 0 else 0
+                        st.metric("현재 배당률", f"{current_yield:.2f}%")
+                    
+                    show_dataframe(
+                        income_df,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            '수량': st.column_config.NumberColumn(format="%g"),
+                            '매수액': currency_format,
+                            '주당 배당금(TTM)': st.column_config.NumberColumn(format="$%.4f"),
+                            '예상 연 배당금': currency_format,
+                            '매수가 대비 배당률(%)': st.column_config.NumberColumn(format="%.2f%%"),
+                            '현재 배당률(%)': st.column_config.NumberColumn(format="%.2f%%"),
+                        }
+                    )
+                except Exception as e:
+                    st.warning(f"⚠️ 배당 정보 조회 실패: {str(e)}")
                 
                 # 삭제 옵션
                 st.write("### 🗑️ 기록 관리")
                 if st.button("🗑️ 전체 기록 삭제", use_container_width=True, key="delete_portfolio_btn"):
-                    st.session_state.portfolio_data = []
+                    st.session_state.portfolio.clear()
                     st.session_state.closing_price = 0.0
                     st.session_state.closing_price_found = False
                     st.success("✅ 모든 기록이 삭제되었습니다!")
                     st.rerun()
             else:
                 st.info("📌 위에서 매매 기록을 입력하면 포트폴리오가 표시됩니다. (현재: 비어있음)")
+        
+        # ============ TAB 7: 스크리너 ============
+        if section == SECTIONS[6]:
+            st.subheader("🔎 종목 스크리너")
+            st.caption("종목 목록 파일(CSV/Excel/텍스트)을 올리거나 직접 입력하면 모든 종목의 지표를 동시에 조회해 조건에 맞는 종목을 찾습니다.")
+            
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                universe_file = st.file_uploader("종목 목록 파일", type=['csv', 'xlsx', 'xls', 'txt'], key="universe_file")
+            with col2:
+                numeric_suffix = st.selectbox(
+                    "숫자 코드 시장",
+                    ['.KS', '.KQ'],
+                    format_func=lambda suffix: {'.KS': '코스피 (.KS)', '.KQ': '코스닥 (.KQ)'}[suffix],
+                    key="universe_suffix"
+                )
+            universe_text = st.text_area(
+                "또는 종목 직접 입력 (쉼표/공백 구분)",
+                value="AAPL, MSFT, GOOGL, AMZN, NVDA, META, TSLA, JPM, KO, PG",
+                key="universe_text"
+            )
+            
+            table = None
+            try:
+                if universe_file is not None:
+                    symbols = read_universe_file(universe_file, numeric_suffix)
+                else:
+                    symbols = parse_universe(universe_text, numeric_suffix)
+                
+                if len(symbols) > SCREENER_MAX_SYMBOLS:
+                    st.warning(f"⚠️ 최대 {SCREENER_MAX_SYMBOLS}개 종목까지만 조회합니다.")
+                    symbols = symbols[:SCREENER_MAX_SYMBOLS]
+                
+                if symbols:
+                    table = get_universe_metrics(tuple(symbols))
+            except Exception as e:
+                st.error(f"❌ 종목 목록을 읽을 수 없습니다: {str(e)}")
+            
+            if table is not None and not table.empty:
+                st.caption(f"{len(symbols)}개 중 {len(table)}개 종목 조회됨")
+                
+                # 조건 (0이면 제한 없음)
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    max_pe = st.number_input("최대 P/E", min_value=0.0, value=0.0, step=1.0, key="screen_max_pe")
+                with col2:
+                    min_yield = st.number_input("최소 배당 수익률(%)", min_value=0.0, value=0.0, step=0.5, key="screen_min_yield")
+                with col3:
+                    min_cap = st.number_input("최소 시가총액 (십억 $)", min_value=0.0, value=0.0, step=10.0, key="screen_min_cap")
+                with col4:
+                    min_roe = st.number_input("최소 ROE (%)", min_value=0.0, value=0.0, step=5.0, key="screen_min_roe")
+                
+                col1, col2, col3 = st.columns([2, 2, 1])
+                with col1:
+                    sectors = st.multiselect("섹터", sorted(table['섹터'].dropna().unique()), key="screen_sectors")
+                with col2:
+                    sort_by = st.selectbox("정렬 기준", list(SCREENER_METRICS.values()), key="screen_sort")
+                with col3:
+                    ascending = st.checkbox("오름차순", value=False, key="screen_ascending")
+                if len(table) > 5:
+                    limit = st.slider("표시할 종목 수", min_value=5, max_value=len(table), value=min(50, len(table)), key="screen_limit")
+                else:
+                    limit = len(table)
+                
+                bounds = {}
+                if max_pe > 0:
+                    bounds['P/E'] = (0.0, max_pe)  # 적자 기업(음수 P/E) 제외
+                if min_yield > 0:
+                    bounds['배당 수익률(%)'] = (min_yield, None)
+                if min_cap > 0:
+                    bounds['시가총액'] = (min_cap * 1e9, None)
+                if min_roe > 0:
+                    bounds['ROE'] = (min_roe / 100, None)
+                
+                result = screen_universe(table, bounds, sectors, sort_by, ascending, limit)
+                st.write(f"**조건에 맞는 종목: {len(result)}개**")
+                show_dataframe(
+                    result,
+                    use_container_width=True,
+                    hide_index=True,
+                    column_config={
+                        '시가총액': st.column_config.NumberColumn(format="$%.0f"),
+                        'P/E': st.column_config.NumberColumn(format="%.2f"),
+                        '선행 P/E': st.column_config.NumberColumn(format="%.2f"),
+                        'P/B': st.column_config.NumberColumn(format="%.2f"),
+                        '배당 수익률(%)': st.column_config.NumberColumn(format="%.2f%%"),
+                        'ROE': st.column_config.NumberColumn(format="%.3f"),
+                        '부채비율': st.column_config.NumberColumn(format="%.2f"),
+                        '베타': st.column_config.NumberColumn(format="%.2f"),
+                    }
+                )
+            elif table is not None:
+                st.info("조회된 종목이 없습니다. 티커를 확인해주세요.")
     
     except Exception as e:
         st.error(f"❌ 오류 발생: {str(e)}")
@@ -1035,3 +2051,64 @@ else:
     - 야후 파이낸스에서 지원하는 종목만 조회 가능합니다
     - 인터넷 연결을 확인하세요
     """)
+
+# 사이드바 - 성능 디버그 패널 (선택 시에만 표시, 캐시/요청 통계는 모든 세션 합계)
+get_tracer().record('script.run', 'script', script_started, section=st.session_state.get('section'))
+with st.sidebar:
+    if st.checkbox("🛠️ 성능 디버그 패널", key="debug_panel"):
+        tracer = get_tracer()
+        
+        st.write("**이번 실행**")
+        run_spans = tracer.run_spans(trace_run)
+        if not run_spans.empty:
+            columns = [column for column in ['name', 'duration_ms', 'bytes', 'target', 'thread'] if column in run_spans]
+            st.caption(f"전체 {(time.perf_counter() - script_started) * 1000:,.0f}ms · 구간 {len(run_spans)}개")
+            st.dataframe(
+                run_spans[columns],
+                use_container_width=True,
+                hide_index=True,
+                column_config={
+                    'duration_ms': st.column_config.NumberColumn('ms', format="%.1f"),
+                    'bytes': st.column_config.NumberColumn('bytes', format="%d"),
+                }
+            )
+        
+        st.write("**구간별 누적**")
+        st.dataframe(tracer.summary(), use_container_width=True, column_config={
+            column: st.column_config.NumberColumn(format="%.1f")
+            for column in ['total_ms', 'mean_ms', 'p95_ms', 'max_ms', 'payload_mb']
+        })
+        
+        st.write("**캐시 적중**")
+        shared_cache = get_shared_cache()
+        st.caption(
+            f"공유 캐시 항목 {len(shared_cache.entries)}개 · "
+            f"{shared_cache.total_bytes / 1024 / 1024:.1f}MB / {shared_cache.max_bytes / 1024 / 1024:.0f}MB"
+        )
+        cache_stats = pd.concat([
+            shared_cache.stats().rename(index=lambda dataset: f"shared:{dataset}"),
+            tracer.cache_stats(),
+        ])
+        st.dataframe(
+            cache_stats,
+            use_container_width=True,
+            column_config={'hit_rate': st.column_config.NumberColumn('적중률', format="%.1f%%")}
+        )
+        
+        scheduler_status = get_request_scheduler().status()
+        st.caption(
+            f"야후 요청 {scheduler_status['rate']:.1f}회/초 · 대기 {scheduler_status['waiting']}건 · "
+            f"429 {scheduler_status['throttled']}회 · 병합 {scheduler_status['deduplicated']}건"
+            + (f" · {scheduler_status['paused']:.0f}초 정지 중" if scheduler_status['paused'] > 0 else "")
+        )
+        
+        # 최대 TRACE_MAX_SPANS개 구간의 직렬화는 버튼을 눌렀을 때만 수행
+        st.download_button(
+            "📥 추적 파일 내보내기 (Chrome/Perfetto)",
+            tracer.chrome_trace,
+            file_name=f"stock-trace-{datetime.now():%Y%m%d-%H%M%S}.json",
+            mime='application/json',
+            use_container_width=True
+        )
+        if TRACE_LOG_PATH:
+            st.caption(f"구조화 로그: {TRACE_LOG_PATH}")
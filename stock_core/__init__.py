@@ -0,0 +1,4 @@
+"""주식 분석 대시보드의 Streamlit 비의존 핵심 모듈
+
+설정 값은 앱(stock_analysis.py)이 생성자 인자로 넘기며, 모듈 자체는 Streamlit 없이 임포트·테스트할 수 있다.
+"""
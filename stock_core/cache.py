@@ -0,0 +1,98 @@
+"""공유 캐시: 모든 세션이 같은 조회 결과를 사용하고 동시 요청은 한 번만 실행"""
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import pandas as pd
+
+from .tracing import estimate_size
+
+
+def shared_view(value):
+    """공유 결과를 세션에 넘길 때의 얕은 복사본 (컬럼/키 추가·교체가 다른 세션에 보이지 않도록)"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy(deep=False)
+    if isinstance(value, dict):
+        return {key: shared_view(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return tuple(shared_view(item) for item in value)
+    return value
+
+
+class SharedCache:
+    """프로세스 공유 캐시 - 같은 키의 동시 요청은 한 번만 실행(singleflight)하고, 메모리 한도를 넘으면 오래 안 쓴 항목부터 제거"""
+
+    COUNTERS = ['hits', 'misses', 'coalesced', 'errors', 'evictions']
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key -> (value, expires_at, size)
+        self.inflight = {}            # key -> 실행 중인 요청의 Future
+        self.total_bytes = 0
+        self.counts = {}              # 데이터 종류 -> {카운터: 횟수}
+
+    def _count(self, dataset, counter):
+        self.counts.setdefault(dataset, dict.fromkeys(self.COUNTERS, 0))[counter] += 1
+
+    def get(self, key, loader, ttl, cacheable=None):
+        """key[0]은 데이터 종류 - 유효한 항목이 있으면 반환, 같은 요청이 실행 중이면 그 결과를 대기, 아니면 직접 실행"""
+        dataset = key[0]
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self.entries.move_to_end(key)
+                self._count(dataset, 'hits')
+                return shared_view(entry[0])
+            
+            flight = self.inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.inflight[key] = Future()
+                self._count(dataset, 'misses')
+            else:
+                self._count(dataset, 'coalesced')
+        
+        if not leader:
+            return shared_view(flight.result())
+        
+        try:
+            value = loader()
+        except BaseException as e:
+            # 예외는 캐시하지 않고 대기 중인 요청에만 전달
+            with self.lock:
+                del self.inflight[key]
+                self._count(dataset, 'errors')
+            flight.set_exception(e)
+            raise
+        
+        with self.lock:
+            del self.inflight[key]
+            if cacheable is None or cacheable(value):
+                self._store(key, value, time.time() + ttl.total_seconds())
+        flight.set_result(value)
+        return shared_view(value)
+
+    def _store(self, key, value, expires_at):
+        """항목 저장 후 메모리 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거 (lock 보유 상태에서 호출)"""
+        size = estimate_size(value)
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[2]
+        if size > self.max_bytes:
+            return
+        self.entries[key] = (value, expires_at, size)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes:
+            old_key, (_, _, old_size) = self.entries.popitem(last=False)
+            self.total_bytes -= old_size
+            self._count(old_key[0], 'evictions')
+
+    def stats(self):
+        """데이터 종류별 적중/미스/병합/오류/제거 횟수와 적중률(%)"""
+        with self.lock:
+            stats = pd.DataFrame.from_dict(self.counts, orient='index', columns=self.COUNTERS)
+        requests = stats['hits'] + stats['misses'] + stats['coalesced']
+        # 병합된 요청도 네트워크 요청 없이 처리되었으므로 적중으로 계산
+        stats['hit_rate'] = (stats['hits'] + stats['coalesced']) / requests.where(requests > 0) * 100
+        return stats
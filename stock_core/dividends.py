@@ -0,0 +1,55 @@
+"""배당 분석 엔진: 배당 이벤트와 일봉을 as-of 병합해 TTM 수익률, 연간 합계, CAGR, 연속 기록을 한 번에 계산"""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+
+def trailing_streak(flags):
+    """마지막 원소부터 연속으로 True인 개수"""
+    flags = np.asarray(flags, dtype=bool)
+    misses = np.flatnonzero(~flags)
+    return len(flags) if len(misses) == 0 else len(flags) - 1 - int(misses[-1])
+
+def dividend_cagr(annual, years):
+    """완료된 연도 기준 연간 배당 합계의 years년 복리 성장률(%) - 기간이 부족하거나 시작 값이 0이면 None"""
+    if len(annual) <= years or annual.iloc[-1 - years] <= 0:
+        return None
+    return ((annual.iloc[-1] / annual.iloc[-1 - years]) ** (1 / years) - 1) * 100
+
+def compute_dividend_stats(dividends, prices, year):
+    """배당 이력과 일봉(None이면 종가/수익률 비움)으로 year년까지의 배당 분석 결과 계산"""
+    events = pd.DataFrame({
+        '날짜': dividends.index,
+        '배당금': dividends.to_numpy(dtype=float),
+        'TTM 배당금': dividends.rolling('365D').sum().to_numpy(),
+    })
+    if prices is not None:
+        closes = pd.DataFrame({
+            '날짜': prices.index.astype('datetime64[ns]'),
+            '종가': prices['Close'].to_numpy(dtype=float),
+        }).dropna()
+        events = pd.merge_asof(events, closes, on='날짜', direction='backward')
+    else:
+        events['종가'] = np.nan
+    events['TTM 수익률(%)'] = events['TTM 배당금'] / events['종가'] * 100
+    
+    # 연간 합계 (배당이 없던 해는 0, 진행 중인 올해는 성장률/연속 기록에서 제외)
+    annual = dividends.groupby(dividends.index.year).sum()
+    annual = annual.reindex(range(annual.index[0], year + 1), fill_value=0.0)
+    complete = annual.loc[:year - 1]
+    
+    return {
+        'events': events,
+        'annual': annual,
+        'growth_1y': dividend_cagr(complete, 1),
+        'cagr_5y': dividend_cagr(complete, 5),
+        'cagr_10y': dividend_cagr(complete, 10),
+        'paying_streak': trailing_streak(complete.to_numpy() > 0),
+        'growth_streak': trailing_streak(np.diff(complete.to_numpy()) > 0),
+    }
+
+def dividend_ttm(dividends, as_of=None):
+    """as_of(기본: 오늘) 이전 1년간 주당 배당금 합계"""
+    as_of = pd.Timestamp(as_of or datetime.now().date())
+    return float(dividends[(dividends.index > as_of - pd.Timedelta(days=365)) & (dividends.index <= as_of)].sum())
@@ -0,0 +1,40 @@
+"""차트 다운샘플링: OHLCV를 굵은 봉으로 집계하고, 선 그래프는 모양을 보존하며 점 개수 제한"""
+import numpy as np
+
+from .tracing import traced
+
+OHLCV_AGGREGATION = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Adj Close': 'last', 'Volume': 'sum'}
+
+
+@traced('transform.resample', 'transform')
+def resample_ohlc(data, rule):
+    """OHLCV를 pandas resample 규칙(rule)의 봉으로 집계 (봉이 없는 구간은 제외)"""
+    resampled = data.resample(rule).agg({col: how for col, how in OHLCV_AGGREGATION.items() if col in data.columns})
+    return resampled.dropna(subset=['Open', 'High', 'Low', 'Close'])
+
+
+def lttb_indices(x, y, threshold):
+    """Largest-Triangle-Three-Buckets 다운샘플링으로 남길 인덱스 선택 (모양 보존)"""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    
+    # 첫/마지막 점을 제외한 구간을 threshold-2개 버킷으로 나누고 버킷별 평균점을 미리 계산
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    counts = np.diff(edges)
+    mean_x = np.append(np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / counts, y[-1])
+    
+    selected = np.empty(threshold, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # 이전 선택점-후보점-다음 버킷 평균점이 이루는 삼각형 넓이가 가장 큰 점 선택
+        area = np.abs(
+            (x[previous] - mean_x[i + 1]) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (mean_y[i + 1] - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
@@ -0,0 +1,86 @@
+"""구간 다운로드: 같은 기간의 대체 요청을 동시에 보내고, 일시적 오류는 재시도하며, 존재하지 않는 종목은 일정 시간 기록"""
+import functools
+import time
+from concurrent.futures import as_completed
+
+from yfinance.exceptions import YFPricesMissingError, YFTickerMissingError, YFTzMissingError
+
+
+class RangeDownloader:
+    """가격 구간 다운로더 - fetch(ticker, interval, **window) 요청을 submit(func)으로 실행하고 먼저 성공한 결과 사용"""
+
+    def __init__(self, fetch, submit, max_attempts, backoff, unknown_ttl):
+        self.fetch = fetch
+        self.submit = submit
+        self.max_attempts = max_attempts
+        self.backoff = backoff            # 재시도 전 대기 시간(초), 시도마다 2배
+        self.unknown_ttl = unknown_ttl
+        self.unknown = {}                 # 존재하지 않는 것으로 확인된 종목 -> 기록 만료 시각
+
+    def is_unknown(self, ticker):
+        """최근에 존재하지 않는 종목으로 확인되었는지 확인"""
+        expires_at = self.unknown.get(ticker)
+        return expires_at is not None and expires_at > time.time()
+
+    def _mark_unknown(self, ticker):
+        self.unknown[ticker] = time.time() + self.unknown_ttl.total_seconds()
+
+    def download(self, ticker, start_date, end_date, errors, label, interval='1d', period=None):
+        """날짜 범위 [start_date, end_date) 다운로드 - period가 주어지면 같은 기간 요청과 동시에 보내 먼저 성공한 결과 사용"""
+        if self.is_unknown(ticker):
+            errors.append(f"{label} 실패: 존재하지 않는 종목입니다 ({ticker})")
+            return None
+        
+        windows = []
+        if start_date and end_date:
+            windows.append(dict(start=start_date, end=end_date))
+        if period:
+            windows.append(dict(period=period))
+        
+        for attempt in range(self.max_attempts):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            
+            futures = [
+                self.submit(functools.partial(self.fetch, ticker, interval, **window))
+                for window in windows
+            ]
+            retry = False
+            missing = 0  # 종목이 없을 때도 나는 오류(시간대 없음/가격 없음)로 실패한 요청 수
+            # 응답 시간 제한은 HTTP 요청 자체(공급자의 timeout)에만 적용
+            # (스케줄러 대기열·429 일시 정지 시간까지 포함하면 정상 요청도 시간 초과로 처리됨)
+            for future in as_completed(futures):
+                try:
+                    data = future.result()
+                except YFPricesMissingError:
+                    # 해당 기간에 거래가 없음 - 다시 요청해도 같은 결과
+                    missing += 1
+                    continue
+                except YFTzMissingError as e:
+                    # 시간대 조회 실패는 일시적인 네트워크 오류로도 발생하므로 마지막 시도까지 재시도
+                    errors.append(f"{label} 실패 ({attempt + 1}회차): {str(e)}")
+                    missing += 1
+                    retry = True
+                    continue
+                except YFTickerMissingError as e:
+                    self._mark_unknown(ticker)
+                    errors.append(f"{label} 실패: {str(e)}")
+                    return None
+                except Exception as e:
+                    errors.append(f"{label} 실패 ({attempt + 1}회차): {str(e)}")
+                    retry = True
+                    continue
+                if data is not None and not data.empty:
+                    # 남은 요청은 백그라운드에서 끝나도록 두고 먼저 도착한 결과 반환
+                    return data
+            
+            # 없는 종목은 날짜 범위 요청에서 시간대 없음, period 요청에서 가격 없음으로 실패함
+            # - 마지막 시도까지 모든 요청이 시간대 없음이었거나, period 요청을 포함한 모든 요청에 가격이 없으면 없는 종목으로 기록
+            if missing == len(windows) and (period or (retry and attempt == self.max_attempts - 1)):
+                self._mark_unknown(ticker)
+                errors.append(f"{label} 실패: 존재하지 않는 종목입니다 ({ticker})")
+                return None
+            if not retry:
+                break
+        
+        return None
@@ -0,0 +1,331 @@
+"""기술 지표 엔진: 연속된 NumPy 배열 위의 O(n) 커널과 새 봉마다 O(1)로 갱신하는 증분 지표"""
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+def rolling_mean(values, window):
+    """단순 이동평균 (누적합 기반, 앞쪽 window-1개는 NaN)"""
+    out = np.full(len(values), np.nan)
+    if window <= 0 or len(values) < window:
+        return out
+    csum = np.cumsum(np.concatenate(([0.0], values)))
+    out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+def rolling_std(values, window):
+    """이동 표준편차 (모표준편차, 제곱 누적합 기반)"""
+    mean = rolling_mean(values, window)
+    mean_sq = rolling_mean(values * values, window)
+    return np.sqrt(np.clip(mean_sq - mean * mean, 0, None))
+
+def rolling_extreme(values, window, func):
+    """이동 최대/최소값 (앞쪽 window-1개는 NaN)"""
+    out = np.full(len(values), np.nan)
+    if len(values) < window:
+        return out
+    out[window - 1:] = func(np.lib.stride_tricks.sliding_window_view(values, window), axis=1)
+    return out
+
+def exponential_mean(values, alpha, seed_window):
+    """지수 이동평균 - 처음 seed_window개의 단순평균에서 시작하는 재귀 계산 (앞쪽은 NaN)"""
+    out = np.full(len(values), np.nan)
+    if len(values) < seed_window:
+        return out
+    seeded = np.concatenate(([values[:seed_window].mean()], values[seed_window:]))
+    out[seed_window - 1:] = pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return out
+
+def ema(values, span):
+    """지수 이동평균 (EMA)"""
+    return exponential_mean(values, 2.0 / (span + 1), span)
+
+def wilder(values, period):
+    """와일더 평활 (RSI/ATR용)"""
+    return exponential_mean(values, 1.0 / period, period)
+
+def indicator_sma(arrays, window):
+    """단순 이동평균선"""
+    return {'sma': rolling_mean(arrays['close'], window)}
+
+def indicator_ema(arrays, span):
+    """지수 이동평균선"""
+    return {'ema': ema(arrays['close'], span)}
+
+def indicator_bollinger(arrays, window, num_std):
+    """볼린저 밴드 (중심/상단/하단, %B)"""
+    middle = rolling_mean(arrays['close'], window)
+    std = rolling_std(arrays['close'], window)
+    upper, lower = middle + num_std * std, middle - num_std * std
+    with np.errstate(divide='ignore', invalid='ignore'):
+        percent_b = (arrays['close'] - lower) / (upper - lower)
+    return {'middle': middle, 'upper': upper, 'lower': lower, 'percent_b': percent_b}
+
+def indicator_rsi(arrays, period):
+    """상대강도지수 (와일더 평활)"""
+    close = arrays['close']
+    out = np.full(len(close), np.nan)
+    if len(close) <= period:
+        return {'rsi': out}
+    delta = np.diff(close)
+    avg_gain = wilder(np.clip(delta, 0, None), period)
+    avg_loss = wilder(np.clip(-delta, 0, None), period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    out[1:] = np.where(np.isnan(avg_gain), np.nan, rsi)
+    return {'rsi': out}
+
+def indicator_macd(arrays, fast, slow, signal):
+    """MACD (MACD선, 시그널선, 히스토그램)"""
+    macd = ema(arrays['close'], fast) - ema(arrays['close'], slow)
+    signal_line = np.full(len(macd), np.nan)
+    valid = np.flatnonzero(~np.isnan(macd))
+    if len(valid) > 0:
+        signal_line[valid[0]:] = ema(macd[valid[0]:], signal)
+    return {'macd': macd, 'signal': signal_line, 'hist': macd - signal_line}
+
+def indicator_atr(arrays, period):
+    """평균 실제 범위 (ATR)"""
+    high, low, close = arrays['high'], arrays['low'], arrays['close']
+    previous_close = np.concatenate(([close[0]], close[:-1])) if len(close) else close
+    true_range = np.maximum(high - low, np.maximum(np.abs(high - previous_close), np.abs(low - previous_close)))
+    return {'atr': wilder(true_range, period)}
+
+def indicator_vwap(arrays):
+    """거래량 가중 평균가 (조회 구간 시작 기준 누적)"""
+    typical = (arrays['high'] + arrays['low'] + arrays['close']) / 3
+    cum_volume = np.cumsum(arrays['volume'])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vwap = np.where(cum_volume > 0, np.cumsum(typical * arrays['volume']) / cum_volume, np.nan)
+    return {'vwap': vwap}
+
+def indicator_stochastic(arrays, period, smooth):
+    """스토캐스틱 (%K, %D)"""
+    highest = rolling_extreme(arrays['high'], period, np.max)
+    lowest = rolling_extreme(arrays['low'], period, np.min)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        k = 100 * (arrays['close'] - lowest) / (highest - lowest)
+    d = np.full(len(k), np.nan)
+    valid = np.flatnonzero(~np.isnan(k))
+    if len(valid) > 0:
+        d[valid[0]:] = rolling_mean(k[valid[0]:], smooth)
+    return {'k': k, 'd': d}
+
+def indicator_obv(arrays):
+    """온밸런스 볼륨 (OBV)"""
+    direction = np.sign(np.diff(arrays['close'], prepend=arrays['close'][:1]))
+    return {'obv': np.cumsum(direction * arrays['volume'])}
+
+INDICATOR_FUNCTIONS = {
+    'sma': indicator_sma,
+    'ema': indicator_ema,
+    'bollinger': indicator_bollinger,
+    'rsi': indicator_rsi,
+    'macd': indicator_macd,
+    'atr': indicator_atr,
+    'vwap': indicator_vwap,
+    'stochastic': indicator_stochastic,
+    'obv': indicator_obv,
+}
+
+def price_arrays(data):
+    """OHLCV 데이터프레임을 연속된 float64 배열 딕셔너리로 변환 (한 번만 추출)"""
+    return {
+        'open': np.ascontiguousarray(data['Open'].to_numpy(dtype=float)),
+        'high': np.ascontiguousarray(data['High'].to_numpy(dtype=float)),
+        'low': np.ascontiguousarray(data['Low'].to_numpy(dtype=float)),
+        'close': np.ascontiguousarray(data['Close'].to_numpy(dtype=float)),
+        'volume': np.ascontiguousarray(np.nan_to_num(data['Volume'].to_numpy(dtype=float))),
+    }
+
+def compute_indicators(arrays, specs):
+    """여러 지표 스펙을 같은 배열 위에서 한 번에 계산 {스펙: {이름: 배열}}"""
+    return {spec: INDICATOR_FUNCTIONS[spec[0]](arrays, *spec[1:]) for spec in specs}
+
+
+# 증분 지표: 새 봉이 들어올 때마다 O(1)로 갱신
+class StreamingIndicator:
+    """봉 단위 증분 지표 공통 동작 - 같은 시각의 봉이 다시 들어오면 마지막 값을 교체"""
+
+    def __init__(self):
+        self.last_time = None
+        self.value = np.nan
+        self._previous = None
+
+    def update(self, bar):
+        """bar: 'time', 'Open', 'High', 'Low', 'Close', 'Volume' 키를 가진 딕셔너리"""
+        if self.last_time is not None:
+            if bar['time'] < self.last_time:
+                return self.value
+            if bar['time'] == self.last_time:
+                # 진행 중인 봉 갱신: 직전 상태로 되돌린 뒤 다시 반영
+                self._restore(self._previous)
+        self._previous = self._snapshot()
+        self.last_time = bar['time']
+        self.value = self._step(bar)
+        return self.value
+
+    def _snapshot(self):
+        raise NotImplementedError
+
+    def _restore(self, state):
+        raise NotImplementedError
+
+    def _step(self, bar):
+        raise NotImplementedError
+
+
+class StreamingSMA(StreamingIndicator):
+    """단순 이동평균 - 이동 합계 유지"""
+
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self._removed = None
+
+    def _snapshot(self):
+        return self.value
+
+    def _restore(self, state):
+        self.total -= self.values.pop()
+        if self._removed is not None:
+            self.values.appendleft(self._removed)
+            self.total += self._removed
+        self.value = state
+
+    def _step(self, bar):
+        close = float(bar['Close'])
+        self._removed = self.values.popleft() if len(self.values) == self.window else None
+        if self._removed is not None:
+            self.total -= self._removed
+        self.values.append(close)
+        self.total += close
+        return self.total / self.window if len(self.values) == self.window else np.nan
+
+
+class StreamingEMA(StreamingIndicator):
+    """지수 이동평균 - 처음 seed_window개 단순평균으로 시작 (exponential_mean과 동일한 값)"""
+
+    def __init__(self, alpha, seed_window, field='Close'):
+        super().__init__()
+        self.alpha = alpha
+        self.seed_window = seed_window
+        self.field = field
+        self.count = 0
+        self.seed_total = 0.0
+        self.average = np.nan
+
+    @classmethod
+    def span(cls, span, field='Close'):
+        return cls(2.0 / (span + 1), span, field)
+
+    @classmethod
+    def wilder(cls, period, field='Close'):
+        return cls(1.0 / period, period, field)
+
+    def _snapshot(self):
+        return (self.count, self.seed_total, self.average, self.value)
+
+    def _restore(self, state):
+        self.count, self.seed_total, self.average, self.value = state
+
+    def push(self, x):
+        """가격 필드가 아닌 값(차이, 실제 범위 등)을 직접 반영"""
+        self.count += 1
+        if self.count < self.seed_window:
+            self.seed_total += x
+            return np.nan
+        if self.count == self.seed_window:
+            self.average = (self.seed_total + x) / self.seed_window
+        else:
+            self.average = self.alpha * x + (1 - self.alpha) * self.average
+        return self.average
+
+    def _step(self, bar):
+        return self.push(float(bar[self.field]))
+
+
+class StreamingRSI(StreamingIndicator):
+    """상대강도지수 - 상승/하락폭의 와일더 평활 유지"""
+
+    def __init__(self, period):
+        super().__init__()
+        self.previous_close = None
+        self.gain = StreamingEMA.wilder(period)
+        self.loss = StreamingEMA.wilder(period)
+
+    def _snapshot(self):
+        return (self.previous_close, self.gain._snapshot(), self.loss._snapshot(), self.value)
+
+    def _restore(self, state):
+        self.previous_close, gain_state, loss_state, self.value = state
+        self.gain._restore(gain_state)
+        self.loss._restore(loss_state)
+
+    def _step(self, bar):
+        close = float(bar['Close'])
+        previous_close, self.previous_close = self.previous_close, close
+        if previous_close is None:
+            return np.nan
+        delta = close - previous_close
+        avg_gain = self.gain.push(max(delta, 0.0))
+        avg_loss = self.loss.push(max(-delta, 0.0))
+        if np.isnan(avg_gain):
+            return np.nan
+        return 100.0 if avg_loss == 0 else 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+class StreamingATR(StreamingIndicator):
+    """평균 실제 범위 - 실제 범위의 와일더 평활 유지"""
+
+    def __init__(self, period):
+        super().__init__()
+        self.previous_close = None
+        self.average = StreamingEMA.wilder(period)
+
+    def _snapshot(self):
+        return (self.previous_close, self.average._snapshot(), self.value)
+
+    def _restore(self, state):
+        self.previous_close, average_state, self.value = state
+        self.average._restore(average_state)
+
+    def _step(self, bar):
+        high, low, close = float(bar['High']), float(bar['Low']), float(bar['Close'])
+        previous_close = close if self.previous_close is None else self.previous_close
+        self.previous_close = close
+        true_range = max(high - low, abs(high - previous_close), abs(low - previous_close))
+        return self.average.push(true_range)
+
+
+class StreamingMACD(StreamingIndicator):
+    """MACD - 빠른/느린 EMA와 시그널 EMA 유지 (value는 히스토그램)"""
+
+    def __init__(self, fast, slow, signal):
+        super().__init__()
+        self.fast = StreamingEMA.span(fast)
+        self.slow = StreamingEMA.span(slow)
+        self.signal = StreamingEMA.span(signal)
+        self.macd = np.nan
+        self.signal_value = np.nan
+
+    def _snapshot(self):
+        return (self.fast._snapshot(), self.slow._snapshot(), self.signal._snapshot(),
+                self.macd, self.signal_value, self.value)
+
+    def _restore(self, state):
+        fast_state, slow_state, signal_state, self.macd, self.signal_value, self.value = state
+        self.fast._restore(fast_state)
+        self.slow._restore(slow_state)
+        self.signal._restore(signal_state)
+
+    def _step(self, bar):
+        close = float(bar['Close'])
+        self.macd = self.fast.push(close) - self.slow.push(close)
+        if np.isnan(self.macd):
+            return np.nan
+        self.signal_value = self.signal.push(self.macd)
+        return self.macd - self.signal_value
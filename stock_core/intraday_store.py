@@ -0,0 +1,99 @@
+"""분/시간봉 저장소: (종목, 간격, 날짜)별 파일로 분할 보관"""
+import os
+import re
+import threading
+import time
+from datetime import timedelta
+
+import pandas as pd
+
+from .price_store import settled_before
+from .tracing import traced
+
+
+class IntradayStore:
+    """분/시간봉 로컬 저장소 - 날짜별 파티션 파일이라 필요한 날짜만 읽고 추가"""
+
+    def __init__(self, root, max_bytes, intraday_ttl):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.intraday_ttl = intraday_ttl
+        self.lock = threading.Lock()
+        self.total_bytes = sum(os.path.getsize(path) for path in self._partition_files())
+
+    def _partition_files(self):
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if name.endswith('.pkl'):
+                    yield os.path.join(directory, name)
+
+    def _path(self, ticker, interval, day):
+        safe_ticker = re.sub(r'[^A-Za-z0-9._=^-]', '_', ticker)
+        return os.path.join(self.root, safe_ticker, interval, f"{day.isoformat()}.pkl")
+
+    def _is_valid(self, path, day):
+        """파티션이 완성됐는지 확인 - 해당 날짜가 지난 뒤 저장된 파일만 영구 유효, 그 외는 TTL 동안 유효"""
+        if not os.path.exists(path):
+            return False
+        saved_at = os.path.getmtime(path)
+        if settled_before(saved_at) > day:
+            return True
+        return time.time() - saved_at <= self.intraday_ttl.total_seconds()
+
+    def missing_ranges(self, ticker, interval, start, end, max_days):
+        """[start, end) 중 저장되지 않았거나 만료된 날짜를 요청 단위(최대 max_days일) 구간으로 묶어 반환"""
+        ranges = []
+        day = start
+        while day < end:
+            if not self._is_valid(self._path(ticker, interval, day), day):
+                if ranges and ranges[-1][1] == day and (day - ranges[-1][0]).days < max_days:
+                    ranges[-1] = (ranges[-1][0], day + timedelta(days=1))
+                else:
+                    ranges.append((day, day + timedelta(days=1)))
+            day += timedelta(days=1)
+        return ranges
+
+    @traced('store.intraday.save', 'store')
+    def save(self, ticker, interval, data, start, end):
+        """받은 봉을 날짜별 파티션으로 나눠 저장 ([start, end) 중 봉이 없는 날은 빈 파티션)"""
+        days = data.index.date
+        day = start
+        with self.lock:
+            while day < end:
+                path = self._path(ticker, interval, day)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                old_size = os.path.getsize(path) if os.path.exists(path) else 0
+                # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 깨진 파일을 보지 않도록 함
+                temp_path = f"{path}.{threading.get_ident()}.tmp"
+                data.loc[days == day].to_pickle(temp_path)
+                os.replace(temp_path, path)
+                self.total_bytes += os.path.getsize(path) - old_size
+                day += timedelta(days=1)
+        self.evict()
+
+    @traced('store.intraday.load', 'store')
+    def load(self, ticker, interval, start, end):
+        """[start, end) 날짜의 파티션만 읽어 하나의 데이터프레임으로 반환"""
+        frames = []
+        day = start
+        while day < end:
+            path = self._path(ticker, interval, day)
+            if os.path.exists(path):
+                frame = pd.read_pickle(path)
+                if not frame.empty:
+                    frames.append(frame)
+            day += timedelta(days=1)
+        if not frames:
+            return None
+        return pd.concat(frames).sort_index()
+
+    def evict(self):
+        """최대 용량을 넘으면 가장 오래전에 저장된 파티션부터 삭제"""
+        with self.lock:
+            if self.total_bytes <= self.max_bytes:
+                return
+            for path in sorted(self._partition_files(), key=os.path.getmtime):
+                if self.total_bytes <= self.max_bytes:
+                    break
+                self.total_bytes -= os.path.getsize(path)
+                os.remove(path)
@@ -0,0 +1,215 @@
+"""포트폴리오: 매매 기록 파일을 읽고, 포지션을 컬럼별 배열로 보관하여 평가액과 일별 시계열 계산"""
+import numpy as np
+import pandas as pd
+
+from .tracing import traced
+
+
+class PortfolioStore:
+    """컬럼형 포지션 저장소 - 추가/행 삭제/일괄 추가와 종목별 합계를 증분 관리"""
+
+    def __init__(self):
+        self.size = 0
+        self.tickers = np.empty(16, dtype=object)
+        self.buy_dates = np.empty(16, dtype='datetime64[D]')
+        self.buy_prices = np.empty(16, dtype=np.float64)
+        self.quantities = np.empty(16, dtype=np.float64)
+        self.total_cost = 0.0
+        self.symbol_totals = {}  # 종목 -> [수량 합계, 매수액 합계]
+
+    def __len__(self):
+        return self.size
+
+    def _reserve(self, capacity):
+        """배열 용량이 부족하면 두 배씩 확장"""
+        if capacity <= len(self.tickers):
+            return
+        new_capacity = max(capacity, len(self.tickers) * 2)
+        for name in ['tickers', 'buy_dates', 'buy_prices', 'quantities']:
+            old = getattr(self, name)
+            new = np.empty(new_capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def _accumulate(self, tickers, buy_prices, quantities, sign):
+        """종목별 수량/매수액 합계 갱신"""
+        costs = buy_prices * quantities
+        self.total_cost += sign * float(costs.sum())
+        grouped = pd.DataFrame({'ticker': tickers, 'qty': quantities, 'cost': costs}).groupby('ticker').sum()
+        for symbol, qty, cost in grouped.itertuples(name=None):
+            totals = self.symbol_totals.setdefault(symbol, [0.0, 0.0])
+            totals[0] += sign * qty
+            totals[1] += sign * cost
+            if abs(totals[0]) < 1e-9:
+                del self.symbol_totals[symbol]
+
+    def extend(self, tickers, buy_dates, buy_prices, quantities):
+        """여러 포지션을 한 번에 추가 (티커는 야후 응답과 맞도록 공백 제거 후 대문자로 저장)"""
+        tickers = np.asarray([str(ticker).strip().upper() for ticker in tickers], dtype=object)
+        buy_dates = np.asarray(pd.to_datetime(buy_dates).values, dtype='datetime64[D]')
+        buy_prices = np.asarray(buy_prices, dtype=np.float64)
+        quantities = np.asarray(quantities, dtype=np.float64)
+        count = len(tickers)
+        if count == 0:
+            return
+
+        self._reserve(self.size + count)
+        end = self.size + count
+        self.tickers[self.size:end] = tickers
+        self.buy_dates[self.size:end] = buy_dates
+        self.buy_prices[self.size:end] = buy_prices
+        self.quantities[self.size:end] = quantities
+        self.size = end
+        self._accumulate(tickers, buy_prices, quantities, 1)
+
+    def append(self, ticker, buy_date, buy_price, quantity):
+        """포지션 하나 추가"""
+        self.extend([ticker], [buy_date], [buy_price], [quantity])
+
+    def delete_rows(self, rows):
+        """행 번호 목록에 해당하는 포지션 삭제"""
+        rows = np.unique(np.asarray(rows, dtype=np.int64))
+        rows = rows[(rows >= 0) & (rows < self.size)]
+        if len(rows) == 0:
+            return
+
+        self._accumulate(self.tickers[rows], self.buy_prices[rows], self.quantities[rows], -1)
+        keep = np.ones(self.size, dtype=bool)
+        keep[rows] = False
+        remaining = int(keep.sum())
+        for name in ['tickers', 'buy_dates', 'buy_prices', 'quantities']:
+            column = getattr(self, name)
+            column[:remaining] = column[:self.size][keep]
+        self.size = remaining
+
+    def clear(self):
+        """모든 포지션 삭제"""
+        self.__init__()
+
+    def symbols(self):
+        """보유 종목 목록"""
+        return list(self.symbol_totals.keys())
+
+    def to_frame(self):
+        """포지션 데이터프레임 (종목, 매수날짜, 매수가, 수량)"""
+        return pd.DataFrame({
+            '종목': self.tickers[:self.size],
+            '매수날짜': self.buy_dates[:self.size],
+            '매수가': self.buy_prices[:self.size],
+            '수량': self.quantities[:self.size],
+        })
+
+    def totals(self, prices):
+        """종목별 합계로 (총 투자액, 현재 자산 가치, 총 수익/손실) 계산 - 가격 없는 종목은 가치/손익에서 제외"""
+        if not self.symbol_totals:
+            return 0.0, 0.0, 0.0
+        symbols = list(self.symbol_totals.keys())
+        qty, cost = np.array(list(self.symbol_totals.values()), dtype=np.float64).T
+        price = pd.Series(prices, dtype=float).reindex(symbols).to_numpy(dtype=float)
+        priced = ~np.isnan(price)
+        total_value = float((qty[priced] * price[priced]).sum())
+        total_profit_loss = total_value - float(cost[priced].sum())
+        return self.total_cost, total_value, total_profit_loss
+
+
+def closes_as_of(closes, dates, fallback='previous'):
+    """종가 시계열에서 날짜 배열 각각의 종가를 as-of 방식으로 찾아 NumPy 배열로 반환 (종가가 없으면 NaN)"""
+    # fallback='previous': 당일 → 이전 거래일 → 다음 거래일 / fallback='next': 당일 → 다음 거래일 → 이전 거래일
+    if fallback not in ('previous', 'next'):
+        raise ValueError(f"지원하지 않는 fallback: {fallback}")
+    
+    closes = closes.dropna().sort_index()
+    query = np.asarray(dates, dtype='datetime64[ns]')
+    if closes.empty:
+        return np.full(len(query), np.nan)
+    
+    index = closes.index.to_numpy(dtype='datetime64[ns]')
+    values = closes.to_numpy(dtype=float)
+    
+    previous = np.searchsorted(index, query, side='right') - 1  # 당일 또는 이전 거래일
+    following = np.searchsorted(index, query, side='left')      # 당일 또는 다음 거래일
+    has_previous = previous >= 0
+    has_following = following < len(index)
+    previous_close = np.where(has_previous, values[np.clip(previous, 0, None)], np.nan)
+    following_close = np.where(has_following, values[np.clip(following, None, len(index) - 1)], np.nan)
+    
+    if fallback == 'previous':
+        return np.where(has_previous, previous_close, following_close)
+    return np.where(has_following, following_close, previous_close)
+
+
+
+# 시계열 엔진: (날짜 × 종목) 보유 수량 행렬과 종가 행렬의 곱으로 일별 평가액 계산
+@traced('transform.portfolio_timeseries', 'transform')
+def portfolio_timeseries(positions_df, closes):
+    """보유 수량 행렬 × 종가 행렬로 일별 평가액, 투자원금, 시간가중수익률(TWR), 낙폭을 한 번에 계산"""
+    dates = closes.index.to_numpy(dtype='datetime64[D]')
+    trades = positions_df[positions_df['종목'].isin(closes.columns)]
+    
+    # 매수일(휴장일이면 다음 거래일, 아직 종가가 없으면 마지막 거래일)에 수량 변화 기록 후 누적합 → 보유 수량 행렬
+    row = np.minimum(np.searchsorted(dates, trades['매수날짜'].to_numpy(dtype='datetime64[D]')), len(dates) - 1)
+    col = closes.columns.get_indexer(trades['종목'])
+    quantity = trades['수량'].to_numpy(dtype=float)
+    cost = trades['매수가'].to_numpy(dtype=float) * quantity
+    
+    changes = np.zeros((len(dates), len(closes.columns)))
+    np.add.at(changes, (row, col), quantity)
+    holdings = np.cumsum(changes, axis=0)
+    nav = np.einsum('ij,ij->i', holdings, closes.to_numpy(dtype=float))
+    
+    # 매수 금액은 해당 일 시작 시점의 외부 입금으로 보고 일간 수익률에서 제외
+    flows = np.bincount(row, weights=cost, minlength=len(dates))
+    invested = np.cumsum(flows)
+    base = np.concatenate([[0.0], nav[:-1]]) + flows
+    daily = np.divide(nav - base, base, out=np.zeros_like(nav), where=base > 0)
+    wealth = np.cumprod(1 + daily)
+    drawdown = wealth / np.maximum.accumulate(wealth) - 1
+    
+    series = pd.DataFrame({
+        '평가액': nav,
+        '투자원금': invested,
+        '손익': nav - invested,
+        '일간 수익률(%)': daily * 100,
+        '누적 수익률(%)': (wealth - 1) * 100,
+        '낙폭(%)': drawdown * 100,
+    }, index=closes.index)
+    return series[invested > 0]
+
+def timeseries_summary(series):
+    """시계열 요약 - 누적/연환산 TWR, 최대 낙폭, 연환산 변동성 (%) (1년 미만은 연환산 수익률 None)"""
+    wealth = 1 + series['누적 수익률(%)'].to_numpy() / 100
+    days = (series.index[-1] - series.index[0]).days
+    daily = series['일간 수익률(%)'].to_numpy()[1:] / 100
+    return {
+        'twr': float(wealth[-1] - 1) * 100,
+        'annualized': float(wealth[-1] ** (365 / days) - 1) * 100 if days >= 365 else None,
+        'max_drawdown': float(series['낙폭(%)'].min()),
+        'volatility': float(daily.std() * np.sqrt(252) * 100) if len(daily) > 1 else 0.0,
+    }
+
+# 매매 기록 파일의 영문 컬럼명 → 포지션 컬럼명
+TRADE_COLUMN_ALIASES = {
+    'ticker': '종목', 'symbol': '종목',
+    'date': '매수날짜', 'buy_date': '매수날짜',
+    'price': '매수가', 'buy_price': '매수가',
+    'quantity': '수량', 'qty': '수량', 'shares': '수량',
+}
+
+def read_trade_file(uploaded_file):
+    """CSV/Excel 매매 기록을 (종목, 매수날짜, 매수가, 수량) 데이터프레임으로 변환"""
+    if uploaded_file.name.lower().endswith(('.xlsx', '.xls')):
+        raw = pd.read_excel(uploaded_file)  # .xlsx는 openpyxl, .xls는 xlrd 필요
+    else:
+        raw = pd.read_csv(uploaded_file)
+    
+    raw = raw.rename(columns=lambda col: TRADE_COLUMN_ALIASES.get(str(col).strip().lower(), str(col).strip()))
+    missing = [col for col in ['종목', '매수날짜', '수량'] if col not in raw.columns]
+    if missing:
+        raise ValueError(f"필수 컬럼이 없습니다: {', '.join(missing)}")
+    
+    return pd.DataFrame({
+        '종목': raw['종목'].fillna('').astype(str).str.strip().str.upper(),
+        '매수날짜': pd.to_datetime(raw['매수날짜'], errors='coerce').dt.normalize(),
+        '매수가': pd.to_numeric(raw['매수가'], errors='coerce') if '매수가' in raw.columns else np.nan,
+        '수량': pd.to_numeric(raw['수량'], errors='coerce'),
+    })
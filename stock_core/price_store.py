@@ -0,0 +1,208 @@
+"""가격 저장소: 종목별 일봉을 SQLite에 보관"""
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+
+from .tracing import traced
+
+# 봉 날짜는 거래소 현지 기준이라 서버 시간대와 무관하게 UTC에서 여유를 뺀 날짜로 마감 여부 판단
+# (미국 장 마감은 20~21시 UTC이므로 6시간을 빼면 마감 전 조회가 다음 날로 넘어가지 않음)
+SETTLE_MARGIN = timedelta(hours=6)
+
+
+def settled_before(timestamp):
+    """timestamp(초)에 조회한 데이터 중 장이 끝나 확정된 봉의 날짜 상한 (이 날짜 미만만 확정)"""
+    return (datetime.fromtimestamp(timestamp, timezone.utc) - SETTLE_MARGIN).date()
+
+
+class PriceStore:
+    """로컬 OHLCV 저장소 - 조회된 구간(coverage)을 함께 기록하여 캐시 적중 여부 판단"""
+
+    COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume', 'Adj Close']
+
+    def __init__(self, path, max_rows, intraday_ttl):
+        self.max_rows = max_rows
+        self.intraday_ttl = intraday_ttl
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS bars (
+                    ticker TEXT, date TEXT,
+                    open REAL, high REAL, low REAL, close REAL, volume REAL, adj_close REAL,
+                    PRIMARY KEY (ticker, date)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS coverage (
+                    ticker TEXT, start TEXT, end TEXT, fetched_at REAL
+                );
+                CREATE INDEX IF NOT EXISTS coverage_ticker ON coverage (ticker);
+                CREATE TABLE IF NOT EXISTS access (
+                    ticker TEXT PRIMARY KEY, last_access REAL
+                );
+            """)
+            # 수정 종가가 없던 이전 저장소는 컬럼을 추가하고 모든 구간을 다시 받도록 함
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(bars)")]
+            if 'adj_close' not in columns:
+                self.conn.execute("ALTER TABLE bars ADD COLUMN adj_close REAL")
+                self.conn.execute("DELETE FROM coverage")
+            # 저장할 때마다 전체 개수를 세지 않도록 시작 시 한 번만 세고 이후 증감만 반영
+            self.total_rows = self.conn.execute("SELECT COUNT(*) FROM bars").fetchone()[0]
+
+    def valid_intervals(self, ticker):
+        """신선도 정책을 적용한 조회 완료 구간 목록 [(start, end), ...] (end 미포함, 병합/정렬됨)"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT start, end, fetched_at FROM coverage WHERE ticker = ?", (ticker,)
+            ).fetchall()
+
+        now = time.time()
+        intervals = []
+        for start, end, fetched_at in rows:
+            start, end = date.fromisoformat(start), date.fromisoformat(end)
+            # 조회 시점 이후의 봉은 장중 값일 수 있으므로 TTL 동안만 유효
+            if now - fetched_at > self.intraday_ttl.total_seconds():
+                end = min(end, settled_before(fetched_at))
+            if start < end:
+                intervals.append((start, end))
+
+        merged = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def covers(self, ticker, start, end):
+        """[start, end) 구간이 모두 유효하게 저장되어 있는지 확인"""
+        return not self.missing_intervals(ticker, start, end)
+
+    def missing_intervals(self, ticker, start, end):
+        """[start, end) 중 저장되지 않았거나 만료된 구간 목록 [(start, end), ...]"""
+        gaps = []
+        cursor = start
+        for s, e in self.valid_intervals(ticker):
+            if e <= cursor:
+                continue
+            if s >= end:
+                break
+            if s > cursor:
+                gaps.append((cursor, s))
+            cursor = max(cursor, e)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def has_data(self, ticker):
+        """해당 종목의 봉이 하나라도 저장되어 있는지 확인"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM bars WHERE ticker = ? LIMIT 1", (ticker,)
+            ).fetchone()
+        return row is not None
+
+    @traced('store.prices.load', 'store')
+    def load(self, ticker, start, end):
+        """[start, end) 구간의 저장된 봉을 데이터프레임으로 반환"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT date, open, high, low, close, volume, adj_close FROM bars "
+                "WHERE ticker = ? AND date >= ? AND date < ? ORDER BY date",
+                (ticker, start.isoformat(), end.isoformat())
+            ).fetchall()
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO access VALUES (?, ?)", (ticker, time.time())
+                )
+
+        if not rows:
+            return None
+
+        data = pd.DataFrame(rows, columns=['Date'] + self.COLUMNS)
+        data.index = pd.DatetimeIndex(pd.to_datetime(data.pop('Date')), name='Date')
+        return data.astype(float)
+
+    @traced('store.prices.save', 'store')
+    def save(self, ticker, data, start, end):
+        """정규화된 데이터프레임과 조회 구간 [start, end)를 저장"""
+        records = [
+            (ticker, ts.date().isoformat(), *values)
+            for ts, values in zip(
+                pd.to_datetime(data.index),
+                data[self.COLUMNS].astype(float).itertuples(index=False, name=None)
+            )
+        ]
+        with self.lock, self.conn:
+            if records:
+                # 새로 추가되는 봉 개수만 누적 (이미 있던 날짜는 덮어쓰기)
+                dates = [record[1] for record in records]
+                window = (ticker, min(dates), max(dates))
+                count_sql = "SELECT COUNT(*) FROM bars WHERE ticker = ? AND date >= ? AND date <= ?"
+                before = self.conn.execute(count_sql, window).fetchone()[0]
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO bars VALUES (?, ?, ?, ?, ?, ?, ?, ?)", records
+                )
+                self.total_rows += self.conn.execute(count_sql, window).fetchone()[0] - before
+            self.conn.execute(
+                "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+                (ticker, start.isoformat(), end.isoformat(), time.time())
+            )
+            self._compact_coverage(ticker)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO access VALUES (?, ?)", (ticker, time.time())
+            )
+        self.evict()
+
+    def _compact_coverage(self, ticker):
+        """종목의 구간 기록을 병합 - 확정 구간(조회일 이전)은 합치고 아직 TTL 안인 최근 구간만 따로 유지 (lock 보유 상태에서 호출)"""
+        rows = self.conn.execute(
+            "SELECT start, end, fetched_at FROM coverage WHERE ticker = ?", (ticker,)
+        ).fetchall()
+        now = time.time()
+        settled, fresh = [], []
+        for start, end, fetched_at in rows:
+            start, end = date.fromisoformat(start), date.fromisoformat(end)
+            fetched_on = settled_before(fetched_at)
+            # 조회일 이전 구간은 만료되지 않으므로 조회 시각과 무관하게 병합 가능
+            if start < min(end, fetched_on):
+                settled.append((start, min(end, fetched_on)))
+            # 조회일 이후 구간은 TTL 동안만 유효 - 만료된 것은 버림
+            if max(start, fetched_on) < end and now - fetched_at <= self.intraday_ttl.total_seconds():
+                fresh.append((max(start, fetched_on).isoformat(), end.isoformat(), fetched_at))
+
+        merged = []
+        for start, end in sorted(settled):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        # 확정 구간의 끝은 오늘 이전이므로 지금 시각으로 기록해도 유효 범위가 바뀌지 않음
+        self.conn.execute("DELETE FROM coverage WHERE ticker = ?", (ticker,))
+        self.conn.executemany(
+            "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+            [(ticker, start.isoformat(), end.isoformat(), now) for start, end in merged]
+            + [(ticker, *row) for row in fresh]
+        )
+
+    def evict(self):
+        """최대 봉 개수를 넘으면 가장 오래 사용하지 않은 종목부터 제거"""
+        with self.lock, self.conn:
+            if self.total_rows <= self.max_rows:
+                return
+
+            tickers = self.conn.execute(
+                "SELECT ticker FROM access ORDER BY last_access"
+            ).fetchall()
+            for (old_ticker,) in tickers:
+                if self.total_rows <= self.max_rows:
+                    break
+                removed = self.conn.execute(
+                    "DELETE FROM bars WHERE ticker = ?", (old_ticker,)
+                ).rowcount
+                self.conn.execute("DELETE FROM coverage WHERE ticker = ?", (old_ticker,))
+                self.conn.execute("DELETE FROM access WHERE ticker = ?", (old_ticker,))
+                self.total_rows -= removed
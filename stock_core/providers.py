@@ -0,0 +1,324 @@
+"""데이터 공급자: 주가/메타데이터/배당/재무제표 조회를 한 인터페이스로 통일 (앱에서 STOCK_DATA_PROVIDER로 선택)"""
+import json
+import os
+import re
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import yfinance as yf
+from yfinance.exceptions import YFPricesMissingError, YFTickerMissingError
+
+from . import tracing
+from .tracing import estimate_size, traced
+
+
+# 헬퍼 함수: 데이터프레임 정규화
+@traced('transform.normalize', 'transform')
+def normalize_dataframe(data, ticker):
+    """데이터프레임을 정규 형식으로 변환"""
+    try:
+        # 데이터가 비어있는지 확인
+        if data is None or data.empty:
+            return None
+        
+        # 멀티 인덱스인 경우 싱글 종목만 추출
+        if isinstance(data.columns, pd.MultiIndex):
+            # 멀티 레벨 컬럼 구조
+            if ticker in data.columns.get_level_values(1):
+                data = data.xs(ticker, level=1, axis=1)
+            elif ticker in data.columns.get_level_values(0):
+                data = data[ticker]
+            else:
+                # 다중 종목 응답에 해당 종목이 없음 (원본 컬럼은 다른 종목이 쓰므로 수정하지 않음)
+                return None
+        
+        # 필수 컬럼 확인
+        required_cols = ['Open', 'High', 'Low', 'Close', 'Volume']
+        
+        # 컬럼 정리 (대소문자 통일)
+        data.columns = [col if col in required_cols else col for col in data.columns]
+        
+        # 필수 컬럼이 모두 있는지 확인
+        if not all(col in data.columns for col in required_cols):
+            return None
+        
+        # 필요한 컬럼만 선택 (수정주가가 적용된 데이터는 종가가 곧 수정 종가)
+        if 'Adj Close' not in data.columns:
+            data = data.assign(**{'Adj Close': data['Close']})
+        data = data[required_cols + ['Adj Close']].copy()
+        
+        # 데이터 타입 변환
+        for col in data.columns:
+            data[col] = pd.to_numeric(data[col], errors='coerce')
+        
+        # NaN이 모두인 경우 제외
+        if data.isna().all().all():
+            return None
+        
+        # 거래소 현지 시각 기준으로 통일 (저장소 날짜 비교를 단순하게 유지)
+        if getattr(data.index, 'tz', None) is not None:
+            data.index = data.index.tz_localize(None)
+        
+        # 인덱스 이름 설정
+        data.index.name = 'Date'
+        
+        return data
+    
+    except Exception:
+        return None
+
+
+class DataProvider:
+    """데이터 공급자 인터페이스 - 주가는 Open/High/Low/Close/Volume/Adj Close 컬럼, 기간은 start/end 또는 period로 지정"""
+
+    name = None
+
+    def history(self, ticker, interval, **window):
+        """단일 종목 봉 데이터 (거래 없음은 YFPricesMissingError, 없는 종목은 YFTickerMissingError)"""
+        raise NotImplementedError
+
+    def download(self, symbols, interval='1d', **window):
+        """여러 종목 봉 데이터를 (항목, 종목) 2단 컬럼 표 하나로 반환 (실패한 종목은 빠지거나 NaN)"""
+        raise NotImplementedError
+
+    def info(self, symbol):
+        """종목 메타데이터 dict"""
+        raise NotImplementedError
+
+    def dividends(self, symbol):
+        """배당 이력 Series (지급일 → 주당 배당금)"""
+        raise NotImplementedError
+
+    def statement(self, symbol, name):
+        """재무제표 1종 (yf.Ticker 속성 이름, 행: 항목 / 열: 결산일)"""
+        raise NotImplementedError
+
+
+class YFinanceProvider(DataProvider):
+    """야후 파이낸스 공급자 - 모든 요청은 call(key, func, *args, cost=1, **kwargs)(요청 스케줄러 통로)을 거침"""
+
+    name = 'yfinance'
+
+    def __init__(self, call, timeout):
+        self.call = call
+        self.timeout = timeout
+
+    def history(self, ticker, interval, **window):
+        # 단일 종목은 Ticker.history로 받아 없는 종목/기간을 예외로 구분 (yf.download는 오류를 기록만 하고 빈 표를 돌려줌)
+        return self.call(
+            ('history', ticker, interval, tuple(sorted(window.items()))),
+            yf.Ticker(ticker).history,
+            interval=interval, auto_adjust=False, actions=False,
+            timeout=self.timeout, raise_errors=True, **window
+        )
+
+    def download(self, symbols, interval='1d', **window):
+        symbols = list(symbols)
+        return self.call(
+            ('download', tuple(symbols), interval, tuple(sorted(window.items()))), yf.download,
+            symbols, interval=interval, auto_adjust=False, group_by='column', progress=False,
+            threads=True, timeout=self.timeout, cost=len(symbols), **window
+        )
+
+    def info(self, symbol):
+        # yf.Ticker는 info를 내부에 영구 보관하므로 매번 새 객체로 조회
+        return dict(self.call(('info', symbol), lambda: yf.Ticker(symbol).info) or {})
+
+    def dividends(self, symbol):
+        return self.call(('dividends', symbol), lambda: yf.Ticker(symbol).dividends)
+
+    def statement(self, symbol, name):
+        return self.call(('statement', symbol, name), lambda: getattr(yf.Ticker(symbol), name))
+
+
+class FixtureStore:
+    """공급자 응답 파일 - history/<봉>/<종목>.pkl, info/<종목>.json, dividends/<종목>.pkl, statements/<종목>/<재무제표>.pkl"""
+
+    def __init__(self, root):
+        self.root = root
+        self.lock = threading.Lock()
+
+    def path(self, *parts, suffix='.pkl'):
+        parts = [re.sub(r'[^\w.^=-]', '_', str(part)) for part in parts]
+        return os.path.join(self.root, *parts) + suffix
+
+    def read_frame(self, *parts):
+        """저장된 DataFrame/Series (없으면 None) - 직접 기록한 신뢰할 수 있는 파일만 사용"""
+        path = self.path(*parts)
+        return pd.read_pickle(path) if os.path.exists(path) else None
+
+    def write_frame(self, value, *parts):
+        path = self.path(*parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 다른 스레드가 읽는 중에도 완성된 파일만 보이도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        value.to_pickle(temp_path)
+        os.replace(temp_path, path)
+
+    def read_info(self, symbol):
+        path = self.path('info', symbol, suffix='.json')
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def write_info(self, symbol, company_info):
+        path = self.path('info', symbol, suffix='.json')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(company_info, f, ensure_ascii=False, default=str)
+
+    def merge_history(self, ticker, interval, data):
+        """정규화한 봉 데이터를 기존 파일과 합쳐 저장 (같은 시각은 새 값 사용)"""
+        if data is None or data.empty:
+            return
+        with self.lock:
+            existing = self.read_frame('history', interval, ticker)
+            if existing is not None:
+                data = pd.concat([existing, data])
+                data = data[~data.index.duplicated(keep='last')]
+            self.write_frame(data.sort_index(), 'history', interval, ticker)
+
+
+class RecordingProvider(DataProvider):
+    """기록 공급자 - 내부 공급자의 응답을 그대로 반환하면서 픽스처 파일로 저장"""
+
+    name = 'record'
+
+    def __init__(self, inner, fixtures):
+        self.inner = inner
+        self.fixtures = fixtures
+
+    def history(self, ticker, interval, **window):
+        data = self.inner.history(ticker, interval, **window)
+        self.fixtures.merge_history(ticker, interval, normalize_dataframe(data, ticker))
+        return data
+
+    def download(self, symbols, interval='1d', **window):
+        data = self.inner.download(symbols, interval, **window)
+        # 다중 종목 응답도 종목별 파일로 나누어 재생 시 history/download 모두에 사용
+        for symbol in symbols:
+            self.fixtures.merge_history(symbol, interval, normalize_dataframe(data, symbol))
+        return data
+
+    def info(self, symbol):
+        company_info = self.inner.info(symbol)
+        self.fixtures.write_info(symbol, company_info)
+        return company_info
+
+    def dividends(self, symbol):
+        dividends = self.inner.dividends(symbol)
+        if dividends is not None:
+            self.fixtures.write_frame(dividends, 'dividends', symbol)
+        return dividends
+
+    def statement(self, symbol, name):
+        statement = self.inner.statement(symbol, name)
+        if statement is not None:
+            self.fixtures.write_frame(statement, 'statements', symbol, name)
+        return statement
+
+
+class ReplayProvider(DataProvider):
+    """재생 공급자 - 네트워크 없이 픽스처 파일만 사용하고, 요청마다 latency초 대기하여 실제 응답 시간을 흉내"""
+
+    name = 'replay'
+    PERIOD_UNITS = {'d': 'days', 'wk': 'weeks', 'mo': 'months', 'y': 'years'}
+
+    def __init__(self, fixtures, latency=0.0):
+        self.fixtures = fixtures
+        self.latency = latency
+
+    def _wait(self):
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def _window(self, start=None, end=None, period=None):
+        """요청 기간을 [start, end) 시각으로 변환 (period는 현재 시각 기준, 'max'는 전체)"""
+        if period is not None:
+            match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+            end = pd.Timestamp.now().normalize() + pd.Timedelta(days=1)
+            if period == 'ytd':
+                return pd.Timestamp(end.year, 1, 1), end
+            if match is None:
+                return None, None
+            return end - pd.DateOffset(**{self.PERIOD_UNITS[match.group(2)]: int(match.group(1))}), end
+        return (
+            pd.Timestamp(start) if start is not None else None,
+            pd.Timestamp(end) if end is not None else None,
+        )
+
+    def _slice(self, ticker, interval, **window):
+        data = self.fixtures.read_frame('history', interval, ticker)
+        if data is None:
+            return None
+        start, end = self._window(**window)
+        mask = np.ones(len(data), dtype=bool)
+        if start is not None:
+            mask &= data.index >= start
+        if end is not None:
+            mask &= data.index < end
+        return data[mask].copy()
+
+    def history(self, ticker, interval, **window):
+        self._wait()
+        data = self._slice(ticker, interval, **window)
+        if data is None:
+            raise YFTickerMissingError(ticker, '기록된 픽스처 없음')
+        if data.empty:
+            raise YFPricesMissingError(ticker, f"기록된 픽스처에 해당 기간 없음 ({window})")
+        return data
+
+    def download(self, symbols, interval='1d', **window):
+        self._wait()
+        frames = {symbol: self._slice(symbol, interval, **window) for symbol in symbols}
+        frames = {symbol: data for symbol, data in frames.items() if data is not None and not data.empty}
+        if not frames:
+            return pd.DataFrame()
+        # yf.download(group_by='column')와 같은 (항목, 종목) 컬럼 구조
+        return pd.concat(frames, axis=1).swaplevel(0, 1, axis=1).sort_index(axis=1)
+
+    def info(self, symbol):
+        self._wait()
+        return self.fixtures.read_info(symbol) or {}
+
+    def dividends(self, symbol):
+        self._wait()
+        dividends = self.fixtures.read_frame('dividends', symbol)
+        return dividends if dividends is not None else pd.Series(dtype=float, name='Dividends')
+
+    def statement(self, symbol, name):
+        self._wait()
+        statement = self.fixtures.read_frame('statements', symbol, name)
+        return statement if statement is not None else pd.DataFrame()
+
+
+class TracedProvider(DataProvider):
+    """계측 공급자 - 내부 공급자 요청마다 소요 시간과 응답 크기를 기록"""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.name = inner.name
+
+    def _call(self, method, target, *args, **kwargs):
+        with tracing.span(f'fetch.{method}', 'fetch', provider=self.name, target=target) as record:
+            result = getattr(self.inner, method)(*args, **kwargs)
+            record['bytes'] = estimate_size(result)
+            return result
+
+    def history(self, ticker, interval, **window):
+        return self._call('history', ticker, ticker, interval, **window)
+
+    def download(self, symbols, interval='1d', **window):
+        return self._call('download', f"{len(symbols)}개 종목", symbols, interval, **window)
+
+    def info(self, symbol):
+        return self._call('info', symbol, symbol)
+
+    def dividends(self, symbol):
+        return self._call('dividends', symbol, symbol)
+
+    def statement(self, symbol, name):
+        return self._call('statement', f"{symbol}/{name}", symbol, name)
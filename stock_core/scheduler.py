@@ -0,0 +1,140 @@
+"""요청 스케줄러: 모든 야후 요청이 하나의 속도 제한과 우선순위 대기열을 거침"""
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+from yfinance.exceptions import YFRateLimitError
+
+from . import tracing
+
+PRIORITY_INTERACTIVE, PRIORITY_BULK, PRIORITY_PREFETCH = 0, 1, 2
+PRIORITY_LABELS = {PRIORITY_INTERACTIVE: '화면', PRIORITY_BULK: '일괄', PRIORITY_PREFETCH: '미리 요청'}
+
+# 요청 우선순위 컨텍스트 변수 (모듈은 스크립트 재실행과 무관하게 한 번만 임포트되므로 프로세스에서 하나)
+request_priority = contextvars.ContextVar('request_priority', default=PRIORITY_INTERACTIVE)
+
+
+def is_rate_limited(error):
+    """야후가 요청 한도 초과(HTTP 429)로 거절했는지 확인"""
+    message = str(error)
+    return isinstance(error, YFRateLimitError) or '429' in message or 'Too Many Requests' in message
+
+
+def submit_in_context(executor, func, *args, priority=None):
+    """현재 요청 우선순위를 유지한 채 스레드 풀에 작업 제출 (priority를 주면 해당 우선순위로 실행)"""
+    context = contextvars.copy_context()
+    if priority is not None:
+        context.run(request_priority.set, priority)
+    return executor.submit(context.run, func, *args)
+
+
+class RequestScheduler:
+    """야후 요청 스케줄러 - 토큰 버킷 속도 제한, 우선순위 순서 배분, 같은 요청 병합, 429 응답 시 속도 절반·일시 정지 후 점진 회복(AIMD)"""
+
+    def __init__(self, max_rate, min_rate, burst, rate_step, backoff, max_backoff):
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst
+        self.rate_step = rate_step
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.rate = max_rate
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.throttle_streak = 0
+        self.cond = threading.Condition()
+        self.waiting = []             # (우선순위, 순번) 힙 - 맨 앞 요청만 토큰을 받을 수 있음
+        self.sequence = itertools.count()
+        self.inflight = {}            # key -> 실행 중인 요청의 Future
+        self.counts = {label: 0 for label in PRIORITY_LABELS.values()}
+        self.counts.update(deduplicated=0, throttled=0)
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, priority, cost=1):
+        """우선순위(같으면 도착 순) 차례가 되고 토큰이 생길 때까지 대기 - 다중 종목 요청은 종목 수만큼 토큰을 미리 당겨 씀"""
+        with self.cond:
+            ticket = (priority, next(self.sequence))
+            heapq.heappush(self.waiting, ticket)
+            try:
+                while True:
+                    if self.waiting[0] != ticket:
+                        self.cond.wait()
+                        continue
+                    now = time.monotonic()
+                    self._refill(now)
+                    delay = max(self.paused_until - now, (1 - self.tokens) / self.rate)
+                    if delay <= 0:
+                        self.tokens -= cost
+                        self.counts[PRIORITY_LABELS[priority]] += 1
+                        return
+                    self.cond.wait(delay)
+            finally:
+                self.waiting.remove(ticket)
+                heapq.heapify(self.waiting)
+                self.cond.notify_all()
+
+    def report(self, throttled):
+        """요청 결과 반영 - 429면 속도를 절반으로 줄이고 일시 정지(연속 시 2배), 성공하면 속도를 조금씩 회복"""
+        with self.cond:
+            if throttled:
+                self.throttle_streak += 1
+                self.counts['throttled'] += 1
+                self.rate = max(self.min_rate, self.rate / 2)
+                pause = min(self.backoff * 2 ** (self.throttle_streak - 1), self.max_backoff)
+                self.paused_until = max(self.paused_until, time.monotonic() + pause)
+                self.tokens = min(self.tokens, 0.0)
+            else:
+                self.throttle_streak = 0
+                self.rate = min(self.max_rate, self.rate + self.rate_step)
+            self.cond.notify_all()
+
+    def call(self, key, loader, priority=None, cost=1):
+        """같은 key의 요청이 실행 중이면 그 결과를 대기, 아니면 차례를 기다려 실행 (priority 기본값: 현재 컨텍스트)"""
+        priority = request_priority.get() if priority is None else priority
+        with self.cond:
+            flight = self.inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.inflight[key] = Future()
+            else:
+                self.counts['deduplicated'] += 1
+
+        if not leader:
+            return flight.result()
+
+        try:
+            with tracing.span('fetch.wait', 'fetch', priority=PRIORITY_LABELS[priority], cost=cost):
+                self.acquire(priority, cost)
+            try:
+                result = loader()
+            except Exception as e:
+                self.report(is_rate_limited(e))
+                raise
+            self.report(False)
+        except BaseException as e:
+            with self.cond:
+                del self.inflight[key]
+            flight.set_exception(e)
+            raise
+
+        with self.cond:
+            del self.inflight[key]
+        flight.set_result(result)
+        return result
+
+    def status(self):
+        """현재 허용 속도(초당 요청 수), 대기 요청 수, 남은 일시 정지 시간(초), 누적 횟수"""
+        with self.cond:
+            return {
+                'rate': self.rate,
+                'waiting': len(self.waiting),
+                'paused': max(0.0, self.paused_until - time.monotonic()),
+                **self.counts,
+            }
@@ -0,0 +1,73 @@
+"""스크리너: 종목 목록을 읽고 info 지표를 열 단위 표로 구성하여 조건 검색"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from .tracing import traced
+
+SCREENER_METRICS = {
+    'marketCap': '시가총액',
+    'trailingPE': 'P/E',
+    'forwardPE': '선행 P/E',
+    'priceToBook': 'P/B',
+    'dividendYield': '배당 수익률(%)',
+    'returnOnEquity': 'ROE',
+    'debtToEquity': '부채비율',
+    'beta': '베타',
+}
+
+UNIVERSE_COLUMN_ALIASES = ['symbol', 'ticker', 'code', '종목', '티커', '종목코드']
+
+def parse_universe(text, numeric_suffix='.KS'):
+    """쉼표/공백/줄바꿈으로 구분된 종목 목록 정리 - 6자리 숫자 코드는 시장 접미사 추가, 중복 제거"""
+    symbols = pd.Series(re.split(r'[\s,;]+', text), dtype=str).str.strip().str.upper()
+    symbols = symbols[symbols != '']
+    symbols = symbols.where(~symbols.str.fullmatch(r'\d{6}'), symbols + numeric_suffix)
+    return list(dict.fromkeys(symbols))
+
+def read_universe_file(uploaded_file, numeric_suffix='.KS'):
+    """종목 목록 파일(CSV/Excel/텍스트)에서 티커 목록 추출 (종목 컬럼이 없으면 첫 컬럼 사용)"""
+    name = uploaded_file.name.lower()
+    if name.endswith(('.xlsx', '.xls')):
+        raw = pd.read_excel(uploaded_file, dtype=str)  # .xlsx는 openpyxl, .xls는 xlrd 필요
+    elif name.endswith('.csv'):
+        raw = pd.read_csv(uploaded_file, dtype=str)
+    else:
+        return parse_universe(uploaded_file.getvalue().decode('utf-8', errors='ignore'), numeric_suffix)
+    
+    columns = {str(col).strip().lower(): col for col in raw.columns}
+    alias = next((alias for alias in UNIVERSE_COLUMN_ALIASES if alias in columns), None)
+    if alias is not None:
+        values = raw[columns[alias]].dropna().tolist()
+    else:
+        # 헤더가 없는 목록이면 첫 줄도 종목으로 취급
+        values = [str(raw.columns[0])] + raw.iloc[:, 0].dropna().tolist()
+    return parse_universe(' '.join(values), numeric_suffix)
+
+def metrics_table(found):
+    """(종목, info) 목록을 (종목 × 지표) 표로 변환 - 숫자가 아닌 값은 NaN"""
+    columns = {
+        '종목': [symbol for symbol, _ in found],
+        '종목명': [company_info.get('shortName') or company_info.get('longName') for _, company_info in found],
+        '섹터': [company_info.get('sector') for _, company_info in found],
+    }
+    for key, label in SCREENER_METRICS.items():
+        values = pd.Series([company_info.get(key) for _, company_info in found], dtype=object)
+        columns[label] = pd.to_numeric(values, errors='coerce').to_numpy(dtype=float)
+    return pd.DataFrame(columns)
+
+@traced('transform.screen', 'transform')
+def screen_universe(table, bounds, sectors, sort_by, ascending, limit):
+    """범위 조건 {지표: (최소, 최대)}과 섹터 조건을 한 번에 적용하고 정렬 기준 상위 종목 반환"""
+    mask = np.ones(len(table), dtype=bool)
+    for column, (low, high) in bounds.items():
+        values = table[column].to_numpy()
+        # 값이 없는 종목은 조건을 만족하지 않는 것으로 처리
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+    if sectors:
+        mask &= table['섹터'].isin(sectors).to_numpy()
+    return table[mask].sort_values(sort_by, ascending=ascending, na_position='last').head(limit)
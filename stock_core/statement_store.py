@@ -0,0 +1,108 @@
+"""재무제표 저장소: 6종 재무제표를 (종목, 재무제표, 항목, 기간, 값) 형태로 SQLite에 보관"""
+import sqlite3
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from .tracing import traced
+
+STATEMENT_TYPES = [
+    'income_stmt', 'quarterly_income_stmt',
+    'balance_sheet', 'quarterly_balance_sheet',
+    'cashflow', 'quarterly_cashflow',
+]
+
+
+class StatementStore:
+    """재무제표 로컬 저장소 - 결산일 표시(marker)가 바뀔 때만 다시 받도록 조회 시점의 결산일을 함께 기록"""
+
+    def __init__(self, path, fallback_ttl):
+        self.fallback_ttl = fallback_ttl
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        with self.lock, self.conn:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS statements (
+                    ticker TEXT, statement TEXT, line_item TEXT, period TEXT,
+                    position INTEGER, value REAL,
+                    PRIMARY KEY (ticker, statement, line_item, period)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS filings (
+                    ticker TEXT PRIMARY KEY, marker TEXT, fetched_at REAL
+                );
+            """)
+
+    def is_current(self, ticker, marker):
+        """저장된 재무제표가 최신 결산기 기준인지 확인 (결산일을 모르면 fallback_ttl 동안 유효)"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT marker, fetched_at FROM filings WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        if row is None:
+            return False
+        if marker is None:
+            return time.time() - row[1] <= self.fallback_ttl.total_seconds()
+        return row[0] == marker
+
+    @traced('store.statements.save', 'store')
+    def save(self, ticker, frames, marker):
+        """재무제표별 데이터프레임(항목 × 기간)을 long 형식으로 변환해 재무제표 단위로 교체 - 6종이 모두 있을 때만 결산일을 기록하고 기록 여부 반환"""
+        # 조회 실패가 예외 대신 빈 표로 오는 경우가 있어, 빈 재무제표는 이전 값을 유지하고 다음 조회 때 다시 받도록 함
+        received = [statement for statement, frame in frames.items() if frame is not None and not frame.empty]
+        complete = set(STATEMENT_TYPES) <= set(received)
+        records = []
+        for statement in received:
+            frame = frames[statement]
+            values = frame.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+            rows, cols = np.nonzero(~np.isnan(values))
+            line_items = frame.index.astype(str).to_numpy()
+            periods = pd.to_datetime(frame.columns).strftime('%Y-%m-%d').to_numpy()
+            records.extend(zip(
+                [ticker] * len(rows), [statement] * len(rows), line_items[rows],
+                periods[cols], rows.tolist(), values[rows, cols].tolist()
+            ))
+
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "DELETE FROM statements WHERE ticker = ? AND statement = ?",
+                [(ticker, statement) for statement in received]
+            )
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO statements VALUES (?, ?, ?, ?, ?, ?)", records
+            )
+            if complete:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO filings VALUES (?, ?, ?)", (ticker, marker, time.time())
+                )
+        return complete
+
+    @traced('store.statements.load', 'store')
+    def load(self, ticker, statement):
+        """저장된 재무제표를 화면용 형식(항목 × 기간, 최근 기간 먼저)으로 반환"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT line_item, period, value FROM statements "
+                "WHERE ticker = ? AND statement = ? ORDER BY position",
+                (ticker, statement)
+            ).fetchall()
+
+        if not rows:
+            return pd.DataFrame()
+
+        long = pd.DataFrame(rows, columns=['line_item', 'period', 'value'])
+        frame = long.pivot(index='line_item', columns='period', values='value')
+        frame = frame.reindex(long['line_item'].drop_duplicates())
+        frame = frame[sorted(frame.columns, reverse=True)]
+        frame.columns = pd.to_datetime(frame.columns)
+        frame.index.name = frame.columns.name = None
+        return frame
+
+
+def fiscal_marker(company_info):
+    """최근 분기/연간 결산일 - 값이 바뀌면 새 재무제표가 공시된 것으로 판단"""
+    values = [company_info.get(key) for key in ('mostRecentQuarter', 'lastFiscalYearEnd')]
+    if all(value is None for value in values):
+        return None
+    return ':'.join(str(value) for value in values)
@@ -0,0 +1,165 @@
+"""성능 계측: 조회/변환/렌더링 구간의 소요 시간, 페이로드 크기, 캐시 적중 횟수를 모든 세션에서 수집"""
+import contextlib
+import contextvars
+import functools
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+
+def estimate_size(value):
+    """캐시 항목/응답의 대략적인 메모리 크기 (bytes)"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum()) if isinstance(usage, pd.Series) else int(usage)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class Tracer:
+    """성능 계측기 - 구간(span)별 소요 시간과 크기를 최근 max_spans개까지 보관하고, log_path가 있으면 JSON Lines로도 기록"""
+
+    def __init__(self, max_spans, log_path=None):
+        self.lock = threading.Lock()
+        self.log_lock = threading.Lock()
+        self.spans = deque(maxlen=max_spans)
+        self.cache_counts = {}        # 캐시 이름 -> {'hits': 횟수, 'misses': 횟수}
+        self.runs = itertools.count(1)
+        self.run_var = contextvars.ContextVar('trace_run', default=None)
+        self.log_path = log_path
+
+    def begin_run(self):
+        """스크립트 실행 1회의 번호를 정해 이후 구간(작업 스레드 포함)에 기록"""
+        run = next(self.runs)
+        self.run_var.set(run)
+        return run
+
+    @contextlib.contextmanager
+    def span(self, name, category, **attrs):
+        """with 블록 소요 시간 기록 - yield된 dict에 bytes 등 속성을 추가할 수 있고, 예외는 error 속성으로 남긴 뒤 다시 발생"""
+        record = self._start(name, category, attrs)
+        started = time.perf_counter()
+        try:
+            yield record
+        except BaseException as e:
+            record['error'] = type(e).__name__
+            raise
+        finally:
+            record['duration_ms'] = (time.perf_counter() - started) * 1000
+            self._add(record)
+
+    def record(self, name, category, started, **attrs):
+        """time.perf_counter() 값 started부터 지금까지를 구간으로 기록 (with 블록으로 감싸기 어려운 코드용)"""
+        duration_ms = (time.perf_counter() - started) * 1000
+        record = self._start(name, category, attrs)
+        record['start'] -= duration_ms / 1000
+        record['duration_ms'] = duration_ms
+        self._add(record)
+
+    def _start(self, name, category, attrs):
+        thread = threading.current_thread()
+        return {
+            'name': name, 'category': category, 'run': self.run_var.get(),
+            'thread': thread.name, 'tid': thread.ident, 'start': time.time(), **attrs,
+        }
+
+    def _add(self, record):
+        with self.lock:
+            self.spans.append(record)
+        if self.log_path:
+            with self.log_lock, open(self.log_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+
+    def count(self, cache, hit):
+        """캐시 적중/미스 1회 기록"""
+        with self.lock:
+            counts = self.cache_counts.setdefault(cache, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+
+    def run_spans(self, run):
+        """실행 번호 run에서 기록된 구간 표 (시작 순)"""
+        with self.lock:
+            spans = [record for record in self.spans if record['run'] == run]
+        return pd.DataFrame(spans).sort_values('start') if spans else pd.DataFrame()
+
+    def summary(self):
+        """구간 이름별 호출 수, 합계/평균/p95/최대 소요 시간(ms), 누적 페이로드(MB) - 합계가 큰 순"""
+        with self.lock:
+            frame = pd.DataFrame(list(self.spans))
+        if frame.empty:
+            return frame
+        if 'bytes' not in frame:
+            frame['bytes'] = np.nan
+        grouped = frame.groupby(['category', 'name'])
+        summary = grouped['duration_ms'].agg(
+            count='count', total_ms='sum', mean_ms='mean',
+            p95_ms=lambda durations: durations.quantile(0.95), max_ms='max'
+        )
+        summary['payload_mb'] = grouped['bytes'].sum(min_count=1) / 1024 / 1024
+        return summary.sort_values('total_ms', ascending=False)
+
+    def cache_stats(self):
+        """캐시별 적중/미스 횟수와 적중률(%)"""
+        with self.lock:
+            stats = pd.DataFrame.from_dict(self.cache_counts, orient='index', columns=['hits', 'misses'])
+        requests = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / requests.where(requests > 0) * 100
+        return stats
+
+    def chrome_trace(self):
+        """Chrome 추적 형식(JSON) - chrome://tracing 또는 https://ui.perfetto.dev 에서 스레드별 타임라인으로 확인"""
+        with self.lock:
+            spans = list(self.spans)
+        pid = os.getpid()
+        events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': name}}
+            for tid, name in {record['tid']: record['thread'] for record in spans}.items()
+        ]
+        for record in spans:
+            events.append({
+                'name': record['name'], 'cat': record['category'], 'ph': 'X', 'pid': pid, 'tid': record['tid'],
+                'ts': record['start'] * 1e6, 'dur': record['duration_ms'] * 1000,
+                'args': {key: value for key, value in record.items() if key not in ('name', 'category', 'tid', 'start', 'duration_ms')},
+            })
+        return json.dumps({'traceEvents': events}, ensure_ascii=False, default=str)
+
+
+# 프로세스에서 사용하는 계측기 (앱이 install로 지정, 지정 전에는 계측하지 않음)
+_installed = None
+
+def install(tracer):
+    """모듈 전역 계측기 지정 후 그대로 반환"""
+    global _installed
+    _installed = tracer
+    return tracer
+
+def span(name, category, **attrs):
+    """지정된 계측기의 구간 기록 (계측기가 없으면 기록 없이 빈 dict를 yield)"""
+    if _installed is None:
+        return contextlib.nullcontext({})
+    return _installed.span(name, category, **attrs)
+
+def traced(name, category, payload=False):
+    """함수 호출을 계측 구간으로 기록하는 데코레이터 (payload=True면 반환값 크기도 기록)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name, category) as record:
+                result = func(*args, **kwargs)
+                if payload and _installed is not None:
+                    record['bytes'] = estimate_size(result)
+                return result
+        return wrapper
+    return decorator
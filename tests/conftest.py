@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 저장소 루트의 stock_core 패키지를 설치 없이 임포트
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_core.cache import SharedCache, shared_view
+
+TTL = timedelta(minutes=1)
+
+
+def test_hit_after_miss():
+    cache = SharedCache(max_bytes=1 << 20)
+    calls = []
+    loader = lambda: calls.append(1) or 'value'
+    assert cache.get(('info', 'AAPL'), loader, TTL) == 'value'
+    assert cache.get(('info', 'AAPL'), loader, TTL) == 'value'
+    assert len(calls) == 1
+    assert cache.stats().loc['info', ['hits', 'misses']].tolist() == [1, 1]
+
+
+def test_expired_entry_is_reloaded():
+    cache = SharedCache(max_bytes=1 << 20)
+    calls = []
+    loader = lambda: calls.append(1) or len(calls)
+    cache.get(('prices', 1), loader, timedelta(0))
+    assert cache.get(('prices', 1), loader, timedelta(0)) == 2
+
+
+def test_concurrent_requests_are_coalesced():
+    cache = SharedCache(max_bytes=1 << 20)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return 'value'
+
+    with ThreadPoolExecutor(4) as executor:
+        leader = executor.submit(cache.get, ('info', 'MSFT'), loader, TTL)
+        started.wait(5)
+        followers = [executor.submit(cache.get, ('info', 'MSFT'), loader, TTL) for _ in range(3)]
+        while cache.stats().loc['info', 'coalesced'] < 3:
+            time.sleep(0.01)
+        release.set()
+        assert [future.result() for future in [leader, *followers]] == ['value'] * 4
+    assert len(calls) == 1
+
+
+def test_errors_are_not_cached():
+    cache = SharedCache(max_bytes=1 << 20)
+
+    def failing():
+        raise ConnectionError('down')
+
+    with pytest.raises(ConnectionError):
+        cache.get(('info', 'X'), failing, TTL)
+    assert cache.get(('info', 'X'), lambda: 'ok', TTL) == 'ok'
+    assert cache.stats().loc['info', 'errors'] == 1
+
+
+def test_cacheable_predicate():
+    cache = SharedCache(max_bytes=1 << 20)
+    calls = []
+    loader = lambda: calls.append(1) or None
+    cache.get(('prices', 'X'), loader, TTL, cacheable=lambda value: value is not None)
+    cache.get(('prices', 'X'), loader, TTL, cacheable=lambda value: value is not None)
+    assert len(calls) == 2
+
+
+def test_evicts_least_recently_used():
+    cache = SharedCache(max_bytes=3 * 8000 + 100)
+    for key in 'abc':
+        cache.get(('arr', key), lambda: np.zeros(1000), TTL)
+    cache.get(('arr', 'a'), lambda: None, TTL)
+    cache.get(('arr', 'd'), lambda: np.zeros(1000), TTL)
+    assert ('arr', 'b') not in cache.entries
+    assert ('arr', 'a') in cache.entries
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.stats().loc['arr', 'evictions'] == 1
+
+
+def test_oversized_value_is_not_stored():
+    cache = SharedCache(max_bytes=100)
+    cache.get(('arr', 'big'), lambda: np.zeros(1000), TTL)
+    assert not cache.entries and cache.total_bytes == 0
+
+
+def test_shared_view_isolates_columns():
+    frame = pd.DataFrame({'Close': [1.0, 2.0]})
+    view = shared_view({'data': (frame,)})['data'][0]
+    view['New'] = 0
+    assert 'New' not in frame
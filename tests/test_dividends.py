@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_core.dividends import compute_dividend_stats, dividend_cagr, dividend_ttm, trailing_streak
+
+
+@pytest.fixture
+def dividends():
+    # 2019~2023년 분기 배당, 매년 0.1씩 증가 (2019년 2분기 배당일은 토요일)
+    dates = pd.to_datetime([f'{year}-{month:02d}-15' for year in range(2019, 2024) for month in (3, 6, 9, 12)])
+    values = [0.5 + 0.1 * (date.year - 2019) for date in dates]
+    # get_dividends와 같은 나노초 단위 인덱스
+    return pd.Series(values, index=dates.astype('datetime64[ns]'), name='Dividends')
+
+
+@pytest.fixture
+def prices():
+    index = pd.bdate_range('2018-01-01', '2024-06-30')
+    return pd.DataFrame({'Close': np.linspace(50, 100, len(index))}, index=index)
+
+
+def test_trailing_streak():
+    assert trailing_streak([True, False, True, True]) == 2
+    assert trailing_streak([True, True]) == 2
+    assert trailing_streak([True, False]) == 0
+    assert trailing_streak([]) == 0
+
+
+def test_dividend_cagr():
+    annual = pd.Series([1.0, 1.1, 1.21], index=[2020, 2021, 2022])
+    assert dividend_cagr(annual, 2) == pytest.approx(10.0)
+    assert dividend_cagr(annual, 3) is None
+    assert dividend_cagr(pd.Series([0.0, 1.0]), 1) is None
+
+
+def test_dividend_ttm(dividends):
+    assert dividend_ttm(dividends, as_of='2023-12-31') == pytest.approx(0.9 * 4)
+    assert dividend_ttm(dividends, as_of='2018-12-31') == 0.0
+
+
+def test_stats_merge_previous_close(dividends, prices):
+    stats = compute_dividend_stats(dividends, prices, 2024)
+    events = stats['events']
+    saturday = events[events['날짜'] == pd.Timestamp('2019-06-15')]
+    assert saturday['종가'].iloc[0] == prices['Close'].loc['2019-06-14']
+    last = events.iloc[-1]
+    assert last['TTM 수익률(%)'] == pytest.approx(last['TTM 배당금'] / last['종가'] * 100)
+
+
+def test_stats_without_prices_leave_yield_empty(dividends):
+    events = compute_dividend_stats(dividends, None, 2024)['events']
+    assert events['종가'].isna().all()
+    assert events['TTM 수익률(%)'].isna().all()
+
+
+def test_stats_annual_extends_to_year(dividends, prices):
+    stats = compute_dividend_stats(dividends, prices, 2025)
+    assert list(stats['annual'].index) == list(range(2019, 2026))
+    assert stats['annual'].loc[2024] == 0.0
+    # 2024년은 배당이 없어 연속 배당·증가 기록이 끊김
+    assert stats['paying_streak'] == 0
+    assert stats['growth_streak'] == 0
+
+
+def test_stats_growth(dividends, prices):
+    stats = compute_dividend_stats(dividends, prices, 2024)
+    assert stats['paying_streak'] == 5
+    assert stats['growth_streak'] == 4
+    assert stats['growth_1y'] == pytest.approx((0.9 / 0.8 - 1) * 100)
+    assert stats['cagr_5y'] is None
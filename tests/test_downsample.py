@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_core.downsample import lttb_indices, resample_ohlc
+
+
+@pytest.fixture
+def daily():
+    index = pd.bdate_range('2024-01-01', periods=20)
+    close = np.arange(20, dtype=float) + 100
+    return pd.DataFrame({
+        'Open': close - 0.5, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': np.full(20, 10.0),
+    }, index=index)
+
+
+def test_resample_weekly_aggregates_each_column(daily):
+    weekly = resample_ohlc(daily, 'W-FRI')
+    assert len(weekly) == 4
+    first = weekly.iloc[0]
+    assert first['Open'] == daily['Open'].iloc[0]
+    assert first['High'] == daily['High'].iloc[:5].max()
+    assert first['Low'] == daily['Low'].iloc[:5].min()
+    assert first['Close'] == daily['Close'].iloc[4]
+    assert first['Volume'] == 50.0
+
+
+def test_resample_drops_empty_periods(daily):
+    gapped = pd.concat([daily.iloc[:5], daily.iloc[15:]])
+    assert len(resample_ohlc(gapped, 'W-FRI')) == 2
+
+
+def test_resample_keeps_adjusted_close_when_present(daily):
+    daily['Adj Close'] = daily['Close'] * 0.5
+    assert resample_ohlc(daily, 'W-FRI')['Adj Close'].iloc[0] == daily['Adj Close'].iloc[4]
+
+
+def test_lttb_short_series_is_unchanged():
+    np.testing.assert_array_equal(lttb_indices(np.arange(5.0), np.arange(5.0), 10), np.arange(5))
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.arange(1000, dtype=float)
+    y = np.zeros(1000)
+    y[[137, 612]] = [50.0, -40.0]
+    keep = lttb_indices(x, y, 50)
+    assert len(keep) == 50
+    assert keep[0] == 0 and keep[-1] == 999
+    assert (np.diff(keep) > 0).all()
+    assert {137, 612} <= set(keep.tolist())
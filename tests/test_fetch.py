@@ -0,0 +1,120 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pandas as pd
+import pytest
+from yfinance.exceptions import YFPricesMissingError, YFTzMissingError
+
+from stock_core.fetch import RangeDownloader
+
+START, END = date(2024, 1, 1), date(2024, 2, 1)
+
+
+def frame():
+    return pd.DataFrame({'Close': [1.0, 2.0]}, index=pd.to_datetime(['2024-01-02', '2024-01-03']))
+
+
+class Provider:
+    """창(window)별 응답 목록을 차례로 돌려주는 가짜 공급자 - 예외는 그대로 발생"""
+
+    def __init__(self, **responses):
+        self.responses = responses
+        self.calls = []
+
+    def fetch(self, ticker, interval, **window):
+        key = 'period' if 'period' in window else 'range'
+        self.calls.append((ticker, key))
+        response = self.responses[key].pop(0) if len(self.responses[key]) > 1 else self.responses[key][0]
+        if isinstance(response, BaseException):
+            raise response
+        return response
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def downloader(provider, executor, max_attempts=3):
+    return RangeDownloader(provider.fetch, executor.submit, max_attempts, 0, timedelta(hours=1))
+
+
+def test_returns_first_successful_window(executor):
+    provider = Provider(range=[YFPricesMissingError('AAPL', '')], period=[frame()])
+    errors = []
+    data = downloader(provider, executor).download('AAPL', START, END, errors, 'range', period='1mo')
+    assert data is not None and len(data) == 2
+    assert errors == []
+
+
+def test_transient_errors_are_retried(executor):
+    provider = Provider(range=[ConnectionError('reset'), frame()])
+    errors = []
+    data = downloader(provider, executor).download('AAPL', START, END, errors, 'range')
+    assert data is not None
+    assert len(provider.calls) == 2
+    assert errors == ['range 실패 (1회차): reset']
+
+
+def test_gives_up_after_max_attempts(executor):
+    provider = Provider(range=[TimeoutError('slow')])
+    errors = []
+    assert downloader(provider, executor, max_attempts=2).download('AAPL', START, END, errors, 'range') is None
+    assert len(provider.calls) == 2
+    assert len(errors) == 2
+
+
+def test_missing_prices_in_range_is_not_retried(executor):
+    provider = Provider(range=[YFPricesMissingError('AAPL', '')])
+    errors = []
+    fetcher = downloader(provider, executor)
+    assert fetcher.download('AAPL', START, END, errors, 'range') is None
+    assert len(provider.calls) == 1
+    assert not fetcher.is_unknown('AAPL')
+
+
+def test_symbol_without_timezone_is_unknown_after_last_attempt(executor):
+    # 날짜 범위 요청은 없는 종목에 대해 YFTzMissingError 발생
+    provider = Provider(range=[YFTzMissingError('BADX')])
+    fetcher = downloader(provider, executor)
+    errors = []
+    assert fetcher.download('BADX', START, END, errors, 'range') is None
+    assert len(provider.calls) == 3
+    assert fetcher.is_unknown('BADX')
+    assert errors[-1] == 'range 실패: 존재하지 않는 종목입니다 (BADX)'
+    
+    errors = []
+    assert fetcher.download('BADX', START, END, errors, 'range') is None
+    assert len(provider.calls) == 3
+    assert errors == ['range 실패: 존재하지 않는 종목입니다 (BADX)']
+
+
+def test_timezone_error_that_recovers_is_not_unknown(executor):
+    provider = Provider(range=[YFTzMissingError('AAPL'), frame()])
+    fetcher = downloader(provider, executor)
+    assert fetcher.download('AAPL', START, END, [], 'range') is not None
+    assert not fetcher.is_unknown('AAPL')
+
+
+def test_symbol_missing_prices_in_every_window_is_unknown(executor):
+    # period 요청은 없는 종목에 대해 YFPricesMissingError 발생
+    provider = Provider(range=[YFTzMissingError('BADX')], period=[YFPricesMissingError('BADX', '(period=1mo)')])
+    fetcher = downloader(provider, executor)
+    assert fetcher.download('BADX', START, END, [], 'range', period='1mo') is None
+    assert len(provider.calls) == 2
+    assert fetcher.is_unknown('BADX')
+
+
+def test_period_only_request_without_prices_is_unknown(executor):
+    provider = Provider(period=[YFPricesMissingError('BADX', '(period=1y)')])
+    fetcher = downloader(provider, executor)
+    assert fetcher.download('BADX', None, None, [], 'period=1y', period='1y') is None
+    assert fetcher.is_unknown('BADX')
+
+
+def test_unknown_record_expires(executor):
+    provider = Provider(range=[YFTzMissingError('BADX')])
+    fetcher = RangeDownloader(provider.fetch, executor.submit, 1, 0, timedelta(0))
+    fetcher.download('BADX', START, END, [], 'range')
+    assert not fetcher.is_unknown('BADX')
@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_core.indicators import (
+    StreamingATR, StreamingEMA, StreamingMACD, StreamingRSI, StreamingSMA,
+    compute_indicators, ema, exponential_mean, indicator_atr, indicator_bollinger, indicator_macd,
+    indicator_obv, indicator_rsi, indicator_stochastic, indicator_vwap, price_arrays, rolling_mean,
+    rolling_std,
+)
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, 300))
+    spread = rng.uniform(0.1, 2, 300)
+    index = pd.date_range('2024-01-01', periods=300, freq='B')
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.5, 300),
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, 300).astype(float),
+    }, index=index)
+
+
+def test_rolling_mean_and_std_match_pandas(ohlcv):
+    close = ohlcv['Close']
+    np.testing.assert_allclose(rolling_mean(close.to_numpy(), 20), close.rolling(20).mean().to_numpy(), equal_nan=True)
+    np.testing.assert_allclose(
+        rolling_std(close.to_numpy(), 20), close.rolling(20).std(ddof=0).to_numpy(), rtol=1e-6, equal_nan=True
+    )
+
+
+def test_rolling_mean_short_input_is_all_nan():
+    assert np.isnan(rolling_mean(np.array([1.0, 2.0]), 5)).all()
+
+
+def test_exponential_mean_seeds_with_simple_average():
+    values = np.arange(1.0, 11.0)
+    out = exponential_mean(values, 0.5, 3)
+    assert np.isnan(out[:2]).all()
+    assert out[2] == pytest.approx(2.0)
+    assert out[3] == pytest.approx(0.5 * 4 + 0.5 * 2.0)
+
+
+def test_bollinger_bands_surround_middle(ohlcv):
+    bands = indicator_bollinger(price_arrays(ohlcv), 20, 2.0)
+    valid = ~np.isnan(bands['middle'])
+    assert (bands['upper'][valid] >= bands['middle'][valid]).all()
+    assert (bands['lower'][valid] <= bands['middle'][valid]).all()
+
+
+def test_rsi_range_and_all_gains():
+    rsi = indicator_rsi({'close': np.arange(1.0, 31.0)}, 14)['rsi']
+    assert np.isnan(rsi[:14]).all()
+    assert (rsi[14:] == 100.0).all()
+
+
+def test_rsi_short_input_is_all_nan():
+    assert np.isnan(indicator_rsi({'close': np.arange(5.0)}, 14)['rsi']).all()
+
+
+def test_macd_histogram_is_difference(ohlcv):
+    result = indicator_macd(price_arrays(ohlcv), 12, 26, 9)
+    np.testing.assert_allclose(result['hist'], result['macd'] - result['signal'], equal_nan=True)
+    np.testing.assert_allclose(result['macd'], ema(ohlcv['Close'].to_numpy(), 12) - ema(ohlcv['Close'].to_numpy(), 26))
+
+
+def test_stochastic_within_bounds(ohlcv):
+    result = indicator_stochastic(price_arrays(ohlcv), 14, 3)
+    k = result['k'][~np.isnan(result['k'])]
+    assert ((k >= 0) & (k <= 100)).all()
+
+
+def test_atr_is_positive_and_starts_after_period(ohlcv):
+    atr = indicator_atr(price_arrays(ohlcv), 14)['atr']
+    assert np.isnan(atr[:13]).all()
+    assert (atr[13:] > 0).all()
+
+
+def test_vwap_and_obv():
+    arrays = {
+        'high': np.array([11.0, 12.0, 13.0]), 'low': np.array([9.0, 10.0, 11.0]),
+        'close': np.array([10.0, 11.0, 10.5]), 'volume': np.array([100.0, 200.0, 300.0]),
+    }
+    typical = (arrays['high'] + arrays['low'] + arrays['close']) / 3
+    expected = np.cumsum(typical * arrays['volume']) / np.cumsum(arrays['volume'])
+    np.testing.assert_allclose(indicator_vwap(arrays)['vwap'], expected)
+    np.testing.assert_array_equal(indicator_obv(arrays)['obv'], [0.0, 200.0, -100.0])
+
+
+def test_compute_indicators_keys_by_spec(ohlcv):
+    specs = [('sma', 20), ('ema', 10), ('atr', 14)]
+    results = compute_indicators(price_arrays(ohlcv), specs)
+    assert set(results) == set(specs)
+    assert len(results[('sma', 20)]['sma']) == len(ohlcv)
+
+
+def bars(frame):
+    for timestamp, row in zip(frame.index, frame.to_dict('records')):
+        yield {'time': timestamp, **row}
+
+
+def stream(indicator, frame):
+    return np.array([indicator.update(bar) for bar in bars(frame)])
+
+
+def test_streaming_indicators_match_batch_kernels(ohlcv):
+    arrays = price_arrays(ohlcv)
+    np.testing.assert_allclose(stream(StreamingSMA(20), ohlcv), rolling_mean(arrays['close'], 20), equal_nan=True)
+    np.testing.assert_allclose(stream(StreamingEMA.span(20), ohlcv), ema(arrays['close'], 20), equal_nan=True)
+    np.testing.assert_allclose(stream(StreamingRSI(14), ohlcv), indicator_rsi(arrays, 14)['rsi'], equal_nan=True)
+    np.testing.assert_allclose(stream(StreamingATR(14), ohlcv), indicator_atr(arrays, 14)['atr'], equal_nan=True)
+    np.testing.assert_allclose(
+        stream(StreamingMACD(12, 26, 9), ohlcv), indicator_macd(arrays, 12, 26, 9)['hist'], equal_nan=True
+    )
+
+
+@pytest.mark.parametrize('make', [
+    lambda: StreamingSMA(5), lambda: StreamingEMA.span(5), lambda: StreamingRSI(5),
+    lambda: StreamingATR(5), lambda: StreamingMACD(3, 6, 3),
+])
+def test_streaming_revision_replaces_last_bar(ohlcv, make):
+    frame = ohlcv.iloc[:40]
+    revised, direct = make(), make()
+    for bar in bars(frame.iloc[:-1]):
+        revised.update(bar)
+        direct.update(bar)
+    # 진행 중인 봉이 여러 번 갱신되어도 마지막 값만 반영
+    last = next(bars(frame.iloc[-1:]))
+    revised.update({**last, 'Close': last['Close'] + 5, 'High': last['High'] + 5})
+    assert revised.update(last) == pytest.approx(direct.update(last), nan_ok=True)
+
+
+def test_streaming_ignores_older_bar(ohlcv):
+    indicator = StreamingSMA(3)
+    values = stream(indicator, ohlcv.iloc[:5])
+    stale = next(bars(ohlcv.iloc[:1]))
+    assert indicator.update(stale) == values[-1]
+
@@ -0,0 +1,96 @@
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_core.intraday_store import IntradayStore
+
+TTL = timedelta(minutes=15)
+
+
+def bars(day, count=6):
+    index = pd.date_range(datetime.combine(day, datetime.min.time()) + timedelta(hours=9, minutes=30), periods=count, freq='5min')
+    return pd.DataFrame({'Open': 1.0, 'High': 2.0, 'Low': 0.5, 'Close': np.arange(count, dtype=float), 'Volume': 10.0}, index=index)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return IntradayStore(str(tmp_path), max_bytes=10 * 1024 * 1024, intraday_ttl=TTL)
+
+
+def age(store, ticker, interval, day, seconds):
+    """파티션 저장 시각을 seconds초 전으로 변경"""
+    path = store._path(ticker, interval, day)
+    saved_at = time.time() - seconds
+    os.utime(path, (saved_at, saved_at))
+
+
+def test_save_splits_days_and_load_concatenates(store):
+    first, second = date(2024, 3, 4), date(2024, 3, 5)
+    data = pd.concat([bars(first), bars(second)])
+    store.save('AAPL', '5m', data, first, second + timedelta(days=1))
+    assert os.path.exists(store._path('AAPL', '5m', first))
+    loaded = store.load('AAPL', '5m', second, second + timedelta(days=1))
+    assert len(loaded) == 6
+    assert (loaded.index.date == second).all()
+    assert len(store.load('AAPL', '5m', first, second + timedelta(days=1))) == 12
+
+
+def test_days_without_bars_are_stored_as_empty_partitions(store):
+    saturday = date(2024, 3, 9)
+    store.save('AAPL', '5m', bars(date(2024, 3, 8)), date(2024, 3, 8), saturday + timedelta(days=1))
+    assert store.missing_ranges('AAPL', '5m', saturday, saturday + timedelta(days=1), 7) == []
+    assert store.load('AAPL', '5m', saturday, saturday + timedelta(days=1)) is None
+
+
+def test_missing_ranges_groups_days_up_to_max_days(store):
+    start = date(2024, 3, 1)
+    store.save('AAPL', '5m', bars(date(2024, 3, 4)), date(2024, 3, 4), date(2024, 3, 5))
+    ranges = store.missing_ranges('AAPL', '5m', start, date(2024, 3, 12), max_days=3)
+    assert ranges == [
+        (date(2024, 3, 1), date(2024, 3, 4)),
+        (date(2024, 3, 5), date(2024, 3, 8)),
+        (date(2024, 3, 8), date(2024, 3, 11)),
+        (date(2024, 3, 11), date(2024, 3, 12)),
+    ]
+
+
+def test_partition_of_an_open_day_expires_after_ttl(store):
+    today = datetime.now().date()
+    store.save('AAPL', '1m', bars(today), today, today + timedelta(days=1))
+    assert store.missing_ranges('AAPL', '1m', today, today + timedelta(days=1), 7) == []
+    age(store, 'AAPL', '1m', today, TTL.total_seconds() + 60)
+    assert store.missing_ranges('AAPL', '1m', today, today + timedelta(days=1), 7) == [(today, today + timedelta(days=1))]
+
+
+def test_partition_saved_mid_session_is_not_settled_by_server_timezone(store, monkeypatch):
+    # 서울 서버에서 자정(UTC 15시)에 저장한 3월 5일 파티션은 뉴욕 장중 데이터
+    monkeypatch.setenv('TZ', 'Asia/Seoul')
+    time.tzset()
+    try:
+        day = date(2024, 3, 5)
+        store.save('AAPL', '5m', bars(day), day, day + timedelta(days=1))
+        saved_at = datetime(2024, 3, 5, 15, tzinfo=timezone.utc).timestamp()
+        os.utime(store._path('AAPL', '5m', day), (saved_at, saved_at))
+        assert store.missing_ranges('AAPL', '5m', day, day + timedelta(days=1), 7) == [(day, day + timedelta(days=1))]
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_evict_removes_oldest_partitions(tmp_path):
+    store = IntradayStore(str(tmp_path), max_bytes=1, intraday_ttl=TTL)
+    day = date(2024, 3, 4)
+    store.save('AAPL', '5m', bars(day), day, day + timedelta(days=1))
+    assert store.total_bytes <= 1
+    assert not os.path.exists(store._path('AAPL', '5m', day))
+
+
+def test_total_bytes_counts_existing_files(store, tmp_path):
+    day = date(2024, 3, 4)
+    store.save('AAPL', '5m', bars(day), day, day + timedelta(days=1))
+    reopened = IntradayStore(str(tmp_path), max_bytes=10 * 1024 * 1024, intraday_ttl=TTL)
+    assert reopened.total_bytes == store.total_bytes > 0
@@ -0,0 +1,157 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_core.portfolio import (
+    PortfolioStore, closes_as_of, portfolio_timeseries, read_trade_file, timeseries_summary,
+)
+
+
+@pytest.fixture
+def store():
+    store = PortfolioStore()
+    store.extend([' aapl', 'MSFT', 'AAPL'], ['2024-01-02', '2024-01-03', '2024-02-01'], [100.0, 300.0, 120.0], [10, 2, 5])
+    return store
+
+
+def test_extend_normalizes_tickers_and_keeps_totals(store):
+    assert len(store) == 3
+    assert store.to_frame()['종목'].tolist() == ['AAPL', 'MSFT', 'AAPL']
+    assert store.symbol_totals == {'AAPL': [15.0, 1600.0], 'MSFT': [2.0, 600.0]}
+    assert store.total_cost == pytest.approx(2200.0)
+
+
+def test_arrays_grow_past_initial_capacity():
+    store = PortfolioStore()
+    for i in range(40):
+        store.append('AAPL', '2024-01-02', 10.0, 1)
+    assert len(store) == 40
+    assert len(store.tickers) >= 40
+    assert store.symbol_totals['AAPL'] == [40.0, 400.0]
+
+
+def test_delete_rows_updates_totals(store):
+    store.delete_rows([1, 1, 7])
+    assert store.to_frame()['종목'].tolist() == ['AAPL', 'AAPL']
+    assert store.symbols() == ['AAPL']
+    assert store.total_cost == pytest.approx(1600.0)
+
+
+def test_totals_skip_unpriced_symbols(store):
+    total_cost, total_value, profit_loss = store.totals({'AAPL': 110.0})
+    assert total_cost == pytest.approx(2200.0)
+    assert total_value == pytest.approx(1650.0)
+    assert profit_loss == pytest.approx(50.0)
+
+
+def test_clear_resets_everything(store):
+    store.clear()
+    assert len(store) == 0
+    assert store.totals({'AAPL': 1.0}) == (0.0, 0.0, 0.0)
+    assert store.to_frame().empty
+
+
+def test_to_frame_dates_are_days(store):
+    frame = store.to_frame()
+    assert frame['매수날짜'].iloc[0] == pd.Timestamp('2024-01-02')
+    assert np.issubdtype(frame['매수가'].dtype, np.floating)
+
+
+def named(text, name):
+    buffer = io.StringIO(text)
+    buffer.name = name
+    return buffer
+
+
+def test_read_trade_file_maps_english_columns():
+    trades = read_trade_file(named("Symbol,Date,Price,Qty\n aapl ,2024-01-02 15:30,101.5,3\n", 'trades.csv'))
+    assert trades.columns.tolist() == ['종목', '매수날짜', '매수가', '수량']
+    assert trades.iloc[0].tolist() == ['AAPL', pd.Timestamp('2024-01-02'), 101.5, 3]
+
+
+def test_read_trade_file_without_price_column():
+    trades = read_trade_file(named("종목,매수날짜,수량\nMSFT,2024-01-02,1\n", 'trades.CSV'))
+    assert np.isnan(trades.loc[0, '매수가'])
+
+
+def test_read_trade_file_reports_missing_columns():
+    with pytest.raises(ValueError, match='수량'):
+        read_trade_file(named("ticker,date\nAAPL,2024-01-02\n", 'trades.csv'))
+
+
+def test_read_trade_file_reads_xlsx():
+    pytest.importorskip('openpyxl')
+    buffer = io.BytesIO()
+    pd.DataFrame({'ticker': ['aapl'], 'date': ['2024-01-02'], 'shares': [2]}).to_excel(buffer, index=False)
+    buffer.seek(0)
+    buffer.name = 'trades.xlsx'
+    assert read_trade_file(buffer)['종목'].tolist() == ['AAPL']
+
+
+CLOSES = pd.Series([10.0, np.nan, 12.0, 13.0], index=pd.to_datetime(['2024-01-03', '2024-01-04', '2024-01-05', '2024-01-08']))
+
+
+def test_closes_as_of_uses_previous_session():
+    dates = pd.to_datetime(['2024-01-05', '2024-01-06', '2024-01-04', '2024-01-01', '2024-02-01']).to_numpy()
+    assert closes_as_of(CLOSES, dates).tolist() == [12.0, 12.0, 10.0, 10.0, 13.0]
+
+
+def test_closes_as_of_next_fallback():
+    dates = pd.to_datetime(['2024-01-06', '2024-01-04', '2024-02-01']).to_numpy()
+    assert closes_as_of(CLOSES, dates, fallback='next').tolist() == [13.0, 12.0, 13.0]
+
+
+def test_closes_as_of_without_closes_is_nan():
+    result = closes_as_of(pd.Series(dtype=float), pd.to_datetime(['2024-01-05']).to_numpy())
+    assert np.isnan(result).all()
+
+
+def test_closes_as_of_rejects_unknown_fallback():
+    with pytest.raises(ValueError):
+        closes_as_of(CLOSES, [], fallback='nearest')
+
+
+@pytest.fixture
+def closes():
+    index = pd.bdate_range('2024-01-01', periods=5)
+    return pd.DataFrame({'AAPL': [10.0, 11.0, 12.0, 12.0, 9.0], 'MSFT': [100.0, 100.0, 110.0, 120.0, 120.0]}, index=index)
+
+
+def positions(rows):
+    return pd.DataFrame(rows, columns=['종목', '매수날짜', '매수가', '수량']).astype({'매수날짜': 'datetime64[ns]'})
+
+
+def test_timeseries_values_holdings_from_buy_date(closes):
+    series = portfolio_timeseries(positions([('AAPL', '2024-01-01', 10.0, 2), ('MSFT', '2024-01-03', 110.0, 1)]), closes)
+    assert series['평가액'].tolist() == [20.0, 22.0, 134.0, 144.0, 138.0]
+    assert series['투자원금'].tolist() == [20.0, 20.0, 130.0, 130.0, 130.0]
+    assert series['손익'].iloc[-1] == pytest.approx(8.0)
+
+
+def test_timeseries_twr_excludes_new_money(closes):
+    series = portfolio_timeseries(positions([('AAPL', '2024-01-01', 10.0, 1), ('AAPL', '2024-01-04', 12.0, 9)]), closes)
+    # 종가가 그대로인 날의 추가 매수는 수익률을 바꾸지 않으므로 누적 수익률은 종가 변동률과 같음
+    expected = closes['AAPL'] / closes['AAPL'].iloc[0] - 1
+    np.testing.assert_allclose(series['누적 수익률(%)'].to_numpy(), expected.to_numpy() * 100)
+    assert series['낙폭(%)'].min() == pytest.approx((9.0 / 12.0 - 1) * 100)
+
+
+def test_timeseries_maps_buy_dates_to_trading_days(closes):
+    # 휴장일 매수는 다음 거래일, 마지막 종가 이후 매수는 마지막 거래일에 반영하고 종가가 없는 종목은 제외
+    series = portfolio_timeseries(positions([
+        ('MSFT', '2024-01-03', 110.0, 1), ('AAPL', '2024-02-01', 9.0, 1), ('ZZZ', '2024-01-01', 1.0, 1),
+    ]), closes)
+    assert series.index[0] == pd.Timestamp('2024-01-03')
+    assert series['투자원금'].tolist() == [110.0, 110.0, 119.0]
+
+
+def test_timeseries_summary():
+    index = pd.date_range('2023-01-01', periods=3, freq='200D')
+    series = pd.DataFrame({'누적 수익률(%)': [0.0, 10.0, 21.0], '일간 수익률(%)': [0.0, 10.0, 10.0], '낙폭(%)': [0.0, 0.0, -5.0]}, index=index)
+    summary = timeseries_summary(series)
+    assert summary['twr'] == pytest.approx(21.0)
+    assert summary['annualized'] == pytest.approx((1.21 ** (365 / 400) - 1) * 100)
+    assert summary['max_drawdown'] == -5.0
+    assert timeseries_summary(series.iloc[:2])['annualized'] is None
@@ -0,0 +1,115 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from stock_core.price_store import PriceStore
+
+TTL = timedelta(minutes=15)
+
+
+def frame(start, end):
+    index = pd.bdate_range(start, end - timedelta(days=1))
+    return pd.DataFrame({column: 1.0 for column in PriceStore.COLUMNS}, index=index)
+
+
+@pytest.fixture
+def store():
+    return PriceStore(':memory:', max_rows=1_000, intraday_ttl=TTL)
+
+
+def coverage_rows(store, ticker):
+    return store.conn.execute("SELECT COUNT(*) FROM coverage WHERE ticker = ?", (ticker,)).fetchone()[0]
+
+
+def test_save_and_load(store):
+    start, end = date(2024, 1, 1), date(2024, 2, 1)
+    store.save('AAPL', frame(start, end), start, end)
+    loaded = store.load('AAPL', date(2024, 1, 8), date(2024, 1, 13))
+    assert loaded.index.tolist() == list(pd.bdate_range('2024-01-08', '2024-01-12'))
+    assert store.load('MSFT', start, end) is None
+    assert store.has_data('AAPL') and not store.has_data('MSFT')
+
+
+def test_missing_intervals(store):
+    store.save('AAPL', frame(date(2024, 1, 1), date(2024, 2, 1)), date(2024, 1, 1), date(2024, 2, 1))
+    store.save('AAPL', frame(date(2024, 3, 1), date(2024, 4, 1)), date(2024, 3, 1), date(2024, 4, 1))
+    assert store.missing_intervals('AAPL', date(2023, 12, 1), date(2024, 5, 1)) == [
+        (date(2023, 12, 1), date(2024, 1, 1)),
+        (date(2024, 2, 1), date(2024, 3, 1)),
+        (date(2024, 4, 1), date(2024, 5, 1)),
+    ]
+    assert store.covers('AAPL', date(2024, 1, 5), date(2024, 1, 20))
+
+
+def test_adjacent_coverage_is_merged(store):
+    start = date(2024, 1, 1)
+    for week in range(20):
+        week_start = start + timedelta(weeks=week)
+        store.save('AAPL', frame(week_start, week_start + timedelta(weeks=1)), week_start, week_start + timedelta(weeks=1))
+    assert coverage_rows(store, 'AAPL') == 1
+    assert store.valid_intervals('AAPL') == [(start, start + timedelta(weeks=20))]
+
+
+def test_expired_recent_coverage_is_trimmed(store):
+    today = date.today()
+    fetched_at = time.time() - 2 * TTL.total_seconds()
+    store.conn.execute(
+        "INSERT INTO coverage VALUES (?, ?, ?, ?)",
+        ('AAPL', (today - timedelta(days=30)).isoformat(), (today + timedelta(days=1)).isoformat(), fetched_at)
+    )
+    before = store.valid_intervals('AAPL')
+    # 다른 구간 저장 시 병합되어도 만료된 당일 구간은 되살아나지 않음
+    old = today - timedelta(days=400)
+    store.save('AAPL', frame(old, old + timedelta(days=7)), old, old + timedelta(days=7))
+    assert store.valid_intervals('AAPL')[-1] == before[-1]
+    assert store.missing_intervals('AAPL', today - timedelta(days=1), today + timedelta(days=1))
+
+
+def test_settled_date_ignores_server_timezone(store, monkeypatch):
+    # 서울 서버에서 자정(UTC 15시)은 뉴욕 장중이므로 3월 5일 봉은 아직 확정되지 않음
+    monkeypatch.setenv('TZ', 'Asia/Seoul')
+    time.tzset()
+    try:
+        fetched_at = datetime(2024, 3, 5, 15, tzinfo=timezone.utc).timestamp()
+        store.conn.execute(
+            "INSERT INTO coverage VALUES (?, ?, ?, ?)", ('AAPL', '2024-03-01', '2024-03-06', fetched_at)
+        )
+        assert store.missing_intervals('AAPL', date(2024, 3, 1), date(2024, 3, 6)) == [
+            (date(2024, 3, 5), date(2024, 3, 6))
+        ]
+        # 병합 후에도 장중 봉은 확정 구간에 들어가지 않음
+        store.save('AAPL', frame(date(2024, 1, 1), date(2024, 1, 8)), date(2024, 1, 1), date(2024, 1, 8))
+        assert store.valid_intervals('AAPL')[-1] == (date(2024, 3, 1), date(2024, 3, 5))
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_fresh_recent_coverage_is_kept(store):
+    today = date.today()
+    start = today - timedelta(days=10)
+    store.save('AAPL', frame(start, today + timedelta(days=1)), start, today + timedelta(days=1))
+    assert store.covers('AAPL', start, today + timedelta(days=1))
+
+
+def test_row_count_and_eviction():
+    store = PriceStore(':memory:', max_rows=50, intraday_ttl=TTL)
+    start, end = date(2024, 1, 1), date(2024, 2, 1)  # 23 거래일
+    store.save('A', frame(start, end), start, end)
+    store.save('A', frame(start, end), start, end)
+    assert store.total_rows == 23
+    store.save('B', frame(start, end), start, end)
+    store.load('A', start, end)
+    store.save('C', frame(start, end), start, end)
+    # 가장 오래 사용하지 않은 B가 제거됨
+    assert not store.has_data('B') and store.has_data('A') and store.has_data('C')
+    assert store.total_rows == store.conn.execute("SELECT COUNT(*) FROM bars").fetchone()[0] == 46
+
+
+def test_row_count_survives_reopen(tmp_path):
+    path = str(tmp_path / 'prices.sqlite3')
+    start, end = date(2024, 1, 1), date(2024, 2, 1)
+    PriceStore(path, max_rows=1_000, intraday_ttl=TTL).save('A', frame(start, end), start, end)
+    assert PriceStore(path, max_rows=1_000, intraday_ttl=TTL).total_rows == 23
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+from yfinance.exceptions import YFPricesMissingError, YFTickerMissingError
+
+from stock_core import tracing
+from stock_core.providers import (
+    DataProvider, FixtureStore, RecordingProvider, ReplayProvider, TracedProvider, normalize_dataframe,
+)
+from stock_core.tracing import Tracer
+
+
+def bars(start='2024-01-02', periods=5, tz='America/New_York'):
+    index = pd.date_range(start, periods=periods, freq='B', tz=tz)
+    close = np.arange(1.0, periods + 1)
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Adj Close': close * 0.9, 'Volume': close * 100,
+    }, index=index)
+
+
+class FakeProvider(DataProvider):
+    name = 'fake'
+
+    def history(self, ticker, interval, **window):
+        return bars()
+
+    def download(self, symbols, interval='1d', **window):
+        return pd.concat({symbol: bars() for symbol in symbols}, axis=1).swaplevel(0, 1, axis=1)
+
+    def info(self, symbol):
+        return {'symbol': symbol, 'longName': f'{symbol} Inc.'}
+
+    def dividends(self, symbol):
+        return pd.Series([0.2, 0.25], index=pd.to_datetime(['2023-05-01', '2023-11-01']), name='Dividends')
+
+    def statement(self, symbol, name):
+        return pd.DataFrame({'2023-12-31': [1.0]}, index=['Total Revenue'])
+
+
+def test_normalize_drops_timezone_and_extra_columns():
+    data = bars().assign(Dividends=0.0)
+    normalized = normalize_dataframe(data, 'AAPL')
+    assert list(normalized.columns) == ['Open', 'High', 'Low', 'Close', 'Volume', 'Adj Close']
+    assert normalized.index.tz is None and normalized.index.name == 'Date'
+
+
+def test_normalize_selects_ticker_from_multi_column_frame():
+    data = FakeProvider().download(['AAPL', 'MSFT'])
+    assert normalize_dataframe(data, 'MSFT')['Close'].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert normalize_dataframe(data, 'TSLA') is None
+
+
+def test_normalize_fills_adjusted_close_and_rejects_incomplete():
+    data = bars().drop(columns='Adj Close')
+    assert (normalize_dataframe(data, 'X')['Adj Close'] == data['Close'].to_numpy()).all()
+    assert normalize_dataframe(bars().drop(columns='Volume'), 'X') is None
+    assert normalize_dataframe(pd.DataFrame(), 'X') is None
+
+
+def test_record_then_replay(tmp_path):
+    fixtures = FixtureStore(str(tmp_path))
+    recorder = RecordingProvider(FakeProvider(), fixtures)
+    recorder.history('AAPL', '1d', start='2024-01-01', end='2024-02-01')
+    recorder.download(['MSFT', '005930.KS'], '1d', period='1mo')
+    recorder.info('AAPL')
+    recorder.dividends('AAPL')
+    recorder.statement('AAPL', 'income_stmt')
+
+    replay = ReplayProvider(fixtures)
+    history = replay.history('AAPL', '1d', start='2024-01-03', end='2024-01-05')
+    assert history.index.tolist() == list(pd.to_datetime(['2024-01-03', '2024-01-04']))
+    downloaded = replay.download(['MSFT', '005930.KS', 'NONE'], '1d', start='2024-01-01', end='2024-02-01')
+    assert sorted(downloaded['Close'].columns) == ['005930.KS', 'MSFT']
+    assert replay.info('AAPL')['longName'] == 'AAPL Inc.'
+    assert replay.dividends('AAPL').tolist() == [0.2, 0.25]
+    assert replay.statement('AAPL', 'income_stmt').loc['Total Revenue'].iloc[0] == 1.0
+
+
+def test_replay_missing_fixtures(tmp_path):
+    fixtures = FixtureStore(str(tmp_path))
+    replay = ReplayProvider(fixtures)
+    with pytest.raises(YFTickerMissingError):
+        replay.history('NONE', '1d', period='1mo')
+    fixtures.merge_history('OLD', '1d', normalize_dataframe(bars(start='2000-01-03'), 'OLD'))
+    with pytest.raises(YFPricesMissingError):
+        replay.history('OLD', '1d', period='1mo')
+    assert replay.info('NONE') == {}
+    assert replay.dividends('NONE').empty
+    assert replay.statement('NONE', 'income_stmt').empty
+
+
+def test_merge_history_keeps_latest_values(tmp_path):
+    fixtures = FixtureStore(str(tmp_path))
+    first = normalize_dataframe(bars(periods=3), 'A')
+    second = normalize_dataframe(bars(start='2024-01-03', periods=3), 'A') * 2
+    fixtures.merge_history('A', '1d', first)
+    fixtures.merge_history('A', '1d', second)
+    merged = fixtures.read_frame('history', '1d', 'A')
+    assert len(merged) == 4
+    assert merged['Close'].tolist() == [1.0, 2.0, 4.0, 6.0]
+
+
+def test_traced_provider_records_spans():
+    tracer = tracing.install(Tracer(max_spans=10))
+    try:
+        TracedProvider(FakeProvider()).info('AAPL')
+    finally:
+        tracing.install(None)
+    [span] = tracer.spans
+    assert (span['name'], span['provider'], span['target']) == ('fetch.info', 'fake', 'AAPL')
+    assert span['bytes'] > 0
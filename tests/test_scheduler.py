@@ -0,0 +1,102 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from yfinance.exceptions import YFRateLimitError
+
+from stock_core.scheduler import (
+    PRIORITY_BULK, PRIORITY_INTERACTIVE, PRIORITY_PREFETCH, RequestScheduler, is_rate_limited,
+    request_priority, submit_in_context,
+)
+
+
+def make_scheduler(**overrides):
+    options = dict(max_rate=1000.0, min_rate=0.5, burst=10, rate_step=0.1, backoff=0.05, max_backoff=0.2)
+    options.update(overrides)
+    return RequestScheduler(**options)
+
+
+def test_is_rate_limited():
+    assert is_rate_limited(YFRateLimitError())
+    assert is_rate_limited(RuntimeError('HTTP Error 429: Too Many Requests'))
+    assert not is_rate_limited(ConnectionError('reset'))
+
+
+def test_call_counts_priority_from_context():
+    scheduler = make_scheduler()
+    assert scheduler.call('a', lambda: 1) == 1
+    token = request_priority.set(PRIORITY_BULK)
+    try:
+        scheduler.call('b', lambda: 2)
+    finally:
+        request_priority.reset(token)
+    status = scheduler.status()
+    assert (status['화면'], status['일괄']) == (1, 1)
+
+
+def test_same_key_is_deduplicated():
+    scheduler = make_scheduler()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(5)
+        return 'value'
+
+    with ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(scheduler.call, 'key', loader) for _ in range(3)]
+        while scheduler.status()['deduplicated'] < 2:
+            time.sleep(0.01)
+        release.set()
+        assert [future.result() for future in futures] == ['value'] * 3
+    assert len(calls) == 1
+
+
+def test_higher_priority_is_served_first():
+    scheduler = make_scheduler(max_rate=20.0, burst=1)
+    scheduler.call('warmup', lambda: None)
+    order = []
+    with ThreadPoolExecutor(2) as executor:
+        prefetch = executor.submit(scheduler.call, 'p', lambda: order.append('prefetch'), PRIORITY_PREFETCH)
+        time.sleep(0.01)
+        interactive = executor.submit(scheduler.call, 'i', lambda: order.append('interactive'), PRIORITY_INTERACTIVE)
+        prefetch.result(5)
+        interactive.result(5)
+    assert order == ['interactive', 'prefetch']
+
+
+def test_rate_limit_halves_rate_and_pauses():
+    scheduler = make_scheduler(max_rate=8.0)
+
+    def throttled():
+        raise YFRateLimitError()
+
+    with pytest.raises(YFRateLimitError):
+        scheduler.call('x', throttled)
+    status = scheduler.status()
+    assert status['rate'] == 4.0
+    assert status['throttled'] == 1
+    assert 0 < status['paused'] <= 0.05
+
+    scheduler.call('y', lambda: None)
+    assert scheduler.status()['rate'] == pytest.approx(4.1)
+
+
+def test_failed_call_releases_key():
+    scheduler = make_scheduler()
+    with pytest.raises(ValueError):
+        scheduler.call('k', lambda: (_ for _ in ()).throw(ValueError('bad')))
+    assert scheduler.call('k', lambda: 'retry') == 'retry'
+
+
+def test_submit_in_context_sets_priority():
+    with ThreadPoolExecutor(1) as executor:
+        assert executor.submit(request_priority.get).result() == PRIORITY_INTERACTIVE
+        assert submit_in_context(executor, request_priority.get, priority=PRIORITY_BULK).result() == PRIORITY_BULK
+        token = request_priority.set(PRIORITY_PREFETCH)
+        try:
+            assert submit_in_context(executor, request_priority.get).result() == PRIORITY_PREFETCH
+        finally:
+            request_priority.reset(token)
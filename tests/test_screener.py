@@ -0,0 +1,59 @@
+import io
+
+import numpy as np
+import pytest
+
+from stock_core.screener import metrics_table, parse_universe, read_universe_file, screen_universe
+
+
+def named(content, name):
+    buffer = io.BytesIO(content.encode('utf-8'))
+    buffer.name = name
+    return buffer
+
+
+def test_parse_universe_adds_suffix_and_dedupes():
+    assert parse_universe('aapl, 005930\nMSFT;aapl  035720', '.KQ') == ['AAPL', '005930.KQ', 'MSFT', '035720.KQ']
+    assert parse_universe('  \n ') == []
+
+
+def test_read_universe_file_uses_symbol_column():
+    content = 'Name,Symbol\nApple,aapl\nSamsung,005930\n'
+    assert read_universe_file(named(content, 'sp500.csv')) == ['AAPL', '005930.KS']
+
+
+def test_read_universe_file_without_header_keeps_first_row():
+    assert read_universe_file(named('AAPL\nMSFT\n', 'list.csv')) == ['AAPL', 'MSFT']
+
+
+def test_read_universe_text_file():
+    assert read_universe_file(named('AAPL MSFT\n000660', 'list.txt')) == ['AAPL', 'MSFT', '000660.KS']
+
+
+@pytest.fixture
+def table():
+    return metrics_table([
+        ('AAPL', {'shortName': 'Apple', 'sector': 'Technology', 'trailingPE': 30.0, 'marketCap': 3e12, 'dividendYield': 0.5}),
+        ('JPM', {'longName': 'JPMorgan', 'sector': 'Financial Services', 'trailingPE': 12.0, 'marketCap': 6e11, 'dividendYield': 2.2}),
+        ('XOM', {'shortName': 'Exxon', 'sector': 'Energy', 'trailingPE': 'Infinity', 'marketCap': 5e11}),
+        ('NEW', {'shortName': 'New', 'sector': 'Technology', 'trailingPE': None}),
+    ])
+
+
+def test_metrics_table_columns(table):
+    assert table['종목명'].tolist() == ['Apple', 'JPMorgan', 'Exxon', 'New']
+    assert table['P/E'].dtype == float
+    assert np.isinf(table.loc[2, 'P/E'])
+    assert np.isnan(table.loc[3, 'P/E'])
+
+
+def test_screen_applies_bounds_sector_and_sort(table):
+    result = screen_universe(table, {'P/E': (None, 40.0)}, [], '시가총액', False, 10)
+    assert result['종목'].tolist() == ['AAPL', 'JPM']
+    result = screen_universe(table, {}, ['Technology'], 'P/E', True, 10)
+    assert result['종목'].tolist() == ['AAPL', 'NEW']
+
+
+def test_screen_missing_values_fail_bounds_and_limit_applies(table):
+    assert screen_universe(table, {'배당 수익률(%)': (0.0, None)}, [], 'P/E', True, 10)['종목'].tolist() == ['JPM', 'AAPL']
+    assert len(screen_universe(table, {}, [], '시가총액', False, 2)) == 2
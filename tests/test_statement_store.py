@@ -0,0 +1,84 @@
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_core.statement_store import STATEMENT_TYPES, StatementStore, fiscal_marker
+
+
+def statement(values, periods=('2024-09-30', '2023-09-30')):
+    return pd.DataFrame(values, index=pd.to_datetime(list(periods))).T
+
+
+@pytest.fixture
+def store():
+    return StatementStore(':memory:', fallback_ttl=timedelta(days=1))
+
+
+@pytest.fixture
+def frames():
+    return {
+        name: statement({'Total Revenue': [391.0, 383.0], 'Net Income': [94.0, np.nan]})
+        for name in STATEMENT_TYPES
+    }
+
+
+def test_save_and_load_round_trip(store, frames):
+    store.save('AAPL', frames, '1727654400:1727654400')
+    loaded = store.load('AAPL', 'income_stmt')
+    assert loaded.index.tolist() == ['Total Revenue', 'Net Income']
+    assert loaded.columns.tolist() == list(pd.to_datetime(['2024-09-30', '2023-09-30']))
+    assert loaded.loc['Total Revenue'].tolist() == [391.0, 383.0]
+    assert np.isnan(loaded.loc['Net Income', pd.Timestamp('2023-09-30')])
+
+
+def test_unknown_ticker_loads_empty(store):
+    assert store.load('MSFT', 'cashflow').empty
+
+
+def test_is_current_follows_marker(store, frames):
+    assert not store.is_current('AAPL', 'q1')
+    store.save('AAPL', frames, 'q1')
+    assert store.is_current('AAPL', 'q1')
+    assert not store.is_current('AAPL', 'q2')
+
+
+def test_without_marker_fallback_ttl_applies(frames):
+    store = StatementStore(':memory:', fallback_ttl=timedelta(0))
+    store.save('AAPL', frames, None)
+    time.sleep(0.01)
+    assert not store.is_current('AAPL', None)
+
+
+def test_save_replaces_previous_rows(store, frames):
+    store.save('AAPL', frames, 'q1')
+    frames['income_stmt'] = statement({'Total Revenue': [400.0]}, periods=('2025-09-30',))
+    store.save('AAPL', frames, 'q2')
+    assert store.load('AAPL', 'income_stmt').shape == (1, 1)
+
+
+def test_fiscal_marker():
+    assert fiscal_marker({}) is None
+    assert fiscal_marker({'mostRecentQuarter': 1, 'lastFiscalYearEnd': 2}) == '1:2'
+    assert fiscal_marker({'lastFiscalYearEnd': 2}) == 'None:2'
+
+
+@pytest.mark.parametrize('failed', [pd.DataFrame(), None])
+def test_empty_statement_keeps_previous_rows_and_marker(store, frames, failed):
+    store.save('AAPL', frames, 'q1')
+    # yfinance는 조회 실패를 예외 대신 빈 데이터프레임으로 돌려줄 수 있음
+    refreshed = dict(frames, cashflow=failed, income_stmt=statement({'Total Revenue': [400.0]}, periods=('2025-09-30',)))
+    assert not store.save('AAPL', refreshed, 'q2')
+    assert not store.is_current('AAPL', 'q2')
+    assert store.is_current('AAPL', 'q1')
+    assert store.load('AAPL', 'cashflow').loc['Total Revenue'].tolist() == [391.0, 383.0]
+    assert store.load('AAPL', 'income_stmt').shape == (1, 1)
+
+
+def test_first_save_with_empty_statement_is_not_current(store, frames):
+    frames['quarterly_balance_sheet'] = pd.DataFrame()
+    assert not store.save('AAPL', frames, 'q1')
+    assert not store.is_current('AAPL', 'q1')
+    assert not store.load('AAPL', 'income_stmt').empty
@@ -0,0 +1,112 @@
+import contextvars
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from stock_core import tracing
+from stock_core.tracing import Tracer, estimate_size, traced
+
+
+@pytest.fixture(autouse=True)
+def uninstall():
+    yield
+    tracing.install(None)
+
+
+def test_span_records_duration_and_attrs():
+    tracer = Tracer(max_spans=10)
+    run = tracer.begin_run()
+    with tracer.span('load.prices', 'load', ticker='AAPL') as record:
+        record['bytes'] = 128
+    spans = tracer.run_spans(run)
+    assert spans['name'].tolist() == ['load.prices']
+    assert spans.iloc[0]['ticker'] == 'AAPL'
+    assert spans.iloc[0]['bytes'] == 128
+    assert spans.iloc[0]['duration_ms'] >= 0
+
+
+def test_span_keeps_error_and_reraises():
+    tracer = Tracer(max_spans=10)
+    with pytest.raises(ValueError):
+        with tracer.span('fetch.history', 'fetch'):
+            raise ValueError('boom')
+    assert tracer.spans[0]['error'] == 'ValueError'
+
+
+def test_only_recent_spans_are_kept():
+    tracer = Tracer(max_spans=3)
+    for i in range(5):
+        with tracer.span(f'step{i}', 'transform'):
+            pass
+    assert [record['name'] for record in tracer.spans] == ['step2', 'step3', 'step4']
+
+
+def test_worker_thread_spans_share_the_run():
+    tracer = Tracer(max_spans=10)
+    run = tracer.begin_run()
+    ctx = contextvars.copy_context()
+
+    def work():
+        with tracer.span('fetch.info', 'fetch'):
+            pass
+    worker = threading.Thread(target=ctx.run, args=(work,))
+    worker.start()
+    worker.join()
+    assert tracer.run_spans(run)['name'].tolist() == ['fetch.info']
+
+
+def test_summary_and_cache_stats():
+    tracer = Tracer(max_spans=10)
+    for _ in range(2):
+        with tracer.span('load.info', 'load') as record:
+            record['bytes'] = 1024 * 1024
+    tracer.count('shared', hit=False)
+    tracer.count('shared', hit=True)
+    summary = tracer.summary()
+    assert summary.loc[('load', 'load.info'), 'count'] == 2
+    assert summary.loc[('load', 'load.info'), 'payload_mb'] == pytest.approx(2.0)
+    assert tracer.cache_stats().loc['shared', 'hit_rate'] == pytest.approx(50.0)
+
+
+def test_log_path_writes_json_lines(tmp_path):
+    log_path = tmp_path / 'trace.jsonl'
+    tracer = Tracer(max_spans=10, log_path=str(log_path))
+    with tracer.span('render.dataframe', 'render', rows=3):
+        pass
+    lines = log_path.read_text(encoding='utf-8').splitlines()
+    assert json.loads(lines[0])['rows'] == 3
+
+
+def test_chrome_trace_has_complete_events():
+    tracer = Tracer(max_spans=10)
+    with tracer.span('load.info', 'load'):
+        pass
+    events = json.loads(tracer.chrome_trace())['traceEvents']
+    assert [event['ph'] for event in events] == ['M', 'X']
+    assert events[1]['name'] == 'load.info'
+
+
+def test_traced_is_noop_until_installed():
+    calls = []
+
+    @traced('transform.double', 'transform', payload=True)
+    def double(values):
+        calls.append(values)
+        return values * 2
+
+    assert double(2) == 4
+    tracer = tracing.install(Tracer(max_spans=10))
+    assert double(3) == 6
+    assert tracer.spans[0]['name'] == 'transform.double'
+    assert tracer.spans[0]['bytes'] == estimate_size(6)
+    assert calls == [2, 3]
+
+
+def test_estimate_size_counts_nested_frames():
+    frame = pd.DataFrame({'Close': np.arange(100, dtype=float)})
+    assert estimate_size(frame) >= 800
+    assert estimate_size({'prices': frame}) > estimate_size(frame)
+    assert estimate_size(np.zeros(10)) == 80